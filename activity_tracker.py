@@ -0,0 +1,144 @@
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from utils.metrics import metrics
+from utils.dwell_tracker import Dwell, DwellTracker
+
+# System apps that should never be blocked or charged
+PROTECTED_APPS = {
+    'taskmgr.exe',  # Task Manager
+    'explorer.exe',  # Windows Explorer
+    'python.exe',    # Python interpreter
+    'pythonw.exe',   # Python windowless
+    'cmd.exe',       # Command Prompt
+    'powershell.exe', # PowerShell
+    'systemsettings.exe', # Windows Settings
+    'ms-settings:',  # Windows Settings
+    'control.exe',   # Control Panel
+}
+
+
+class ActivityTracker:
+    """Turns foreground window changes into point sessions and blocks unaffordable entertainment.
+
+    Holds no GUI state, so the Tk app and the headless daemon share the same
+    accounting. Windows are categorized by the app lists and the title
+    rules. Each foreground change closes the previous window's dwell,
+    which is charged for exactly the seconds it had focus; PointSystem
+    carries partial minutes forward. Hosts that want to tell the user about
+    a block pass an on_blocked callback, which receives the app name, the
+    per-minute cost and the current balance. While suspended, because the
+    user is away, no time is accounted and nothing is blocked.
+    """
+
+    def __init__(self, point_system, app_categorizer, app_controller,
+                 on_blocked: Optional[Callable[[str, int, int], None]] = None,
+                 clock: Callable[[], datetime] = datetime.now,
+                 monotonic: Callable[[], float] = time.monotonic):
+        self.point_system = point_system
+        self.app_categorizer = app_categorizer
+        self.app_controller = app_controller
+        self.on_blocked = on_blocked
+        self.clock = clock
+        self.dwell = DwellTracker(monotonic, clock)
+        self.protected_apps = set(PROTECTED_APPS)
+        self.last_window = None
+        self.current_app = None
+        self.current_category = None
+        self.suspended = False
+
+    def handle_window_change(self, window_info: Optional[dict], at: Optional[float] = None) -> bool:
+        """Account for the window that had focus and start timing the new foreground window.
+
+        at is the monotonic time the change was seen, when it was seen on
+        another thread. Returns False if the window is not tracked or was blocked.
+        """
+        metrics.inc("tracker.window_changes")
+        at = self.dwell.clock() if at is None else at
+        self._record(self.dwell.stop(at))
+        self.last_window = self.current_app = self.current_category = None
+
+        if not window_info:
+            return False
+
+        process_name = window_info.get('process_name', '').lower()
+        window_title = window_info.get('window_title', '')
+
+        # Skip if it's our own window
+        if process_name == "python" and "GetB@ck2Work" in window_title:
+            return False
+
+        # Skip if it's a protected system app
+        if process_name in self.protected_apps:
+            return False
+
+        # Check if the new window is an entertainment app, by its app list or its title
+        category = self._categorize(window_title, process_name)
+        if category == "entertainment":
+            if not self._can_afford_entertainment(process_name):
+                return False
+
+        self.last_window = window_info
+        if not self.suspended:
+            self.dwell.start(window_info, at)
+        self.current_app = process_name or None
+        self.current_category = category
+        return True
+
+    def suspend(self, since: datetime):
+        """Stop accounting as of since, when the user was last present."""
+        if self.suspended:
+            return
+        self.suspended = True
+        self._record(self.dwell.stop(self.dwell.monotonic_time(since)))
+
+    def resume(self, at: datetime):
+        """Start timing the foreground window again from at."""
+        if not self.suspended:
+            return
+        self.suspended = False
+        if self.last_window:
+            self.dwell.start(self.last_window, self.dwell.monotonic_time(at))
+
+    def _record(self, dwell: Optional[Dwell]):
+        if dwell is None or dwell.seconds <= 0:
+            return
+        process_name = dwell.window['process_name'].lower()
+        category = self._categorize(dwell.window.get('window_title', ''), process_name)
+        if category:
+            self.point_system.record_session(process_name, category, dwell.start, dwell.end)
+
+    def check_entertainment(self):
+        """Block running entertainment apps the user can no longer afford."""
+        if self.suspended:
+            return
+        with metrics.timer("tracker.check_entertainment"):
+            running_apps = self.app_controller.get_running_apps()
+            for app_name, app_info in running_apps.items():
+                if app_name in self.protected_apps:
+                    continue
+                # Background processes have no title; process rules still apply
+                category = self._categorize("", app_name)
+                if category == "entertainment" and app_info['is_blocked'] == False:
+                    self._can_afford_entertainment(app_name)
+            # The foreground window may be entertainment by its title alone
+            if self.current_category == "entertainment" and not self.app_controller.is_app_blocked(self.current_app):
+                self._can_afford_entertainment(self.current_app)
+
+    def _categorize(self, window_title: str, process_name: str) -> Optional[str]:
+        """Categorize a window by the app lists and title rules, or get None if it is not tracked."""
+        return self.app_categorizer.categorize_app(window_title, process_name, default=None)
+
+    def _can_afford_entertainment(self, app_name: str) -> bool:
+        cost = self.point_system.points_config["entertainment_points_per_minute"]
+        current_points = self.point_system.get_points()
+        if current_points >= cost:
+            return True
+
+        # Not enough points, block the app
+        self.app_controller.block_app(app_name)
+        metrics.inc("tracker.blocks")
+        if self.on_blocked:
+            self.on_blocked(app_name, cost, current_points)
+        return False
@@ -1,27 +1,49 @@
 import psutil
-import win32gui
-import win32process
-import win32con
+try:
+    import win32gui
+    import win32process
+    import win32con
+except ImportError:  # Not on Windows; process control only needs psutil
+    win32gui = win32process = win32con = None
 import time
 import threading
 import os
 from typing import Optional, Dict, Any, List
-from gui.overlay import ShameOverlay
+from utils.process_snapshot import ProcessRecord, ProcessSnapshotProvider
+from utils.termination import TerminationWorker, TerminationResult
+from utils.spawn_watcher import SpawnWatcher
+from utils.metrics import metrics
+from utils.adaptive_scheduler import scheduler
+from activity_tracker import PROTECTED_APPS
 
 class AppController:
-    def __init__(self, point_system, root_window):
+    def __init__(self, point_system, root_window=None):
         self.point_system = point_system
         self.root_window = root_window
         self.blocked_apps = set()
         self.app_processes = {}  # Store process IDs for quick lookup
         self.last_check_time = time.time()
         self.check_interval = 1  # Check every second
+        self.safety_scan_interval = 15  # Slowest full scan, or the fastest while the spawn watcher is running
+        self.scan_loop = scheduler.loop("app_controller", self.check_interval, self.safety_scan_interval)
+        self._last_process_names = None
+        self._spawn_pending = False  # A process started since the last full scan
+        # Only kills read through max_age; everything else reads the scan thread's latest snapshot
+        self.process_snapshots = ProcessSnapshotProvider(max_age=1.0)
+        self.terminator = TerminationWorker()
+        # Polling for launches only pays off while there is something to block
+        self.spawn_watcher = SpawnWatcher(self._on_process_spawn, active=lambda: bool(self.blocked_apps))
+        self._scan_relaxed = False  # Scanning on the safety-net range
         self.shame_overlay = None
         self.running = False
         self.monitoring_thread = None
-        self._installed_apps_cache = None
+        self._installed_app_index = None
         self._last_cache_update = 0
-        self._cache_duration = 300  # Cache for 5 minutes
+        self._cache_duration = 300  # Refresh the index at most every 5 minutes
+        metrics.register_collector("app_controller.process_snapshots", lambda: {
+            'captures': self.process_snapshots.captures,
+            'blocked_apps': len(self.blocked_apps)
+        })
 
     def start_monitoring(self):
         """Start monitoring for blocked apps."""
@@ -29,6 +51,11 @@ class AppController:
             return
             
         self.running = True
+        self.terminator.start()
+        
+        self.spawn_watcher.start()
+        self._update_scan_range()
+        
         self.monitoring_thread = threading.Thread(target=self._monitor_loop)
         self.monitoring_thread.daemon = True  # Thread will exit when main program exits
         self.monitoring_thread.start()
@@ -36,8 +63,23 @@ class AppController:
     def stop_monitoring(self):
         """Stop monitoring for blocked apps."""
         self.running = False
+        self.scan_loop.wake()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=1.0)
+        self.spawn_watcher.stop()
+        self._update_scan_range()
+        self.terminator.stop()
+
+    def _update_scan_range(self):
+        """Relax the full scan to a safety net while new processes are caught at launch."""
+        relaxed = self.spawn_watcher.watching
+        if relaxed == self._scan_relaxed:
+            return
+        self._scan_relaxed = relaxed
+        if relaxed:
+            self.scan_loop.set_range(self.safety_scan_interval, self.safety_scan_interval * 4)
+        else:
+            self.scan_loop.set_range(self.check_interval, self.safety_scan_interval)
 
     def unblock_all_apps(self):
         """Unblock all currently blocked apps."""
@@ -48,11 +90,34 @@ class AppController:
         """Main monitoring loop."""
         while self.running:
             try:
-                self.check_and_terminate_blocked_apps()
-                time.sleep(self.check_interval)
+                self.scan_loop.run(self._scan)
             except Exception as e:
                 print(f"Error in monitoring loop: {e}")
-                time.sleep(self.check_interval)  # Prevent tight loop on error
+            
+            # Back off while the process table is not changing, but pick up a
+            # launch that arrived too soon after the last scan to rescan for
+            self.scan_loop.wait(self.check_interval if self._spawn_pending else None)
+
+    def _scan(self) -> bool:
+        with metrics.timer("app_controller.scan", budget=self.scan_loop.min_interval):
+            return self.check_and_terminate_blocked_apps()
+
+    def _on_process_spawn(self, pid: int):
+        """Terminate a newly started process straight away if it is blocked."""
+        # Have the scan thread refresh the shared snapshot so readers see the new process
+        self._spawn_pending = True
+        self.scan_loop.wake()
+        if not self.blocked_apps:
+            return
+        try:
+            process = psutil.Process(pid)
+            app_name = process.name().lower()
+            create_time = process.create_time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return
+        if app_name in self.blocked_apps:
+            self.terminator.submit(app_name, [(pid, create_time)])
+            metrics.inc("app_controller.spawn_kills")
 
     def _monitor_blocked_apps(self):
         """Monitor and block unauthorized apps."""
@@ -92,44 +157,43 @@ class AppController:
 
     def is_app_running(self, app_name: str) -> bool:
         """Check if an app is currently running."""
-        app_name = app_name.lower()
-        for proc in psutil.process_iter(['name', 'pid']):
-            try:
-                if proc.info['name'].lower() == app_name:
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return False
+        return self.process_snapshots.latest().is_running(app_name)
 
     def get_app_pid(self, app_name: str) -> Optional[int]:
         """Get the process ID of a running app."""
-        app_name = app_name.lower()
-        for proc in psutil.process_iter(['name', 'pid']):
-            try:
-                if proc.info['name'].lower() == app_name:
-                    return proc.info['pid']
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return None
+        pids = self.process_snapshots.latest().pids_for(app_name)
+        return pids[0] if pids else None
+
+    def get_app_pids(self, app_name: str) -> List[int]:
+        """Get the process IDs of every running instance of an app."""
+        return list(self.process_snapshots.latest().pids_for(app_name))
+
+    def get_app_tree(self, app_name: str) -> List[ProcessRecord]:
+        """Get the records of every instance of an app plus all of its helper processes."""
+        own_pid = os.getpid()
+        snapshot = self.process_snapshots.get()
+        return [snapshot.get(pid) for pid in snapshot.tree_pids(app_name) if pid != own_pid]
+
+    def get_app_tree_pids(self, app_name: str) -> List[int]:
+        """Get every instance of an app plus all of its helper processes."""
+        return [record.pid for record in self.get_app_tree(app_name)]
 
     def block_app(self, app_name: str) -> bool:
-        """Block an app from running."""
+        """Block an app from running. Raises ValueError for a protected system app."""
         app_name = app_name.lower()
+        if app_name in PROTECTED_APPS:
+            raise ValueError(f"{app_name} is a protected system app and cannot be blocked")
         if app_name in self.blocked_apps:
             return False
 
-        # Get the process ID if the app is running
-        pid = self.get_app_pid(app_name)
-        if pid:
-            try:
-                # Terminate the process
-                process = psutil.Process(pid)
-                process.terminate()
-                process.wait(timeout=3)  # Wait for process to terminate
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
-                pass
+        # Hand any running instances and their helpers to the termination worker
+        tree = self.get_app_tree(app_name)
+        if tree:
+            self.terminator.submit(app_name, [(record.pid, record.create_time) for record in tree])
 
         self.blocked_apps.add(app_name)
+        self.spawn_watcher.wake()
+        self._update_scan_range()
         return True
 
     def unblock_app(self, app_name: str) -> bool:
@@ -137,6 +201,7 @@ class AppController:
         app_name = app_name.lower()
         if app_name in self.blocked_apps:
             self.blocked_apps.remove(app_name)
+            self._update_scan_range()
             return True
         return False
 
@@ -145,48 +210,59 @@ class AppController:
         return app_name.lower() in self.blocked_apps
 
     def terminate_app(self, app_name: str) -> bool:
-        """Terminate a running app."""
-        pid = self.get_app_pid(app_name)
-        if pid:
-            try:
-                process = psutil.Process(pid)
-                process.terminate()
-                process.wait(timeout=3)  # Wait for process to terminate
-                return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
-                return False
+        """Queue a running app and its process tree for termination. Returns True if any pids were queued."""
+        tree = self.get_app_tree(app_name)
+        if tree:
+            return self.terminator.submit(app_name.lower(), [(record.pid, record.create_time) for record in tree])
         return False
 
-    def check_and_terminate_blocked_apps(self) -> None:
-        """Check for and terminate any blocked apps that are running."""
+    def drain_termination_results(self) -> List[TerminationResult]:
+        """Get termination results reported by the worker since the last call."""
+        return self.terminator.drain_results()
+
+    def check_and_terminate_blocked_apps(self) -> bool:
+        """Check for and terminate any blocked apps that are running. Returns True if the set of running apps changed."""
         current_time = time.time()
         if current_time - self.last_check_time < self.check_interval:
-            return
+            return False
 
         self.last_check_time = current_time
-        for app_name in self.blocked_apps:
-            if self.is_app_running(app_name):
+
+        # One walk of the process table serves every blocked app this tick
+        self._spawn_pending = False
+        snapshot = self.process_snapshots.refresh()
+        for app_name in list(self.blocked_apps):
+            if snapshot.is_running(app_name):
                 self.terminate_app(app_name)
 
+        # A launched app usually opens a window soon after
+        names = snapshot.by_name.keys()
+        changed = self._last_process_names is not None and names != self._last_process_names
+        self._last_process_names = set(names)
+        if changed:
+            scheduler.wake("window_monitor")
+        return changed
+
     def get_running_apps(self) -> Dict[str, Any]:
-        """Get information about currently running apps."""
+        """Get information about currently running apps, as of the scan thread's last snapshot."""
         running_apps = {}
-        for proc in psutil.process_iter(['name', 'pid', 'create_time']):
-            try:
-                app_name = proc.info['name'].lower()
-                if app_name not in running_apps:
-                    running_apps[app_name] = {
-                        'pid': proc.info['pid'],
-                        'create_time': proc.info['create_time'],
-                        'is_blocked': app_name in self.blocked_apps
-                    }
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        snapshot = self.process_snapshots.latest()
+        for app_name, pids in snapshot.by_name.items():
+            record = snapshot.by_pid[pids[0]]
+            running_apps[app_name] = {
+                'pid': record.pid,
+                'create_time': record.create_time,
+                'is_blocked': app_name in self.blocked_apps
+            }
         return running_apps
 
     def show_shame_overlay(self, app_name: str):
         """Show the shame overlay for a blocked app."""
+        # Headless controllers have no window to draw on
+        if self.root_window is None:
+            return
         if not self.shame_overlay:
+            from gui.overlay import ShameOverlay
             self.shame_overlay = ShameOverlay(self.root_window)
         self.shame_overlay.show_haiku_challenge(app_name)
 
@@ -207,55 +283,27 @@ class AppController:
             if end_time > current_time
         }
 
+    @property
+    def installed_app_index(self):
+        """Get the installed app index, loading it from disk on first use."""
+        if self._installed_app_index is None:
+            from utils.installed_apps import InstalledAppIndex
+            self._installed_app_index = InstalledAppIndex(os.path.join("data", "installed_apps_index.json"))
+        return self._installed_app_index
+
     def get_installed_apps(self) -> List[str]:
-        """Get a list of installed applications."""
+        """Get a list of installed applications without waiting on a disk scan."""
         current_time = time.time()
         
-        # Return cached list if it's still valid
-        if (self._installed_apps_cache is not None and 
-            current_time - self._last_cache_update < self._cache_duration):
-            return self._installed_apps_cache
-        
-        installed_apps = set()
-        
-        # Get apps from Program Files
-        program_files_paths = [
-            os.environ.get('ProgramFiles', 'C:\\Program Files'),
-            os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')
-        ]
+        # Refresh the on-disk index in the background once it is stale
+        if current_time - self._last_cache_update >= self._cache_duration:
+            if self.installed_app_index.start_refresh():
+                self._last_cache_update = current_time
         
-        for program_files in program_files_paths:
-            if os.path.exists(program_files):
-                for root, dirs, files in os.walk(program_files):
-                    for file in files:
-                        if file.endswith('.exe'):
-                            app_name = os.path.splitext(file)[0].lower()
-                            installed_apps.add(app_name)
-        
-        # Get apps from Windows Start Menu
-        start_menu_paths = [
-            os.path.join(os.environ.get('APPDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'),
-            os.path.join(os.environ.get('ProgramData', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs')
-        ]
-        
-        for start_menu in start_menu_paths:
-            if os.path.exists(start_menu):
-                for root, dirs, files in os.walk(start_menu):
-                    for file in files:
-                        if file.endswith('.lnk'):
-                            app_name = os.path.splitext(file)[0].lower()
-                            installed_apps.add(app_name)
+        installed_apps = self.installed_app_index.apps()
         
         # Get currently running apps
-        for proc in psutil.process_iter(['name']):
-            try:
-                app_name = os.path.splitext(proc.info['name'])[0].lower()
-                installed_apps.add(app_name)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        
-        # Convert to sorted list
-        self._installed_apps_cache = sorted(list(installed_apps))
-        self._last_cache_update = current_time
+        for process_name in self.process_snapshots.latest().names():
+            installed_apps.add(os.path.splitext(process_name)[0])
         
-        return self._installed_apps_cache 
\ No newline at end of file
+        return sorted(installed_apps)
@@ -0,0 +1,75 @@
+"""Compare per-name process-table scans against one indexed snapshot per tick.
+
+Run from the repository root:
+    python -m benchmarks.bench_process_snapshot
+"""
+import timeit
+
+from benchmarks.generators import make_process_table
+from utils.process_snapshot import ProcessRecord, ProcessSnapshot
+
+PROCESS_COUNT = 5000
+BLOCKED_COUNT = 20
+REPEAT = 20
+
+
+class FakeProcessTable:
+    """Stands in for psutil.process_iter and counts full walks."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.walks = 0
+
+    def process_iter(self):
+        self.walks += 1
+        for row in self.rows:
+            yield dict(row)
+
+    def records(self):
+        for info in self.process_iter():
+            yield ProcessRecord(info['pid'], info['name'].lower(), info['ppid'], info['create_time'])
+
+
+def legacy_tick(table, blocked):
+    """One tick of the old code: is_app_running then get_app_pid per blocked name, plus get_running_apps."""
+    found = []
+    for app_name in blocked:
+        running = any(info['name'].lower() == app_name for info in table.process_iter())
+        if running:
+            found.append(next(info['pid'] for info in table.process_iter() if info['name'].lower() == app_name))
+    running_apps = {}
+    for info in table.process_iter():
+        running_apps.setdefault(info['name'].lower(), info['pid'])
+    return found, running_apps
+
+
+def snapshot_tick(table, blocked):
+    """One tick with a single shared snapshot."""
+    snapshot = ProcessSnapshot(table.records())
+    found = [snapshot.pids_for(app_name)[0] for app_name in blocked if snapshot.is_running(app_name)]
+    running_apps = {name: pids[0] for name, pids in snapshot.by_name.items()}
+    return found, running_apps
+
+
+def main():
+    table = FakeProcessTable(make_process_table(PROCESS_COUNT))
+    # Most blocked apps are not running, which is the expensive case for a scan
+    blocked = [f"game{i}.exe" for i in range(BLOCKED_COUNT - 2)] + ["chrome.exe", "app7.exe"]
+    assert legacy_tick(table, blocked) == snapshot_tick(table, blocked)
+
+    table.walks = 0
+    legacy_tick(table, blocked)
+    legacy_walks = table.walks
+    table.walks = 0
+    snapshot_tick(table, blocked)
+    snapshot_walks = table.walks
+
+    legacy = min(timeit.repeat(lambda: legacy_tick(table, blocked), number=1, repeat=REPEAT))
+    indexed = min(timeit.repeat(lambda: snapshot_tick(table, blocked), number=1, repeat=REPEAT))
+    print(f"{PROCESS_COUNT} processes, {BLOCKED_COUNT} blocked names")
+    print(f"  per-name scans : {legacy * 1000:8.2f} ms/tick, {legacy_walks} table walks")
+    print(f"  shared snapshot: {indexed * 1000:8.2f} ms/tick, {snapshot_walks} table walk ({legacy / indexed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Fake win32, process and termination sources so benchmarks run anywhere."""
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import window_monitor
+from utils.process_cache import ProcessInfoCache
+from utils.process_snapshot import ProcessRecord
+from utils.termination import Target
+from utils.window_snapshot import WindowInfo
+
+
+class FakeDesktop:
+    """Stands in for the win32gui, win32process and win32con calls WindowMonitor makes."""
+
+    GWL_EXSTYLE = -20
+    WS_EX_TOOLWINDOW = 0x00000080
+
+    def __init__(self, windows: Dict[int, WindowInfo]):
+        self.windows = windows
+        self.foreground = next(iter(windows), 0)
+        self.enumerations = 0
+
+    def EnumWindows(self, callback, extra):
+        self.enumerations += 1
+        for hwnd in list(self.windows):
+            if not callback(hwnd, extra):
+                break
+
+    def IsWindowVisible(self, hwnd: int) -> bool:
+        return hwnd in self.windows
+
+    def GetWindowLong(self, hwnd: int, index: int) -> int:
+        return 0
+
+    def GetWindowText(self, hwnd: int) -> str:
+        info = self.windows.get(hwnd)
+        return info.title if info else ""
+
+    def GetForegroundWindow(self) -> int:
+        return self.foreground
+
+    def GetWindowThreadProcessId(self, hwnd: int):
+        return (1, self.windows[hwnd].process_id)
+
+    def process_executable(self, pid: int) -> str:
+        for info in self.windows.values():
+            if info.process_id == pid:
+                return info.exe
+        return f"C:\\Apps\\unknown{pid}.exe"
+
+    def process_create_time(self, pid: int) -> Optional[float]:
+        return 1_700_000_000.0 + pid
+
+
+def make_window_monitor(desktop: FakeDesktop) -> window_monitor.WindowMonitor:
+    """Build a WindowMonitor that enumerates and resolves processes through a fake desktop."""
+    window_monitor.win32gui = desktop
+    window_monitor.win32process = desktop
+    window_monitor.win32con = desktop
+    monitor = window_monitor.WindowMonitor(None)
+    monitor.process_cache = ProcessInfoCache(desktop.process_executable, desktop.process_create_time)
+    return monitor
+
+
+class FakeProcessSource:
+    """Stands in for psutil.process_iter and counts full walks."""
+
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+        self.walks = 0
+
+    def __call__(self) -> Iterator[ProcessRecord]:
+        self.walks += 1
+        for row in self.rows:
+            yield ProcessRecord(row['pid'], row['name'].lower(), row['ppid'], row['create_time'])
+
+
+class FakeTerminator:
+    """Records termination requests instead of signalling real processes."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def submit(self, app_name: str, targets: List[Target]) -> bool:
+        self.submitted += len(targets)
+        return True
+
+    def is_pending(self, pid: int) -> bool:
+        return False
+
+    def drain_results(self) -> list:
+        return []
+
+
+class FakeAppController:
+    """Accepts blocks without touching processes, for accounting benchmarks."""
+
+    def __init__(self):
+        self.blocked_apps = set()
+
+    def block_app(self, app_name: str) -> bool:
+        self.blocked_apps.add(app_name.lower())
+        return True
+
+    def is_app_blocked(self, app_name: str) -> bool:
+        return app_name.lower() in self.blocked_apps
+
+    def get_running_apps(self) -> dict:
+        return {}
+
+
+@contextmanager
+def temporary_data_dir():
+    """Run with a fresh working directory so PointSystem and AppCategorizer use throwaway data files."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.makedirs(os.path.join(workdir, "data"))
+        os.chdir(workdir)
+        try:
+            yield workdir
+        finally:
+            os.chdir(previous)
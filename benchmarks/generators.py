@@ -0,0 +1,98 @@
+"""Seeded synthetic data for the benchmarks: windows, process tables, title streams and rule sets."""
+import random
+from typing import Dict, List, Tuple
+
+from utils.rule_engine import Rule, KEYWORD, GLOB, REGEX, TITLE, PROCESS
+from utils.window_snapshot import WindowInfo
+
+PRODUCTIVE_APPS = ["code.exe", "devenv.exe", "excel.exe", "winword.exe", "outlook.exe", "slack.exe"]
+ENTERTAINMENT_APPS = ["steam.exe", "spotify.exe", "vlc.exe", "discord.exe", "epicgameslauncher.exe"]
+OTHER_APPS = ["chrome.exe", "firefox.exe", "msedge.exe", "notepad.exe", "explorer.exe"]
+WORDS = [
+    "report", "draft", "budget", "meeting", "inbox", "review", "pull", "request", "invoice",
+    "video", "music", "trailer", "stream", "episode", "match", "game", "news", "forum",
+    "project", "main", "notes", "design", "roadmap", "playlist", "season", "chat"
+]
+
+
+def make_process_table(count: int = 5000, seed: int = 1) -> List[dict]:
+    """Build a synthetic process table with a realistic spread of names."""
+    rng = random.Random(seed)
+    names = [f"App{i}.exe" for i in range(300)] + ["chrome.exe"] * 40 + ["svchost.exe"] * 80
+    return [
+        {'pid': pid, 'name': rng.choice(names), 'ppid': rng.randint(1, count),
+         'create_time': 1_700_000_000.0 + pid}
+        for pid in range(4, 4 + count)
+    ]
+
+
+def make_title(rng: random.Random, app_name: str) -> str:
+    """Build a window title in the usual "document - site - App" shape."""
+    words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6)))
+    return f"{words} - {app_name[:-4].title()}"
+
+
+def make_windows(count: int = 200, seed: int = 1) -> Dict[int, WindowInfo]:
+    """Build a desktop of windows keyed by hwnd."""
+    rng = random.Random(seed)
+    apps = PRODUCTIVE_APPS + ENTERTAINMENT_APPS + OTHER_APPS
+    windows = {}
+    for i in range(count):
+        hwnd = 0x10000 + i * 4
+        name = rng.choice(apps)
+        pid = 1000 + apps.index(name) * 10 + rng.randint(0, 3)
+        windows[hwnd] = WindowInfo(hwnd, make_title(rng, name), pid, f"C:\\Apps\\{name}", name)
+    return windows
+
+
+def mutate_windows(windows: Dict[int, WindowInfo], rng: random.Random, churn: float = 0.02) -> Dict[int, WindowInfo]:
+    """Get the next poll of a desktop: a few windows retitle, close or open."""
+    result = dict(windows)
+    changes = max(1, int(len(windows) * churn))
+    hwnds = list(result)
+    for _ in range(changes):
+        roll = rng.random()
+        if roll < 0.6 and hwnds:
+            hwnd = rng.choice(hwnds)
+            info = result[hwnd]
+            result[hwnd] = info._replace(title=make_title(rng, info.name))
+        elif roll < 0.8 and hwnds:
+            hwnd = hwnds.pop(rng.randrange(len(hwnds)))
+            result.pop(hwnd, None)
+        else:
+            hwnd = max(result, default=0x10000) + 4
+            name = rng.choice(PRODUCTIVE_APPS + ENTERTAINMENT_APPS)
+            result[hwnd] = WindowInfo(hwnd, make_title(rng, name), 5000 + hwnd % 97, f"C:\\Apps\\{name}", name)
+            hwnds.append(hwnd)
+    return result
+
+
+def make_title_stream(count: int = 10_000, distinct: int = 500, seed: int = 1) -> List[Tuple[str, str]]:
+    """Build a stream of (title, process) pairs where a few hundred windows recur, as on a real desktop."""
+    rng = random.Random(seed)
+    apps = PRODUCTIVE_APPS + ENTERTAINMENT_APPS + OTHER_APPS
+    pool = []
+    for _ in range(distinct):
+        name = rng.choice(apps)
+        pool.append((make_title(rng, name), name))
+    # Skewed towards the first windows, like a user switching between a handful of apps
+    return [pool[min(int(rng.expovariate(1 / (distinct / 10))), distinct - 1)] for _ in range(count)]
+
+
+def make_rule_set(count: int = 1000, seed: int = 1) -> List[Rule]:
+    """Build a mix of keyword, glob and regex rules over titles and process names."""
+    rng = random.Random(seed)
+    rules = []
+    for i in range(count):
+        category = rng.choice(("productive", "entertainment"))
+        roll = rng.random()
+        if roll < 0.7:
+            rules.append(Rule(category, KEYWORD, f"{rng.choice(WORDS)}{i}", TITLE, 1.0))
+        elif roll < 0.85:
+            rules.append(Rule(category, GLOB, f"app{i}*.exe", PROCESS, 2.0))
+        else:
+            rules.append(Rule(category, REGEX, rf"\b{rng.choice(WORDS)}{i}\d*\b", TITLE, 1.5))
+    # A few rules that real titles actually hit
+    rules += [Rule("entertainment", KEYWORD, word) for word in ("video", "game", "episode", "playlist")]
+    rules += [Rule("productive", KEYWORD, word) for word in ("report", "budget", "pull request", "roadmap")]
+    return rules
@@ -0,0 +1,322 @@
+"""Benchmark the tracking pipeline on synthetic data and compare against a saved baseline.
+
+Runs on any platform: win32 and psutil are replaced by the fakes in
+benchmarks/fakes.py. Run from the repository root:
+    python -m benchmarks.suite                     # run and compare with benchmarks/baseline.json
+    python -m benchmarks.suite --save              # run and record a new baseline
+    python -m benchmarks.suite --quick             # smaller inputs for a smoke test
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from benchmarks.fakes import (
+    FakeDesktop, FakeProcessSource, FakeTerminator, FakeAppController, make_window_monitor, temporary_data_dir
+)
+from benchmarks.generators import (
+    make_windows, mutate_windows, make_process_table, make_title_stream, make_rule_set
+)
+from utils.process_snapshot import ProcessSnapshotProvider
+from utils.virtual_clock import VirtualClock
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+REGRESSION_TOLERANCE = 0.25  # Flag timings more than 25% slower than the baseline
+REPEAT = 5
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _best_of(run: Callable[[], float], repeat: int = REPEAT) -> float:
+    """Run a timed pass several times and keep the fastest, which is the least noisy."""
+    return min(run() for _ in range(repeat))
+
+
+def bench_window_diff(scale: float) -> Dict[str, float]:
+    """Enumerate a fake desktop and diff it against the previous poll."""
+    rng = random.Random(1)
+    polls = [make_windows(int(300 * scale) or 1)]
+    for _ in range(int(200 * scale) or 1):
+        polls.append(mutate_windows(polls[-1], rng))
+    desktop = FakeDesktop(polls[0])
+    monitor = make_window_monitor(desktop)
+    deltas = 0
+
+    def run() -> float:
+        nonlocal deltas
+        monitor.differ.reset()
+        deltas = 0
+        started = time.perf_counter()
+        for windows in polls:
+            desktop.windows = windows
+            snapshot = monitor.get_window_snapshot()
+            deltas += len(monitor.differ.diff(snapshot, desktop.GetForegroundWindow()))
+        return (time.perf_counter() - started) / len(polls)
+
+    return {
+        'windows': len(polls[0]),
+        'poll_us': round(_best_of(run) * 1e6, 1),
+        'deltas_per_poll': round(deltas / len(polls), 2)
+    }
+
+
+def bench_focus_tick(scale: float) -> Dict[str, float]:
+    """Poll the foreground window on a fake desktop, with focus staying put and with it moving."""
+    windows = make_windows(int(3000 * scale) or 1)
+    desktop = FakeDesktop(windows)
+    monitor = make_window_monitor(desktop)
+    changes = []
+    monitor.on_focus = changes.append
+    hwnds = list(windows)
+    ticks = int(20000 * scale) or 1
+
+    def steady() -> float:
+        monitor.poll_focus()
+        started = time.perf_counter()
+        for _ in range(ticks):
+            monitor.poll_focus()
+        return (time.perf_counter() - started) / ticks
+
+    def switching() -> float:
+        started = time.perf_counter()
+        for i in range(ticks):
+            desktop.foreground = hwnds[i % len(hwnds)] if i % 2 else hwnds[0]
+            monitor.poll_focus()
+        return (time.perf_counter() - started) / ticks
+
+    desktop.enumerations = 0
+    steady_tick = _best_of(steady)
+    switch_tick = _best_of(switching)
+    return {
+        'windows': len(windows),
+        'steady_us': round(steady_tick * 1e6, 3),
+        'switch_us': round(switch_tick * 1e6, 2),
+        'enumerations': desktop.enumerations
+    }
+
+
+def bench_categorize(scale: float) -> Dict[str, float]:
+    """Categorize a title stream against a large rule set, with and without the memo."""
+    from utils.app_categorizer import AppCategorizer
+
+    stream = make_title_stream(int(20_000 * scale) or 1)
+    with temporary_data_dir():
+        categorizer = AppCategorizer()
+        rules = make_rule_set(1000)
+        categorizer.set_rules(rules, save=False)
+
+        def run(memo_size: int) -> Callable[[], float]:
+            def timed() -> float:
+                categorizer.memo_size = memo_size
+                categorizer._rules_changed()  # Start each pass with an empty memo
+                started = time.perf_counter()
+                for title, process_name in stream:
+                    categorizer.categorize_app(title, process_name)
+                return (time.perf_counter() - started) / len(stream)
+            return timed
+
+        uncached = _best_of(run(0))
+        memoized = _best_of(run(4096))
+        stats = categorizer.memo_stats()
+
+    return {
+        'rules': len(rules),
+        'uncached_us': round(uncached * 1e6, 2),
+        'memoized_us': round(memoized * 1e6, 2),
+        'memo_hit_rate': round(stats['hits'] / max(1, stats['hits'] + stats['misses']), 3)
+    }
+
+
+def bench_controller_scan(scale: float) -> Dict[str, float]:
+    """Run AppController's blocked-app check against a fake process table."""
+    from app_controller import AppController
+
+    source = FakeProcessSource(make_process_table(int(5000 * scale) or 1))
+    controller = AppController(None)
+    controller.process_snapshots = ProcessSnapshotProvider(source=source, max_age=controller.check_interval)
+    controller.terminator = FakeTerminator()
+    # Mostly absent apps, which is the expensive case for a scan
+    controller.blocked_apps = {f"game{i}.exe" for i in range(18)} | {"chrome.exe", "app7.exe"}
+    ticks = int(50 * scale) or 1
+
+    def run() -> float:
+        started = time.perf_counter()
+        for _ in range(ticks):
+            controller.last_check_time = 0
+            controller.check_and_terminate_blocked_apps()
+        return (time.perf_counter() - started) / ticks
+
+    source.walks = 0
+    tick = _best_of(run)
+    return {
+        'processes': len(source.rows),
+        'tick_ms': round(tick * 1000, 3),
+        'walks_per_tick': round(source.walks / (ticks * REPEAT), 2)
+    }
+
+
+def bench_persistence(scale: float) -> Dict[str, float]:
+    """Measure ledger appends, session recording, checkpoints and cold loads of PointSystem."""
+    from point_system import PointSystem
+
+    updates = int(2000 * scale) or 1
+    sessions = int(300 * scale) or 1
+    with temporary_data_dir():
+        point_system = PointSystem()
+        update_samples = []
+        for _ in range(updates):
+            started = time.perf_counter()
+            point_system.update_points("productive", 1)
+            update_samples.append(time.perf_counter() - started)
+
+        session_samples = []
+        start = datetime(2026, 1, 5, 9, 0)
+        for i in range(sessions):
+            end = start + timedelta(minutes=5)
+            started = time.perf_counter()
+            point_system.record_session("code.exe", "productive", start, end)
+            session_samples.append(time.perf_counter() - started)
+            start = end
+
+        # Checkpoint, then cold-load with the longest ledger tail a compaction allows
+        started = time.perf_counter()
+        point_system.save_data()
+        checkpoint = time.perf_counter() - started
+        for _ in range(point_system.ledger.compact_every - 1):
+            point_system.update_points("productive", 1)
+        point_system.ledger.flush()
+
+        started = time.perf_counter()
+        reloaded = PointSystem()
+        load = time.perf_counter() - started
+        assert reloaded.get_points() == point_system.get_points()
+        reloaded.close()
+        point_system.close()
+
+    return {
+        'update_p50_us': round(_percentile(update_samples, 0.5) * 1e6, 1),
+        'update_p99_us': round(_percentile(update_samples, 0.99) * 1e6, 1),
+        'session_p50_us': round(_percentile(session_samples, 0.5) * 1e6, 1),
+        'session_p99_us': round(_percentile(session_samples, 0.99) * 1e6, 1),
+        'checkpoint_ms': round(checkpoint * 1000, 2),
+        'load_ms': round(load * 1000, 2)
+    }
+
+
+def bench_accounting(scale: float) -> Dict[str, float]:
+    """Feed a title stream through ActivityTracker with real categorization and points, and no Tk."""
+    from activity_tracker import ActivityTracker
+    from point_system import PointSystem
+    from utils.app_categorizer import AppCategorizer
+
+    stream = make_title_stream(int(5000 * scale) or 1)
+    with temporary_data_dir():
+        point_system = PointSystem()
+        point_system.current_points = 10 ** 6  # Never block, so every change is accounted
+        categorizer = AppCategorizer()
+        categorizer.update_categories(["code.exe", "excel.exe", "winword.exe"], ["steam.exe", "vlc.exe"])
+        clock = VirtualClock(datetime(2026, 1, 5, 9, 0).timestamp())
+        tracker = ActivityTracker(
+            point_system, categorizer, FakeAppController(), clock=clock.now, monotonic=clock.monotonic
+        )
+
+        started = time.perf_counter()
+        for title, process_name in stream:
+            clock.advance(90)
+            tracker.handle_window_change({'process_name': process_name, 'window_title': title})
+        elapsed = time.perf_counter() - started
+        point_system.close()
+
+    return {
+        'changes': len(stream),
+        'change_us': round(elapsed / len(stream) * 1e6, 1),
+        'points': point_system.get_points() - 10 ** 6
+    }
+
+
+BENCHMARKS = {
+    'window_diff': bench_window_diff,
+    'focus_tick': bench_focus_tick,
+    'categorize': bench_categorize,
+    'controller_scan': bench_controller_scan,
+    'persistence': bench_persistence,
+    'accounting': bench_accounting,
+}
+
+
+def run_suite(names: List[str], scale: float) -> Dict[str, Dict[str, float]]:
+    """Run the named benchmarks and collect their metrics."""
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = BENCHMARKS[name](scale)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float = REGRESSION_TOLERANCE) -> List[str]:
+    """Print each timing next to its baseline and return the ones that regressed."""
+    regressions = []
+    for name, metrics in results.items():
+        print(name)
+        for metric, value in metrics.items():
+            previous = baseline.get(name, {}).get(metric)
+            line = f"  {metric:<18} {value:>12}"
+            # Only timings have a direction; counts are shown for context and
+            # tail latencies swing with disk flushes, so neither gates a run
+            if previous and metric.endswith(("_us", "_ms")) and "_p99" not in metric:
+                change = (value - previous) / previous
+                line += f"  baseline {previous:>10}  {change:+.0%}"
+                if change > tolerance:
+                    line += "  REGRESSION"
+                    regressions.append(f"{name}.{metric}")
+            print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GetB@ck2Work benchmark suite")
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--quick", action="store_true", help="Use smaller inputs")
+    options = parser.parse_args(argv)
+    unknown = set(options.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    scale = 0.1 if options.quick else 1.0
+    results = run_suite(options.benchmarks or list(BENCHMARKS), scale)
+
+    baseline = {}
+    if os.path.exists(options.baseline) and not options.quick:
+        with open(options.baseline, 'r') as f:
+            baseline = json.load(f).get('results', {})
+    regressions = compare(results, baseline)
+
+    if options.save:
+        with open(options.baseline, 'w') as f:
+            json.dump({
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results
+            }, f, indent=2)
+            f.write("\n")
+        print(f"Saved baseline to {options.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
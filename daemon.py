@@ -0,0 +1,334 @@
+"""Headless GetB@ck2Work tracker.
+
+Runs window monitoring, point accounting and app blocking without loading
+Tk, and serves state and commands over a local socket. Run it with no
+arguments to start the daemon, or pass a command to talk to a running one:
+
+    python daemon.py
+    python daemon.py status
+    python daemon.py block steam.exe
+
+Pass --record-trace FILE to record focus, process, balance and idle events for
+replay.py.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+from datetime import datetime, timedelta
+from queue import Empty
+from typing import Dict, Optional
+
+from window_monitor import WindowMonitor
+from point_system import PointSystem
+from utils.app_categorizer import AppCategorizer
+from app_controller import AppController
+from activity_tracker import ActivityTracker
+from utils.file_watcher import FileWatcher
+from utils.event_bus import EventBus
+from utils.metrics import metrics
+from utils.adaptive_scheduler import scheduler
+from utils.idle_source import IdleMonitor, default_idle_source
+from utils.ipc import IpcServer, IpcClient, IpcError, Address, default_address
+from utils.trace import TraceWriter, PROCESS_STARTED, PROCESS_EXITED, IDLE, ACTIVE
+from utils.window_snapshot import FocusChange, WindowInfo, CLOSED
+
+
+class TrackerDaemon:
+    """Monitoring, accounting and blocking behind a local IPC API.
+
+    Everything runs on one thread: each pass of the main loop serves IPC
+    requests, drains window changes from the monitor, and blocks
+    entertainment the user can no longer afford. IPC handlers therefore see
+    consistent state without locks. Both the draining and the check back
+    off while nothing changes, and the socket wait in between lasts until
+    whichever is due next. While the user is away, scanning, the check and
+    accounting stop until they return.
+    """
+
+    def __init__(self, address: Optional[Address] = None):
+        os.makedirs("data", exist_ok=True)
+        # Keeps draining while suspended, since that is how the return from idle arrives
+        self.events_loop = scheduler.loop("daemon.events", 0.1, 1.0, suspendable=False)
+        self.check_loop = scheduler.loop("daemon.check", 1.0, 8.0)
+        self._checked_points = None
+        self.running = False
+
+        self.point_system = PointSystem()
+        self.app_categorizer = AppCategorizer()
+        self.app_controller = AppController(self.point_system)
+        self.activity_tracker = ActivityTracker(
+            self.point_system, self.app_categorizer, self.app_controller, on_blocked=self._log_blocked
+        )
+
+        # Monitor threads post here and the main loop drains
+        self.event_bus = EventBus()
+        self.event_bus.subscribe("focus_change", self.on_focus_change)
+        self.event_bus.subscribe("user_idle", self.on_user_idle)
+        self.event_bus.subscribe("user_active", self.on_user_active)
+        metrics.register_collector("event_bus", self.event_bus.stats)
+        self.window_monitor = WindowMonitor(None, on_focus=self._post_focus_change)
+        self.windows: Dict[int, WindowInfo] = {}
+        self.windows_version = 0
+        self.trace = None
+        self._traced_processes: Dict[int, str] = {}
+
+        self.idle_monitor = IdleMonitor(
+            default_idle_source(),
+            threshold=self.point_system.idle_config["threshold_seconds"],
+            on_idle=self._post_user_idle,
+            on_active=self._post_user_active
+        )
+
+        self.config_watcher = FileWatcher()
+        self.config_watcher.watch(self.app_categorizer.categories_file, self.app_categorizer.reload_categories)
+        self.config_watcher.watch(self.point_system.config_file, self._reload_point_config)
+
+        self.server = IpcServer(address or default_address(), {
+            'status': self.status,
+            'windows': self.list_windows,
+            'block': self.app_controller.block_app,
+            'unblock': self.app_controller.unblock_app,
+            'categorize': self.categorize,
+            'stats': self.stats,
+            'reload': self.reload,
+            'metrics': metrics.snapshot,
+            'shutdown': self.shutdown,
+        })
+
+    def _post_focus_change(self, change: FocusChange):
+        """Forward a foreground change from the monitor thread to the main loop."""
+        # Not coalesced: every switch ends a dwell that has to be charged
+        self.event_bus.post("focus_change", change)
+
+    def on_focus_change(self, change: FocusChange):
+        """Account for the window that had focus on the main loop."""
+        window = change.window
+        if self.trace:
+            self.trace.record_focus(window, time.time() - (time.monotonic() - change.at))
+        self.activity_tracker.handle_window_change({
+            'process_name': window.name,
+            'window_title': window.title,
+            'executable_path': window.exe
+        } if window else None, change.at)
+
+    def _post_user_idle(self, since: datetime):
+        """Park the monitor loops at once and hand the accounting to the main loop."""
+        scheduler.suspend()
+        self.event_bus.post("user_idle", since)
+
+    def _post_user_active(self, at: datetime):
+        scheduler.resume()
+        self.event_bus.post("user_active", at)
+
+    def on_user_idle(self, since: datetime):
+        """Stop accounting from the user's last input."""
+        self.activity_tracker.suspend(since)
+        if self.trace:
+            self.trace.record_idle(IDLE, since.timestamp(), time.time())
+
+    def on_user_active(self, at: datetime):
+        """Resume accounting when input returns."""
+        self.activity_tracker.resume(at)
+        if self.trace:
+            self.trace.record_idle(ACTIVE, at.timestamp(), time.time())
+
+    def start_trace(self, path: str):
+        """Record window, process and balance events to a trace file."""
+        self.trace = TraceWriter(path, time.time())
+        self.trace.record_points(self.point_system.get_points(), time.time())
+        self.point_system.add_listener(
+            lambda: self.trace and self.trace.record_points(self.point_system.get_points(), time.time())
+        )
+
+    def _trace_processes(self):
+        """Record processes that started or exited since the last check."""
+        snapshot = self.app_controller.process_snapshots.latest()
+        current = {pid: record.name for pid, record in snapshot.by_pid.items()}
+        now = time.time()
+        for pid, name in self._traced_processes.items():
+            if current.get(pid) != name:
+                self.trace.record_process(PROCESS_EXITED, pid, name, now)
+        for pid, name in current.items():
+            if self._traced_processes.get(pid) != name:
+                self.trace.record_process(PROCESS_STARTED, pid, name, now)
+        self._traced_processes = current
+        self.trace.flush()
+
+    def _drain_window_queue(self):
+        """Keep the window table that clients list in step with the monitor."""
+        while True:
+            try:
+                delta = self.window_monitor.window_queue.get_nowait()
+            except Empty:
+                return
+            if delta.kind == CLOSED:
+                self.windows.pop(delta.window.hwnd, None)
+            else:
+                self.windows[delta.window.hwnd] = delta.window
+            self.windows_version += 1
+
+    def _log_blocked(self, app_name: str, cost: int, current_points: int):
+        print(f"Blocked {app_name}: needs {cost} points, has {current_points}")
+
+    def status(self) -> dict:
+        """Get the balance, current activity and blocked apps."""
+        return {
+            'points': self.point_system.get_points(),
+            'streak': self.point_system.get_streak(),
+            'app': self.activity_tracker.current_app,
+            'category': self.activity_tracker.current_category,
+            'blocked': sorted(self.app_controller.blocked_apps),
+            'windows': self.windows_version,
+            'idle': self.idle_monitor.idle
+        }
+
+    def list_windows(self) -> dict:
+        """Get open windows as compact [hwnd, title, pid, name] rows."""
+        return {
+            'version': self.windows_version,
+            'windows': [[info.hwnd, info.title, info.process_id, info.name] for info in self.windows.values()]
+        }
+
+    def categorize(self, process_name: str, window_title: str = "") -> str:
+        """Categorize a window with the current rules."""
+        return self.app_categorizer.categorize_app(window_title, process_name)
+
+    def stats(self, days: int = 7) -> dict:
+        """Get per-day stats and totals for the last few days."""
+        end_day = datetime.now().date()
+        start_day = (end_day - timedelta(days=days - 1)).isoformat()
+        end_day = end_day.isoformat()
+        store = self.point_system.activity_store
+        return {
+            'days': store.daily_stats(start_day, end_day),
+            'totals': store.totals(start_day, end_day)
+        }
+
+    def reload(self) -> dict:
+        """Reload categories and point rates from disk."""
+        return {
+            'categories': self.app_categorizer.reload_categories(),
+            'config': self._reload_point_config()
+        }
+
+    def _reload_point_config(self) -> bool:
+        if not self.point_system.reload_config():
+            return False
+        self.idle_monitor.threshold = self.point_system.idle_config["threshold_seconds"]
+        return True
+
+    def shutdown(self) -> bool:
+        """Stop the daemon after replying."""
+        self.running = False
+        return True
+
+    def _drain_events(self) -> bool:
+        version = self.windows_version
+        self._drain_window_queue()
+        handled = self.event_bus.drain()
+        if handled:
+            # A window came to the front, so check the balance soon
+            self.check_loop.wake()
+        return handled > 0 or version != self.windows_version
+
+    def _check(self) -> bool:
+        with metrics.timer("daemon.check", budget=self.check_loop.min_interval):
+            if self.trace:
+                self._trace_processes()
+            points = self.point_system.get_points()
+            self.activity_tracker.check_entertainment()
+            self._report_terminations()
+        changed = self._checked_points is not None and points != self._checked_points
+        self._checked_points = points
+        return changed
+
+    def _report_terminations(self):
+        for result in self.app_controller.drain_termination_results():
+            if result.failed:
+                print(f"Could not terminate {result.app_name}: pids {result.failed}")
+
+    def run(self):
+        """Serve until shutdown is requested or a termination signal arrives."""
+        self.server.start()
+        self.window_monitor.start_monitoring()
+        self.app_controller.start_monitoring()
+        self.config_watcher.start()
+        self.idle_monitor.start()
+        self.running = True
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: self.shutdown())
+        print(f"GetB@ck2Work daemon listening on {self.server.address}")
+
+        next_events = next_check = 0.0
+        try:
+            while self.running:
+                self.server.poll(max(0.0, min(next_events, next_check) - time.monotonic()))
+                now = time.monotonic()
+                if now >= next_events:
+                    next_events = now + self.events_loop.run(self._drain_events)
+                if now >= next_check or self.check_loop.wait(0):
+                    next_check = now + self.check_loop.run(self._check)
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop monitoring and persist state."""
+        self.idle_monitor.stop()
+        self.window_monitor.stop_monitoring()
+        self.app_controller.stop_monitoring()
+        self.config_watcher.stop()
+        self.server.close()
+        self.point_system.close()
+        if self.trace:
+            self.trace.close()
+            self.trace = None
+        if metrics.enabled:
+            metrics.dump(os.path.join("data", "metrics.json"))
+            metrics.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless GetB@ck2Work tracker")
+    parser.add_argument("--socket", help="Socket path for the daemon")
+    parser.add_argument("--record-trace", metavar="FILE", help="Record an activity trace for replay.py")
+    parser.add_argument("--metrics-port", type=int, help="Serve metrics as JSON on this localhost port")
+    parser.add_argument("command", nargs="?", help="Command to send to a running daemon")
+    parser.add_argument("args", nargs="*", help="Command arguments as name=value, or an app name")
+    options = parser.parse_args(argv)
+
+    if options.command is None:
+        if options.metrics_port is not None:
+            metrics.enabled = True
+            print(f"Metrics at http://127.0.0.1:{metrics.serve(options.metrics_port)}/metrics")
+        daemon = TrackerDaemon(options.socket)
+        if options.record_trace:
+            daemon.start_trace(options.record_trace)
+        daemon.run()
+        return 0
+
+    args = {}
+    for arg in options.args:
+        name, sep, value = arg.partition("=")
+        if sep:
+            args[name] = int(value) if value.isdigit() else value
+        elif options.command in ("block", "unblock"):
+            args['app_name'] = arg
+        elif options.command == "categorize":
+            args['process_name'] = arg
+
+    client = IpcClient(options.socket)
+    try:
+        print(json.dumps(client.call(options.command, **args), indent=2))
+    except IpcError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
 import random
-import time
 from typing import List, Optional
 
 class ShameOverlay:
@@ -11,7 +10,7 @@ class ShameOverlay:
         self.haiku_entry = None
         self.timer_label = None
         self.timer_running = False
-        self.timer_thread = None
+        self.timer_job = None
         self.remaining_time = 30  # seconds
         self.shame_messages = [
             "Oh no! You tried to procrastinate!",
@@ -29,6 +28,9 @@ class ShameOverlay:
     def show_haiku_challenge(self, app_name: str):
         """Show the haiku challenge overlay."""
         if self.overlay:
+            if self.timer_job:
+                self.overlay.after_cancel(self.timer_job)
+                self.timer_job = None
             self.overlay.destroy()
 
         # Create overlay window
@@ -98,12 +100,10 @@ class ShameOverlay:
         )
         self.timer_label.pack(pady=10)
         
-        # Start timer
+        # Start timer on the Tk event loop
         self.remaining_time = 30
         self.timer_running = True
-        self.timer_thread = threading.Thread(target=self._update_timer)
-        self.timer_thread.daemon = True
-        self.timer_thread.start()
+        self.timer_job = self.overlay.after(1000, self._update_timer)
 
     def _check_haiku(self):
         """Check if the haiku is valid and grant access if it is."""
@@ -129,19 +129,26 @@ class ShameOverlay:
     def _grant_access(self):
         """Grant temporary access to the blocked app."""
         self.timer_running = False
+        if self.overlay and self.timer_job:
+            self.overlay.after_cancel(self.timer_job)
+            self.timer_job = None
         if self.overlay:
             self.overlay.destroy()
             self.overlay = None
 
     def _update_timer(self):
-        """Update the timer display."""
-        while self.timer_running and self.remaining_time > 0:
-            self.remaining_time -= 1
-            if self.timer_label:
-                self.timer_label.config(text=f"Time remaining: {self.remaining_time}s")
-            time.sleep(1)
+        """Count down once per second from the Tk event loop."""
+        self.timer_job = None
+        if not self.timer_running or not self.overlay:
+            return
         
-        if self.timer_running:
+        self.remaining_time -= 1
+        if self.timer_label:
+            self.timer_label.config(text=f"Time remaining: {self.remaining_time}s")
+        
+        if self.remaining_time > 0:
+            self.timer_job = self.overlay.after(1000, self._update_timer)
+        else:
             self._grant_access()
 
     def is_visible(self) -> bool:
@@ -0,0 +1,154 @@
+import tkinter as tk
+from tkinter import ttk
+
+from gui.render_scheduler import RenderScheduler
+from gui.virtual_list import VirtualList
+from utils.ipc import IpcClient, IpcError
+
+
+class RemoteWindow:
+    """Tk front end for a running tracker daemon.
+
+    Polls the daemon's status once per interval and only fetches the window
+    list when the daemon reports a new window version. All state lives in
+    the daemon, so closing this window leaves tracking running.
+    """
+
+    def __init__(self, client: IpcClient, interval_ms: int = 1000):
+        self.client = client
+        self.interval_ms = interval_ms
+        self.state = {}
+        self.error = None
+        self.windows_version = None
+        self.window_keys = set()
+
+        self.root = tk.Tk()
+        self.root.title("GetB@ck2Work! (daemon)")
+        self.root.geometry("420x500")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.setup_gui()
+
+        self.render = RenderScheduler(self.root)
+        self.render.bind("points", lambda: self.state.get('points', 0),
+                         lambda value: self.points_label.config(text=f"{value}"))
+        self.render.bind("streak", lambda: self.state.get('streak', 0),
+                         lambda value: self.streak_label.config(text=f"{value} minutes"))
+        self.render.bind("activity", self._activity_text,
+                         lambda value: self.activity_label.config(text=value))
+        self.render.bind("blocked", lambda: tuple(self.state.get('blocked', ())), self._render_blocked)
+
+    def setup_gui(self):
+        """Set up the status panels."""
+        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_columnconfigure(0, weight=1)
+
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.grid_columnconfigure(0, weight=1)
+        main_frame.grid_columnconfigure(1, weight=1)
+        main_frame.grid_rowconfigure(2, weight=1)
+
+        points_frame = ttk.LabelFrame(main_frame, text="💎 POINTS", padding="5")
+        points_frame.grid(row=0, column=0, padx=5, pady=5, sticky=(tk.W, tk.E))
+        self.points_label = ttk.Label(points_frame, text="0", font=("Arial", 28, "bold"))
+        self.points_label.pack(pady=5)
+
+        streak_frame = ttk.LabelFrame(main_frame, text="🎯 TODAY'S STREAK", padding="5")
+        streak_frame.grid(row=0, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
+        self.streak_label = ttk.Label(streak_frame, text="0 minutes", font=("Arial", 18))
+        self.streak_label.pack(pady=5)
+
+        self.activity_label = ttk.Label(main_frame, text="Connecting to daemon...")
+        self.activity_label.grid(row=1, column=0, columnspan=2, pady=5, sticky=tk.W)
+
+        windows_frame = ttk.LabelFrame(main_frame, text="📊 OPEN WINDOWS", padding="5")
+        windows_frame.grid(row=2, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        windows_frame.grid_rowconfigure(0, weight=1)
+        windows_frame.grid_columnconfigure(0, weight=1)
+        self.window_list = VirtualList(windows_frame, create_row=self._create_window_row,
+                                       render_row=self._render_window_row)
+        self.window_list.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        blocked_frame = ttk.LabelFrame(main_frame, text="🚫 BLOCKED", padding="5")
+        blocked_frame.grid(row=3, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
+        blocked_frame.grid_columnconfigure(0, weight=1)
+        self.blocked_listbox = tk.Listbox(blocked_frame, height=4)
+        self.blocked_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        ttk.Button(blocked_frame, text="Unblock", command=self.unblock_selected).grid(row=0, column=1, padx=5)
+
+    def _create_window_row(self, parent):
+        """Create the widgets for one pooled window row."""
+        row_frame = ttk.Frame(parent)
+        label = ttk.Label(row_frame, font=("Arial", 10))
+        label.pack(side="left", fill="x", expand=True, padx=5)
+        block_btn = ttk.Button(row_frame, text="🚫", width=3)
+        block_btn.pack(side="right", padx=5)
+        return row_frame, label, block_btn
+
+    def _render_window_row(self, row, window):
+        """Bind a pooled row to a [hwnd, title, pid, name] window entry."""
+        _, label, block_btn = row
+        _, title, _, name = window
+        label.config(text=f"{name} - {title}")
+        block_btn.config(command=lambda p=name: self.send("block", app_name=p))
+
+    def _activity_text(self) -> str:
+        if self.error:
+            return f"Daemon unavailable: {self.error}"
+        app = self.state.get('app')
+        if not app:
+            return "Current Activity: None"
+        return f"Current Activity: {app} ({self.state.get('category') or 'uncategorized'})"
+
+    def _render_blocked(self, blocked):
+        self.blocked_listbox.delete(0, tk.END)
+        for app_name in blocked:
+            self.blocked_listbox.insert(tk.END, app_name)
+
+    def send(self, command: str, **args):
+        """Send a command and refresh right away."""
+        try:
+            self.client.call(command, **args)
+        except IpcError as e:
+            print(f"Error sending {command}: {e}")
+        self.refresh()
+
+    def unblock_selected(self):
+        """Unblock the app selected in the blocked list."""
+        selection = self.blocked_listbox.curselection()
+        if selection:
+            self.send("unblock", app_name=self.blocked_listbox.get(selection[0]))
+
+    def refresh(self):
+        """Pull status from the daemon, and the window list if it changed."""
+        try:
+            self.state = self.client.call("status")
+            self.error = None
+            if self.state.get('windows') != self.windows_version:
+                self._apply_windows(self.client.call("windows"))
+        except IpcError as e:
+            self.error = str(e)
+        self.render.mark_dirty("points", "streak", "activity", "blocked")
+
+    def _apply_windows(self, listing: dict):
+        windows = {window[0]: window for window in listing['windows']}
+        for hwnd in self.window_keys - windows.keys():
+            self.window_list.remove(hwnd)
+        for hwnd, window in windows.items():
+            self.window_list.upsert(hwnd, window)
+        self.window_keys = set(windows)
+        self.windows_version = listing['version']
+
+    def _poll(self):
+        self.refresh()
+        self.root.after(self.interval_ms, self._poll)
+
+    def on_closing(self):
+        """Close the window; the daemon keeps tracking."""
+        self.client.close()
+        self.root.destroy()
+
+    def run(self):
+        """Start the client."""
+        self._poll()
+        self.root.mainloop()
@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict, Set
+
+
+class RenderScheduler:
+    """Coalesces model changes into a single frame that only touches changed widgets.
+
+    Each binding pairs a compute function, which reads the model, with an
+    apply function, which configures widgets. mark_dirty() schedules one
+    after_idle frame no matter how often it is called. The frame recomputes
+    the dirty bindings and calls apply only when the computed value differs
+    from what is on screen. Nothing is scheduled while nothing is dirty, so
+    idle periods make no Tk calls. Call mark_dirty() from the Tk thread.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._bindings: Dict[str, tuple] = {}
+        self._rendered: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+        self._frame_job = None
+        self.frames = 0
+        self.widget_updates = 0
+
+    def bind(self, name: str, compute: Callable[[], Any], apply: Callable[[Any], None]):
+        """Register a view binding and mark it dirty for the first frame."""
+        self._bindings[name] = (compute, apply)
+        self.mark_dirty(name)
+
+    def mark_dirty(self, *names: str):
+        """Flag bindings for the next frame."""
+        self._dirty.update(names)
+        if self._frame_job is None:
+            self._frame_job = self.root.after_idle(self._frame)
+
+    def _frame(self):
+        self._frame_job = None
+        dirty, self._dirty = self._dirty, set()
+        self.frames += 1
+        for name in dirty:
+            binding = self._bindings.get(name)
+            if binding is None:
+                continue
+            compute, apply = binding
+            try:
+                value = compute()
+                if name in self._rendered and self._rendered[name] == value:
+                    continue
+                apply(value)
+                self._rendered[name] = value
+                self.widget_updates += 1
+            except Exception as e:
+                print(f"Error rendering {name}: {e}")
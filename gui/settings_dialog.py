@@ -0,0 +1,277 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+class SettingsDialog(tk.Toplevel):
+    def __init__(self, parent, app_categorizer, point_system, app_controller):
+        super().__init__(parent)
+        self.title("Settings")
+        self.geometry("600x500")
+        self.resizable(False, False)
+        
+        # Make dialog modal
+        self.transient(parent)
+        self.grab_set()
+        
+        # Store references
+        self.app_categorizer = app_categorizer
+        self.point_system = point_system
+        self.app_controller = app_controller
+        
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        # Create tabs
+        self.create_app_categories_tab()
+        self.create_points_tab()
+        
+        # Add save button at bottom
+        self.save_button = ttk.Button(self, text="Save", command=self.save_settings)
+        self.save_button.pack(pady=10)
+
+    def create_app_categories_tab(self):
+        """Create the app categories tab."""
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text="App Categories")
+        
+        # Create frames for productive and entertainment apps
+        lists_frame = ttk.Frame(tab)
+        lists_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        productive_frame = ttk.LabelFrame(lists_frame, text="Productive Apps", padding="5")
+        productive_frame.pack(side="left", fill="both", expand=True, padx=5)
+        
+        entertainment_frame = ttk.LabelFrame(lists_frame, text="Entertainment Apps", padding="5")
+        entertainment_frame.pack(side="right", fill="both", expand=True, padx=5)
+        
+        # Create listboxes with scrollbars
+        # Productive apps
+        productive_scroll = ttk.Scrollbar(productive_frame)
+        productive_scroll.pack(side="right", fill="y")
+        
+        self.productive_list = tk.Listbox(productive_frame, yscrollcommand=productive_scroll.set)
+        self.productive_list.pack(side="left", fill="both", expand=True)
+        productive_scroll.config(command=self.productive_list.yview)
+        
+        # Add remove button for productive apps
+        ttk.Button(
+            productive_frame,
+            text="Remove Selected",
+            command=lambda: self.remove_app(self.productive_list, self.productive_list.curselection()[0] if self.productive_list.curselection() else -1)
+        ).pack(side="bottom", fill="x", pady=5)
+        
+        # Entertainment apps
+        entertainment_scroll = ttk.Scrollbar(entertainment_frame)
+        entertainment_scroll.pack(side="right", fill="y")
+        
+        self.entertainment_list = tk.Listbox(entertainment_frame, yscrollcommand=entertainment_scroll.set)
+        self.entertainment_list.pack(side="left", fill="both", expand=True)
+        entertainment_scroll.config(command=self.entertainment_list.yview)
+        
+        # Add remove button for entertainment apps
+        ttk.Button(
+            entertainment_frame,
+            text="Remove Selected",
+            command=lambda: self.remove_app(self.entertainment_list, self.entertainment_list.curselection()[0] if self.entertainment_list.curselection() else -1)
+        ).pack(side="bottom", fill="x", pady=5)
+        
+        # Add input frame at the bottom
+        input_frame = ttk.LabelFrame(tab, text="Add New App", padding="5")
+        input_frame.pack(side="bottom", fill="x", padx=5, pady=5)
+        
+        # App selection dropdown
+        ttk.Label(input_frame, text="Select App:").pack(side="left", padx=(0, 5))
+        self.app_var = tk.StringVar()
+        self.app_dropdown = ttk.Combobox(
+            input_frame,
+            textvariable=self.app_var,
+            state="readonly",
+            width=30
+        )
+        self.app_dropdown.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        
+        # Category dropdown
+        ttk.Label(input_frame, text="Category:").pack(side="left", padx=(0, 5))
+        self.category_var = tk.StringVar(value="productive")
+        category_dropdown = ttk.Combobox(
+            input_frame, 
+            textvariable=self.category_var,
+            values=["productive", "entertainment"],
+            state="readonly",
+            width=15
+        )
+        category_dropdown.pack(side="left", padx=(0, 5))
+        
+        # Add button
+        ttk.Button(
+            input_frame,
+            text="Add",
+            command=self.add_new_app
+        ).pack(side="left")
+        
+        # Load current categories and installed apps
+        self.load_categories()
+        self.load_installed_apps()
+
+    def load_installed_apps(self):
+        """Load installed apps into the dropdown and keep it updated while the index refreshes."""
+        self._installed_apps_version = self.app_controller.installed_app_index.version
+        self._set_installed_apps(self.app_controller.get_installed_apps())
+        self.after(250, self._poll_installed_apps)
+
+    def _set_installed_apps(self, installed_apps):
+        """Show installed apps that are not already in a category list."""
+        listed = set(self.productive_list.get(0, tk.END)) | set(self.entertainment_list.get(0, tk.END))
+        installed_apps = [app for app in installed_apps if app not in listed]
+        self.app_dropdown['values'] = installed_apps
+        if installed_apps and not self.app_var.get():
+            self.app_dropdown.set(installed_apps[0])
+
+    def _poll_installed_apps(self):
+        """Pick up apps found by a background index refresh."""
+        try:
+            if not self.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        
+        index = self.app_controller.installed_app_index
+        if index.version != self._installed_apps_version:
+            self._installed_apps_version = index.version
+            self._set_installed_apps(self.app_controller.get_installed_apps())
+        if index.is_refreshing:
+            self.after(250, self._poll_installed_apps)
+
+    def load_categories(self):
+        """Load current app categories into the listboxes."""
+        # Clear existing items
+        self.productive_list.delete(0, tk.END)
+        self.entertainment_list.delete(0, tk.END)
+        
+        # Load productive apps
+        for app in self.app_categorizer.get_productive_apps():
+            self.productive_list.insert(tk.END, app)
+        
+        # Load entertainment apps
+        for app in self.app_categorizer.get_entertainment_apps():
+            self.entertainment_list.insert(tk.END, app)
+
+    def add_new_app(self):
+        """Add a new app to the selected category."""
+        app = self.app_var.get().strip()
+        if app:
+            category = self.category_var.get()
+            if category == "productive":
+                # Check if app is already in entertainment list
+                if app in self.entertainment_list.get(0, tk.END):
+                    messagebox.showwarning(
+                        "Warning",
+                        f"{app} is already in the Entertainment list. Please remove it first."
+                    )
+                    return
+                self.productive_list.insert(tk.END, app)
+            else:
+                # Check if app is already in productive list
+                if app in self.productive_list.get(0, tk.END):
+                    messagebox.showwarning(
+                        "Warning",
+                        f"{app} is already in the Productive list. Please remove it first."
+                    )
+                    return
+                self.entertainment_list.insert(tk.END, app)
+            
+            # Remove the app from the dropdown to prevent duplicates
+            current_values = list(self.app_dropdown['values'])
+            if app in current_values:
+                current_values.remove(app)
+                self.app_dropdown['values'] = current_values
+                if current_values:
+                    self.app_dropdown.set(current_values[0])
+
+    def remove_app(self, listbox, index):
+        """Remove an app from the specified listbox."""
+        if index >= 0:
+            listbox.delete(index)
+
+    def create_points_tab(self):
+        """Create tab for configuring point values."""
+        points_frame = ttk.Frame(self.notebook, padding=10)
+        self.notebook.add(points_frame, text="Points")
+        
+        # Create main content frame
+        content_frame = ttk.Frame(points_frame)
+        content_frame.pack(fill='both', expand=True)
+        
+        # Get current config
+        config = self.point_system.get_config()
+        
+        # Productive points
+        ttk.Label(content_frame, text="Points per minute for productive apps:").pack(anchor='w', pady=(0, 5))
+        self.productive_points = ttk.Spinbox(
+            content_frame,
+            from_=1,
+            to=100,
+            width=10,
+            validate='key',
+            validatecommand=(self.register(self.validate_number), '%P')
+        )
+        self.productive_points.set(config["productive_points_per_minute"])
+        self.productive_points.pack(anchor='w', pady=(0, 20))
+        
+        # Entertainment points
+        ttk.Label(content_frame, text="Points deducted per minute for entertainment apps:").pack(anchor='w', pady=(0, 5))
+        self.entertainment_points = ttk.Spinbox(
+            content_frame,
+            from_=1,
+            to=100,
+            width=10,
+            validate='key',
+            validatecommand=(self.register(self.validate_number), '%P')
+        )
+        self.entertainment_points.set(config["entertainment_points_per_minute"])
+        self.entertainment_points.pack(anchor='w')
+        
+        # Add explanation text
+        explanation = (
+            "Points are awarded or deducted based on time spent in each category.\n"
+            "For example, if you set 2 points per minute for productive apps,\n"
+            "you'll earn 2 points for each minute spent on productive apps.\n"
+            "Similarly, if you set 1 point per minute for entertainment apps,\n"
+            "you'll lose 1 point for each minute spent on entertainment apps."
+        )
+        ttk.Label(
+            content_frame,
+            text=explanation,
+            wraplength=500,
+            justify='left'
+        ).pack(anchor='w', pady=(20, 0))
+
+    def validate_number(self, value):
+        """Validate that input is a positive number."""
+        if value == "":
+            return True
+        try:
+            num = int(value)
+            return num > 0
+        except ValueError:
+            return False
+
+    def save_settings(self):
+        """Save all settings."""
+        # Get all apps from both lists
+        productive_apps = list(self.productive_list.get(0, tk.END))
+        entertainment_apps = list(self.entertainment_list.get(0, tk.END))
+        
+        # Update the categorizer with new lists
+        self.app_categorizer.update_categories(productive_apps, entertainment_apps)
+        
+        # Save point values
+        try:
+            productive_points = int(self.productive_points.get())
+            entertainment_points = int(self.entertainment_points.get())
+            self.point_system.update_config(productive_points, entertainment_points)
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers for point values")
+            return
+        
+        self.destroy()
@@ -0,0 +1,177 @@
+import sys
+import json
+import time
+import sysconfig
+import threading
+import traceback
+from collections import deque
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+from utils.metrics import metrics
+from utils.adaptive_scheduler import PollingLoop, scheduler
+
+_TKINTER_DIR = "/tkinter/"
+_LIBRARY_DIRS = tuple(
+    path for path in {sysconfig.get_paths().get(key) for key in ("stdlib", "platstdlib", "purelib", "platlib")} if path
+)
+
+
+class StallRecord(NamedTuple):
+    """One period in which the Tk loop stopped ticking."""
+    started_at: str
+    duration_ms: float
+    callback: str   # The Tk callback that was running
+    location: str   # The innermost app frame at the time of capture
+    stack: List[str]
+
+
+def _describe(frame: traceback.FrameSummary) -> str:
+    return f"{frame.name} ({frame.filename}:{frame.lineno})"
+
+
+class StallWatchdog:
+    """Watches the Tk loop from a background thread and records stalls.
+
+    A heartbeat callback on the Tk loop notes when it is next due. When it
+    runs more than threshold_ms late, the watchdog grabs the main thread's
+    stack with sys._current_frames(), names the Tk callback and the
+    innermost app frame that are running, and logs them. When the loop
+    ticks again, the stall goes into a ring buffer of the most recent
+    stalls with its full duration.
+
+    Both sides run on polling loops. The heartbeat backs off from
+    heartbeat_ms to threshold_ms while the Tk loop keeps up, and the
+    watchdog thread sleeps until the moment a late heartbeat would become a
+    stall instead of checking at a fixed rate. Both park while the
+    scheduler is suspended.
+    """
+
+    def __init__(self, threshold_ms: int = 250, heartbeat_ms: int = 50, capacity: int = 50):
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_loop = scheduler.loop("gui.heartbeat", heartbeat_ms / 1000, self.threshold)
+        self.watch_loop: PollingLoop = scheduler.loop("gui.stall_watchdog", self.threshold / 5, self.threshold)
+        self.stalls = deque(maxlen=capacity)
+        self.running = False
+        self.watch_thread = None
+        self._root = None
+        self._main_thread_id = threading.main_thread().ident
+        self._due = time.monotonic()  # When the next heartbeat should run
+        self._current: Optional[dict] = None
+        self._last_lag = 0.0  # How late the heartbeat that ended the last stall ran, measured on the Tk thread
+        self._lock = threading.Lock()
+        metrics.register_collector("gui.stalls", lambda: {'recorded': len(self.stalls)})
+
+    def attach(self, root):
+        """Start the heartbeat on a Tk root's event loop. Call from the Tk thread."""
+        self._root = root
+        self._main_thread_id = threading.get_ident()
+        self._beat()
+
+    def _beat(self):
+        lag = time.monotonic() - self._due
+        if lag > self.threshold:
+            self._last_lag = lag
+        # A stall counts as a change, so the heartbeat runs fast again afterwards
+        delay = self.heartbeat_loop.run(lambda: lag > self.threshold)
+        self._due = time.monotonic() + delay
+        self._root.after(self.heartbeat_loop.delay_ms, self._beat)
+
+    def start(self):
+        """Start the watchdog thread."""
+        if self.running:
+            return
+        # Startup work before the first heartbeat is not a stall
+        self._due = max(self._due, time.monotonic())
+        self.running = True
+        self.watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self.watch_thread.start()
+
+    def stop(self):
+        """Stop the watchdog thread."""
+        self.running = False
+        self.watch_loop.wake()
+        if self.watch_thread:
+            self.watch_thread.join(timeout=1.0)
+
+    def _watch_loop(self):
+        while self.running:
+            try:
+                self.watch_loop.run(self.check)
+            except Exception as e:
+                print(f"Error in stall watchdog: {e}")
+            if self.watch_loop.suspended:
+                self.watch_loop.wait()
+            elif self._current is not None:
+                # Poll on the loop's interval until the stall ends
+                self.watch_loop.wait()
+            else:
+                # Sleep until the pending heartbeat would be a threshold late
+                self.watch_loop.wait(max(0.0, self._due + self.threshold - time.monotonic()) + 0.001)
+
+    def check(self) -> bool:
+        """Capture a stall in progress or close one that ended. Returns True while stalled."""
+        stalled_for = time.monotonic() - self._due
+        if stalled_for > self.threshold:
+            if self._current is None:
+                self._capture(stalled_for)
+            return True
+        if self._current is not None:
+            self._finish()
+        return False
+
+    def _capture(self, stalled_for: float):
+        frame = sys._current_frames().get(self._main_thread_id)
+        stack = traceback.extract_stack(frame) if frame is not None else traceback.StackSummary()
+        callback, location = self._blame(stack)
+        self._current = {
+            'started_at': datetime.now() - timedelta(seconds=stalled_for),
+            'callback': callback,
+            'location': location,
+            'stack': [line.rstrip() for line in stack.format()]
+        }
+        print(f"Tk loop stalled for over {self.threshold * 1000:.0f} ms in {callback}, at {location}")
+
+    def _finish(self):
+        # The first beat after the stall measured the whole pause
+        current, self._current = self._current, None
+        duration = max(self.threshold, self._last_lag)
+        record = StallRecord(
+            current['started_at'].isoformat(timespec='milliseconds'),
+            round(duration * 1000, 1),
+            current['callback'],
+            current['location'],
+            current['stack']
+        )
+        with self._lock:
+            self.stalls.append(record)
+        metrics.inc("gui.stalls")
+        metrics.observe("gui.stall", duration)
+
+    @staticmethod
+    def _blame(stack: traceback.StackSummary):
+        """Find the Tk callback that was dispatched and the innermost app frame under it."""
+        callback = location = "unknown"
+        inside_tk = False
+        for frame in stack:
+            in_tkinter = _TKINTER_DIR in frame.filename.replace("\\", "/")
+            if in_tkinter:
+                inside_tk = True
+            elif inside_tk and callback == "unknown":
+                callback = _describe(frame)
+            if not in_tkinter and not frame.filename.startswith(_LIBRARY_DIRS):
+                location = _describe(frame)
+        return callback, location
+
+    def recent_stalls(self) -> List[dict]:
+        """Get the buffered stalls, oldest first."""
+        with self._lock:
+            return [record._asdict() for record in self.stalls]
+
+    def export(self, path: str):
+        """Write the buffered stalls to a JSON file."""
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.recent_stalls(), f, indent=2)
+        except Exception as e:
+            print(f"Error exporting stalls: {e}")
@@ -0,0 +1,53 @@
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime, timedelta
+
+class StatsDialog(tk.Toplevel):
+    def __init__(self, parent, activity_store):
+        super().__init__(parent)
+        self.title("Stats")
+        self.geometry("520x480")
+        self.transient(parent)
+        
+        self.activity_store = activity_store
+        today = datetime.now().date()
+        
+        # Today's totals
+        today_frame = ttk.LabelFrame(self, text="Today", padding="5")
+        today_frame.pack(fill="x", padx=10, pady=5)
+        totals = self.activity_store.totals(today.isoformat(), today.isoformat())
+        ttk.Label(
+            today_frame,
+            text=(f"Productive: {totals['productive_minutes']:.0f} min    "
+                  f"Entertainment: {totals['entertainment_minutes']:.0f} min\n"
+                  f"Points earned: {totals['points_earned']}    "
+                  f"Points spent: {totals['points_spent']}")
+        ).pack(anchor="w")
+        
+        # Last 7 days
+        week_frame = ttk.LabelFrame(self, text="Last 7 Days", padding="5")
+        week_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        columns = ("day", "productive", "entertainment", "earned", "spent")
+        week_table = ttk.Treeview(week_frame, columns=columns, show="headings", height=7)
+        for column in columns:
+            week_table.heading(column, text=column.title())
+            week_table.column(column, width=90, anchor="center")
+        week_table.pack(fill="both", expand=True)
+        start = (today - timedelta(days=6)).isoformat()
+        for row in self.activity_store.daily_stats(start, today.isoformat()):
+            week_table.insert("", tk.END, values=(
+                row['day'],
+                f"{row['productive_minutes']:.0f}",
+                f"{row['entertainment_minutes']:.0f}",
+                row['points_earned'],
+                row['points_spent']
+            ))
+        
+        # Top apps over the last 30 days
+        apps_frame = ttk.LabelFrame(self, text="Top Apps (30 Days)", padding="5")
+        apps_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        apps_list = tk.Listbox(apps_frame, height=6)
+        apps_list.pack(fill="both", expand=True)
+        start = (today - timedelta(days=29)).isoformat()
+        for app in self.activity_store.top_apps(start, today.isoformat(), limit=10):
+            apps_list.insert(tk.END, f"{app['app']} ({app['category']}): {app['minutes']:.0f} min")
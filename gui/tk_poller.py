@@ -0,0 +1,58 @@
+import time
+from typing import Callable, Optional
+
+from utils.metrics import metrics
+from utils.adaptive_scheduler import PollingLoop
+
+
+class TkPoller:
+    """Runs a repeating Tk callback on an adaptive polling loop.
+
+    The callback returns True when it saw a change. The next run is
+    scheduled with after() at whatever delay the loop asks for, so an idle
+    app wakes Tk rarely. wake() runs the callback straight away and puts the
+    loop back on its fast interval. Call everything from the Tk thread.
+    """
+
+    def __init__(self, root, loop: PollingLoop, callback: Callable[[], bool]):
+        self.root = root
+        self.loop = loop
+        self.callback = callback
+        self._job = None
+        self._due: Optional[float] = None
+
+    def start(self):
+        """Schedule the first run one fast interval from now."""
+        self._schedule(self.loop.min_interval)
+
+    def stop(self):
+        """Cancel the pending run."""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def wake(self):
+        """Run now and return to the fast interval."""
+        self.loop.wake()
+        if self._job is not None:
+            self.stop()
+            self._job = self.root.after_idle(self._run)
+
+    def _schedule(self, delay: float):
+        self._due = time.monotonic() + delay
+        self._job = self.root.after(int(delay * 1000), self._run)
+
+    def _run(self):
+        self._job = None
+        name = self.loop.name
+        if metrics.enabled and self._due is not None:
+            lag = max(0.0, time.monotonic() - self._due)
+            metrics.observe(f"{name}.lag", lag)
+            if lag > self.loop.min_interval:
+                metrics.inc(f"{name}.behind")
+        try:
+            with metrics.timer(name, budget=self.loop.min_interval):
+                self.loop.run(self.callback)
+        except Exception as e:
+            print(f"Error in {name}: {e}")
+        self._schedule(self.loop.delay)
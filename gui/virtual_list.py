@@ -0,0 +1,109 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, Hashable, List
+
+
+class VirtualList(ttk.Frame):
+    """Scrolling list that only creates widgets for the rows on screen.
+
+    Items are kept in plain Python structures. A fixed pool of row widgets,
+    just big enough to fill the viewport, is placed on a Canvas and rebound
+    to whichever items are visible as the user scrolls. The scroll region is
+    computed from the item count instead of from widget geometry, so widget
+    count and layout cost stay flat as the list grows.
+    """
+
+    def __init__(self, parent,
+                 create_row: Callable[[tk.Widget], Any],
+                 render_row: Callable[[Any, Any], None],
+                 row_height: int = 28,
+                 **kwargs):
+        super().__init__(parent, **kwargs)
+        self.create_row = create_row
+        self.render_row = render_row
+        self.row_height = row_height
+
+        self._keys: List[Hashable] = []
+        self._items: Dict[Hashable, Any] = {}
+        self._pool: List[dict] = []
+        self._layout_job = None
+
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+
+    def upsert(self, key: Hashable, item: Any):
+        """Add an item, or replace the item stored under key."""
+        if key not in self._items:
+            self._keys.append(key)
+            self._update_scroll_region()
+        self._items[key] = item
+        self._schedule_layout()
+
+    def remove(self, key: Hashable):
+        """Remove the item stored under key."""
+        if self._items.pop(key, None) is None:
+            return
+        self._keys.remove(key)
+        self._update_scroll_region()
+        self._schedule_layout()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _update_scroll_region(self):
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self._keys) * self.row_height))
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_layout()
+
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    def _on_canvas_configure(self, event):
+        # Keep exactly enough rows to cover the viewport, plus one partially visible row
+        needed = event.height // self.row_height + 2
+        while len(self._pool) < needed:
+            widget = self.create_row(self.canvas)
+            frame = widget[0] if isinstance(widget, tuple) else widget
+            window_id = self.canvas.create_window((0, -self.row_height), window=frame, anchor="nw",
+                                                  height=self.row_height)
+            self._pool.append({'widget': widget, 'window_id': window_id, 'key': None, 'item': None, 'y': None})
+        for row in self._pool:
+            self.canvas.itemconfigure(row['window_id'], width=event.width)
+        self.canvas.configure(yscrollincrement=self.row_height)
+        self._schedule_layout()
+
+    def _schedule_layout(self):
+        # Coalesce bursts of changes and scroll events into one layout pass
+        if self._layout_job is None:
+            self._layout_job = self.after_idle(self._layout)
+
+    def _layout(self):
+        self._layout_job = None
+        first = max(0, int(self.canvas.canvasy(0)) // self.row_height)
+        for offset, row in enumerate(self._pool):
+            index = first + offset
+            if index < len(self._keys):
+                key = self._keys[index]
+                item = self._items[key]
+                if row['key'] != key or row['item'] is not item:
+                    self.render_row(row['widget'], item)
+                    row['key'] = key
+                    row['item'] = item
+                y = index * self.row_height
+            else:
+                row['key'] = None
+                row['item'] = None
+                y = -self.row_height  # Park unused rows above the visible area
+            if row['y'] != y:
+                self.canvas.coords(row['window_id'], 0, y)
+                row['y'] = y
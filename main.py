@@ -1,5 +1,11 @@
 import os
 import sys
+from utils.startup_profiler import StartupProfiler
+
+# Installed before the imports below so they are timed too
+profiler = StartupProfiler(enabled="--profile-startup" in sys.argv[1:])
+profiler.install()
+
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
@@ -7,264 +13,27 @@ import time
 from datetime import datetime
 import json
 import random
+from queue import Empty
 
 from window_monitor import WindowMonitor
 from point_system import PointSystem
 from utils.app_categorizer import AppCategorizer
 from app_controller import AppController
-
-class SettingsDialog(tk.Toplevel):
-    def __init__(self, parent, app_categorizer, point_system, app_controller):
-        super().__init__(parent)
-        self.title("Settings")
-        self.geometry("600x500")
-        self.resizable(False, False)
-        
-        # Make dialog modal
-        self.transient(parent)
-        self.grab_set()
-        
-        # Store references
-        self.app_categorizer = app_categorizer
-        self.point_system = point_system
-        self.app_controller = app_controller
-        
-        # Create notebook for tabs
-        self.notebook = ttk.Notebook(self)
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        # Create tabs
-        self.create_app_categories_tab()
-        self.create_points_tab()
-        
-        # Add save button at bottom
-        self.save_button = ttk.Button(self, text="Save", command=self.save_settings)
-        self.save_button.pack(pady=10)
-
-    def create_app_categories_tab(self):
-        """Create the app categories tab."""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="App Categories")
-        
-        # Create frames for productive and entertainment apps
-        lists_frame = ttk.Frame(tab)
-        lists_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        productive_frame = ttk.LabelFrame(lists_frame, text="Productive Apps", padding="5")
-        productive_frame.pack(side="left", fill="both", expand=True, padx=5)
-        
-        entertainment_frame = ttk.LabelFrame(lists_frame, text="Entertainment Apps", padding="5")
-        entertainment_frame.pack(side="right", fill="both", expand=True, padx=5)
-        
-        # Create listboxes with scrollbars
-        # Productive apps
-        productive_scroll = ttk.Scrollbar(productive_frame)
-        productive_scroll.pack(side="right", fill="y")
-        
-        self.productive_list = tk.Listbox(productive_frame, yscrollcommand=productive_scroll.set)
-        self.productive_list.pack(side="left", fill="both", expand=True)
-        productive_scroll.config(command=self.productive_list.yview)
-        
-        # Add remove button for productive apps
-        ttk.Button(
-            productive_frame,
-            text="Remove Selected",
-            command=lambda: self.remove_app(self.productive_list, self.productive_list.curselection()[0] if self.productive_list.curselection() else -1)
-        ).pack(side="bottom", fill="x", pady=5)
-        
-        # Entertainment apps
-        entertainment_scroll = ttk.Scrollbar(entertainment_frame)
-        entertainment_scroll.pack(side="right", fill="y")
-        
-        self.entertainment_list = tk.Listbox(entertainment_frame, yscrollcommand=entertainment_scroll.set)
-        self.entertainment_list.pack(side="left", fill="both", expand=True)
-        entertainment_scroll.config(command=self.entertainment_list.yview)
-        
-        # Add remove button for entertainment apps
-        ttk.Button(
-            entertainment_frame,
-            text="Remove Selected",
-            command=lambda: self.remove_app(self.entertainment_list, self.entertainment_list.curselection()[0] if self.entertainment_list.curselection() else -1)
-        ).pack(side="bottom", fill="x", pady=5)
-        
-        # Add input frame at the bottom
-        input_frame = ttk.LabelFrame(tab, text="Add New App", padding="5")
-        input_frame.pack(side="bottom", fill="x", padx=5, pady=5)
-        
-        # App selection dropdown
-        ttk.Label(input_frame, text="Select App:").pack(side="left", padx=(0, 5))
-        self.app_var = tk.StringVar()
-        self.app_dropdown = ttk.Combobox(
-            input_frame,
-            textvariable=self.app_var,
-            state="readonly",
-            width=30
-        )
-        self.app_dropdown.pack(side="left", fill="x", expand=True, padx=(0, 5))
-        
-        # Category dropdown
-        ttk.Label(input_frame, text="Category:").pack(side="left", padx=(0, 5))
-        self.category_var = tk.StringVar(value="productive")
-        category_dropdown = ttk.Combobox(
-            input_frame, 
-            textvariable=self.category_var,
-            values=["productive", "entertainment"],
-            state="readonly",
-            width=15
-        )
-        category_dropdown.pack(side="left", padx=(0, 5))
-        
-        # Add button
-        ttk.Button(
-            input_frame,
-            text="Add",
-            command=self.add_new_app
-        ).pack(side="left")
-        
-        # Load current categories and installed apps
-        self.load_categories()
-        self.load_installed_apps()
-
-    def load_installed_apps(self):
-        """Load installed apps into the dropdown."""
-        installed_apps = self.app_controller.get_installed_apps()
-        self.app_dropdown['values'] = installed_apps
-        if installed_apps:
-            self.app_dropdown.set(installed_apps[0])
-
-    def load_categories(self):
-        """Load current app categories into the listboxes."""
-        # Clear existing items
-        self.productive_list.delete(0, tk.END)
-        self.entertainment_list.delete(0, tk.END)
-        
-        # Load productive apps
-        for app in self.app_categorizer.get_productive_apps():
-            self.productive_list.insert(tk.END, app)
-        
-        # Load entertainment apps
-        for app in self.app_categorizer.get_entertainment_apps():
-            self.entertainment_list.insert(tk.END, app)
-
-    def add_new_app(self):
-        """Add a new app to the selected category."""
-        app = self.app_var.get().strip()
-        if app:
-            category = self.category_var.get()
-            if category == "productive":
-                # Check if app is already in entertainment list
-                if app in self.entertainment_list.get(0, tk.END):
-                    messagebox.showwarning(
-                        "Warning",
-                        f"{app} is already in the Entertainment list. Please remove it first."
-                    )
-                    return
-                self.productive_list.insert(tk.END, app)
-            else:
-                # Check if app is already in productive list
-                if app in self.productive_list.get(0, tk.END):
-                    messagebox.showwarning(
-                        "Warning",
-                        f"{app} is already in the Productive list. Please remove it first."
-                    )
-                    return
-                self.entertainment_list.insert(tk.END, app)
-            
-            # Remove the app from the dropdown to prevent duplicates
-            current_values = list(self.app_dropdown['values'])
-            if app in current_values:
-                current_values.remove(app)
-                self.app_dropdown['values'] = current_values
-                if current_values:
-                    self.app_dropdown.set(current_values[0])
-
-    def remove_app(self, listbox, index):
-        """Remove an app from the specified listbox."""
-        if index >= 0:
-            listbox.delete(index)
-
-    def create_points_tab(self):
-        """Create tab for configuring point values."""
-        points_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(points_frame, text="Points")
-        
-        # Create main content frame
-        content_frame = ttk.Frame(points_frame)
-        content_frame.pack(fill='both', expand=True)
-        
-        # Get current config
-        config = self.point_system.get_config()
-        
-        # Productive points
-        ttk.Label(content_frame, text="Points per minute for productive apps:").pack(anchor='w', pady=(0, 5))
-        self.productive_points = ttk.Spinbox(
-            content_frame,
-            from_=1,
-            to=100,
-            width=10,
-            validate='key',
-            validatecommand=(self.register(self.validate_number), '%P')
-        )
-        self.productive_points.set(config["productive_points_per_minute"])
-        self.productive_points.pack(anchor='w', pady=(0, 20))
-        
-        # Entertainment points
-        ttk.Label(content_frame, text="Points deducted per minute for entertainment apps:").pack(anchor='w', pady=(0, 5))
-        self.entertainment_points = ttk.Spinbox(
-            content_frame,
-            from_=1,
-            to=100,
-            width=10,
-            validate='key',
-            validatecommand=(self.register(self.validate_number), '%P')
-        )
-        self.entertainment_points.set(config["entertainment_points_per_minute"])
-        self.entertainment_points.pack(anchor='w')
-        
-        # Add explanation text
-        explanation = (
-            "Points are awarded or deducted based on time spent in each category.\n"
-            "For example, if you set 2 points per minute for productive apps,\n"
-            "you'll earn 2 points for each minute spent on productive apps.\n"
-            "Similarly, if you set 1 point per minute for entertainment apps,\n"
-            "you'll lose 1 point for each minute spent on entertainment apps."
-        )
-        ttk.Label(
-            content_frame,
-            text=explanation,
-            wraplength=500,
-            justify='left'
-        ).pack(anchor='w', pady=(20, 0))
-
-    def validate_number(self, value):
-        """Validate that input is a positive number."""
-        if value == "":
-            return True
-        try:
-            num = int(value)
-            return num > 0
-        except ValueError:
-            return False
-
-    def save_settings(self):
-        """Save all settings."""
-        # Get all apps from both lists
-        productive_apps = list(self.productive_list.get(0, tk.END))
-        entertainment_apps = list(self.entertainment_list.get(0, tk.END))
-        
-        # Update the categorizer with new lists
-        self.app_categorizer.update_categories(productive_apps, entertainment_apps)
-        
-        # Save point values
-        try:
-            productive_points = int(self.productive_points.get())
-            entertainment_points = int(self.entertainment_points.get())
-            self.point_system.update_config(productive_points, entertainment_points)
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid numbers for point values")
-            return
-        
-        self.destroy()
+from activity_tracker import ActivityTracker
+from utils.file_watcher import FileWatcher
+from utils.event_bus import EventBus
+from utils.metrics import metrics
+from utils.adaptive_scheduler import scheduler
+from utils.idle_source import IdleMonitor, default_idle_source
+from gui.render_scheduler import RenderScheduler
+from gui.virtual_list import VirtualList
+from gui.stall_watchdog import StallWatchdog
+from gui.tk_poller import TkPoller
+from utils.window_snapshot import WindowDelta, FocusChange, OPENED, CLOSED, RETITLED
+profiler.mark("imports")
+
+METRICS_PORT = 47618
+STALL_THRESHOLD_MS = 250  # Tk loop pauses longer than this are logged
 
 class GetBack2Work:
     def __init__(self):
@@ -273,7 +42,9 @@ class GetBack2Work:
 
         # Initialize components
         self.point_system = PointSystem()
+        profiler.mark("point_system")
         self.app_categorizer = AppCategorizer()
+        profiler.mark("app_categorizer")
         
         # Initialize GUI
         self.root = tk.Tk()
@@ -282,12 +53,26 @@ class GetBack2Work:
         
         # Add protocol handler for window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        profiler.mark("tk_root")
         
         # Initialize app controller after GUI
         self.app_controller = AppController(self.point_system, self.root)
         
+        # Events from monitor threads are handled on the Tk thread
+        self.event_bus = EventBus(max_per_frame=50)
+        self.event_bus.subscribe("focus_change", self.on_focus_change)
+        self.event_bus.subscribe("user_idle", self.on_user_idle)
+        self.event_bus.subscribe("user_active", self.on_user_active)
+        metrics.register_collector("event_bus", self.event_bus.stats)
+        
         # Initialize window monitor
-        self.window_monitor = WindowMonitor(self.on_window_change)
+        self.window_monitor = WindowMonitor(None, on_focus=self._post_focus_change)
+        profiler.mark("controllers")
+        
+        # Reload rules and point rates when their files are replaced
+        self.config_watcher = FileWatcher()
+        self.config_watcher.watch(self.app_categorizer.categories_file, self.app_categorizer.reload_categories)
+        self.config_watcher.watch(self.point_system.config_file, self._reload_point_config)
         
         # Initialize activity tracking
         self.current_activity = {
@@ -297,28 +82,42 @@ class GetBack2Work:
             'points_earned': 0
         }
         
-        # Initialize window tracking
-        self.last_window = None
-        self.last_window_time = None
-        
-        # List of protected system apps that should never be blocked
-        self.protected_apps = {
-            'taskmgr.exe',  # Task Manager
-            'explorer.exe',  # Windows Explorer
-            'python.exe',    # Python interpreter
-            'pythonw.exe',   # Python windowless
-            'cmd.exe',       # Command Prompt
-            'powershell.exe', # PowerShell
-            'systemsettings.exe', # Windows Settings
-            'ms-settings:',  # Windows Settings
-            'control.exe',   # Control Panel
-        }
+        # Window accounting shared with the headless daemon
+        self.activity_tracker = ActivityTracker(
+            self.point_system, self.app_categorizer, self.app_controller, on_blocked=self._warn_blocked
+        )
+        self.protected_apps = self.activity_tracker.protected_apps
+        self._checked_points = None  # Balance at the last entertainment check
+        
+        # Stop scanning and accounting while the user is away
+        self.idle_monitor = IdleMonitor(
+            default_idle_source(),
+            threshold=self.point_system.idle_config["threshold_seconds"],
+            on_idle=self._post_user_idle,
+            on_active=self._post_user_active
+        )
         
         # Setup GUI
         self.setup_gui()
+        self.setup_rendering()
+        profiler.mark("gui")
+        
+        # Poll the window queue and the balance, backing off while nothing changes
+        self.window_queue_poller = TkPoller(
+            self.root, scheduler.loop("gui.window_queue", 0.1, 1.0), self.process_window_queue
+        )
+        self.points_poller = TkPoller(
+            self.root, scheduler.loop("gui.check_points", 1.0, 8.0), self.check_points
+        )
         
         # Start processing window changes
-        self.process_window_queue()
+        self.window_queue_poller.start()
+        # Parked while the user is away; the idle event is dispatched on return, ahead of the active one
+        self.event_bus.attach(self.root, scheduler.loop("gui.event_bus", 0.05, 0.5))
+        
+        # Log callbacks that keep the Tk loop from ticking
+        self.stall_watchdog = StallWatchdog(threshold_ms=STALL_THRESHOLD_MS)
+        self.stall_watchdog.attach(self.root)
 
     def on_closing(self):
         """Handle window closing."""
@@ -326,10 +125,24 @@ class GetBack2Work:
             # Stop all monitoring
             self.window_monitor.stop_monitoring()
             self.app_controller.stop_monitoring()
+            self.config_watcher.stop()
+            self.idle_monitor.stop()
+            self.window_queue_poller.stop()
+            self.points_poller.stop()
+            self.stall_watchdog.stop()
+            if self.stall_watchdog.stalls:
+                self.stall_watchdog.export(os.path.join("data", "ui_stalls.json"))
             
             # Unblock all apps
             self.app_controller.unblock_all_apps()
             
+            # Checkpoint the points ledger
+            self.point_system.close()
+            
+            if metrics.enabled:
+                metrics.dump(os.path.join("data", "metrics.json"))
+                metrics.close()
+            
             # Destroy the window
             self.root.destroy()
         except Exception as e:
@@ -396,25 +209,13 @@ class GetBack2Work:
         activity_frame.grid_rowconfigure(0, weight=1)
         activity_frame.grid_columnconfigure(0, weight=1)
 
-        # Create a canvas with scrollbar for the apps list
-        self.canvas = tk.Canvas(activity_frame)
-        self.scrollbar = ttk.Scrollbar(activity_frame, orient="vertical", command=self.canvas.yview)
-        self.apps_frame = ttk.Frame(self.canvas)
-
-        # Configure canvas
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-
-        # Create window in canvas
-        self.canvas_frame = self.canvas.create_window((0, 0), window=self.apps_frame, anchor="nw")
-
-        # Bind events for scrolling
-        self.apps_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-
-        # Dictionary to store app labels
-        self.app_labels = {}
+        # Virtualized list of windows; only the visible rows have widgets
+        self.activity_list = VirtualList(
+            activity_frame,
+            create_row=self._create_app_row,
+            render_row=self._render_app_row
+        )
+        self.activity_list.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # BOTTOM BUTTONS
         buttons_frame = ttk.Frame(main_frame)
@@ -446,14 +247,6 @@ class GetBack2Work:
         buttons_frame.grid_columnconfigure(1, weight=1)
         buttons_frame.grid_columnconfigure(2, weight=1)
 
-    def _on_frame_configure(self, event=None):
-        """Reset the scroll region to encompass the inner frame"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def _on_canvas_configure(self, event):
-        """Reset the width of the inner frame to match the canvas"""
-        self.canvas.itemconfig(self.canvas_frame, width=event.width)
-
     def show_buy_time(self):
         """Show the buy time dialog."""
         # TODO: Implement buy time dialog
@@ -461,61 +254,56 @@ class GetBack2Work:
 
     def show_settings(self):
         """Show the settings dialog."""
+        from gui.settings_dialog import SettingsDialog
         SettingsDialog(self.root, self.app_categorizer, self.point_system, self.app_controller)
 
     def show_stats(self):
         """Show the stats dialog."""
-        # TODO: Implement stats dialog
-        pass
+        from gui.stats_dialog import StatsDialog
+        StatsDialog(self.root, self.point_system.activity_store)
 
     def update_activity_display(self):
         """Update the current activity display."""
         # This method is no longer needed as we're showing all apps
         pass
 
-    def process_window_queue(self):
-        """Process window updates from the queue."""
-        try:
-            # Get all current windows
-            windows_info = self.window_monitor.get_all_windows_info()
-            if windows_info:
-                # Clear old labels
-                for widget in self.apps_frame.winfo_children():
-                    widget.destroy()
-                self.app_labels.clear()
-
-                # Create new labels for each window
-                for process_name, (window_title, hwnd, process_id) in windows_info.items():
-                    # Create a frame for each app
-                    app_frame = ttk.Frame(self.apps_frame)
-                    app_frame.pack(fill="x", padx=5, pady=2)
-
-                    # App name and title
-                    app_label = ttk.Label(
-                        app_frame,
-                        text=f"{os.path.basename(process_name)} - {window_title}",
-                        font=("Arial", 10)
-                    )
-                    app_label.pack(side="left", fill="x", expand=True)
-                    self.app_labels[process_name] = app_label
-
-                    # Add block button
-                    block_btn = ttk.Button(
-                        app_frame,
-                        text="🚫",
-                        width=3,
-                        command=lambda p=process_name: self.block_app(p)
-                    )
-                    block_btn.pack(side="right", padx=5)
-
-                # Update scroll region
-                self._on_frame_configure()
-
-        except Exception as e:
-            print(f"Error processing window queue: {e}")
-
-        # Schedule next check
-        self.root.after(100, self.process_window_queue)
+    def process_window_queue(self) -> bool:
+        """Apply window deltas from the monitor to the activity list. Returns True if there were any."""
+        applied = 0
+        while True:
+            try:
+                delta = self.window_monitor.window_queue.get_nowait()
+            except Empty:
+                break
+            self._apply_window_delta(delta)
+            applied += 1
+        return applied > 0
+
+    def _apply_window_delta(self, delta: WindowDelta):
+        """Update the activity list entry for one window."""
+        if delta.kind == CLOSED:
+            self.activity_list.remove(delta.window.hwnd)
+        elif delta.kind in (OPENED, RETITLED):
+            self.activity_list.upsert(delta.window.hwnd, delta.window)
+
+    def _create_app_row(self, parent):
+        """Create the widgets for one pooled activity row."""
+        app_frame = ttk.Frame(parent)
+
+        # App name and title
+        app_label = ttk.Label(app_frame, font=("Arial", 10))
+        app_label.pack(side="left", fill="x", expand=True, padx=5)
+
+        # Add block button
+        block_btn = ttk.Button(app_frame, text="🚫", width=3)
+        block_btn.pack(side="right", padx=5)
+        return app_frame, app_label, block_btn
+
+    def _render_app_row(self, row, window):
+        """Bind a pooled activity row to a window."""
+        _, app_label, block_btn = row
+        app_label.config(text=f"{window.name} - {window.title}")
+        block_btn.config(command=lambda p=window.name: self.block_app(p))
 
     def block_app(self, process_name):
         """Block the selected app."""
@@ -524,100 +312,94 @@ class GetBack2Work:
         except Exception as e:
             print(f"Error blocking app: {e}")
 
-    def update_stats(self):
-        """Update statistics display."""
-        try:
-            # Update points
-            points = self.point_system.get_points()
-            self.points_label.config(text=f"{points:,}")
-
-            # Update streak
-            streak = self.point_system.get_streak()
-            hours = streak // 60
-            minutes = streak % 60
-            self.streak_label.config(text=f"{hours:02d}:{minutes:02d}")
-            self.streak_progress["value"] = minutes
-
-            # Update time bank
-            # TODO: Implement time bank progress
-            self.time_bank_progress["value"] = 50  # Placeholder
-
-        except Exception as e:
-            print(f"Error updating stats: {e}")
+    def setup_rendering(self):
+        """Bind the stats widgets to the render scheduler."""
+        self.render = RenderScheduler(self.root)
+        self.render.bind("points", self.point_system.get_points, self._render_points)
+        self.render.bind("streak", self.point_system.get_streak, self._render_streak)
+        self.render.bind("time_bank", self._time_bank_value, self._render_time_bank)
+        
+        # Model changes only flag the widgets they affect
+        self.point_system.add_listener(lambda: self.render.mark_dirty("points", "streak", "time_bank"))
+        self.event_bus.subscribe("config_reloaded", lambda _: self.render.mark_dirty("time_bank"))
 
-        # Schedule next update
-        self.root.after(1000, self.update_stats)
+    def _render_points(self, points):
+        self.points_label.config(text=f"{points:,}")
 
-    def on_window_change(self, window_title: str, process_name: str, executable_path: str):
-        """Handle window change events."""
+    def _render_streak(self, streak):
+        hours = streak // 60
+        minutes = streak % 60
+        self.streak_label.config(text=f"{hours:02d}:{minutes:02d}")
+        self.streak_progress["value"] = minutes
+
+    def _time_bank_value(self) -> int:
+        """Get the affordable entertainment time as a percentage of one hour."""
+        cost = self.point_system.points_config["entertainment_points_per_minute"]
+        affordable_minutes = self.point_system.get_points() // max(cost, 1)
+        return min(100, affordable_minutes * 100 // 60)
+
+    def _render_time_bank(self, value):
+        self.time_bank_progress["value"] = value
+
+    def _reload_point_config(self):
+        """Reload point rates on the watcher thread and tell the Tk thread."""
+        if self.point_system.reload_config():
+            self.idle_monitor.threshold = self.point_system.idle_config["threshold_seconds"]
+            self.event_bus.post("config_reloaded", key="config")
+
+    def _post_user_idle(self, since: datetime):
+        """Park the monitor loops at once and hand the accounting to the Tk thread."""
+        scheduler.suspend()
+        self.event_bus.post("user_idle", since)
+
+    def _post_user_active(self, at: datetime):
+        scheduler.resume()
+        self.event_bus.post("user_active", at)
+
+    def on_user_idle(self, since: datetime):
+        """Stop accounting from the user's last input."""
+        self.activity_tracker.suspend(since)
+
+    def on_user_active(self, at: datetime):
+        """Resume accounting and fast polling when input returns."""
+        self.activity_tracker.resume(at)
+        self.window_queue_poller.wake()
+        self.points_poller.wake()
+
+    def _post_focus_change(self, change: FocusChange):
+        """Forward a foreground change from the monitor thread to the Tk thread."""
+        # Not coalesced: every switch ends a dwell that has to be charged
+        self.event_bus.post("focus_change", change)
+
+    def on_focus_change(self, change: FocusChange):
+        """Handle foreground changes on the Tk thread."""
         try:
+            # The user is active, so stop backing off
+            self.window_queue_poller.wake()
+            self.points_poller.wake()
+            
             # Create window info dictionary
+            window = change.window
             window_info = {
-                'process_name': process_name,
-                'window_title': window_title,
-                'executable_path': executable_path
-            }
+                'process_name': window.name,
+                'window_title': window.title,
+                'executable_path': window.exe
+            } if window else None
             
             # Process the window change
-            self.process_window_change(window_info)
+            self.process_window_change(window_info, change.at)
             
         except Exception as e:
-            print(f"Error handling window change: {e}")
+            print(f"Error handling focus change: {e}")
 
-    def process_window_change(self, window_info):
-        """Process window change and update points."""
-        if not window_info:
+    def process_window_change(self, window_info, at=None):
+        """Charge the window that had focus and show the new activity."""
+        if not self.activity_tracker.handle_window_change(window_info, at):
             return
-            
-        process_name = window_info.get('process_name', '').lower()
-        window_title = window_info.get('window_title', '')
-        
-        # Skip if it's our own window
-        if process_name == "python" and "GetB@ck2Work" in window_title:
-            return
-            
-        # Skip if it's a protected system app
-        if process_name in self.protected_apps:
-            return
-            
-        # Get current time
-        current_time = datetime.now()
-        
-        # If we have a previous window, calculate time spent
-        if self.last_window and self.last_window_time:
-            time_spent = (current_time - self.last_window_time).total_seconds() / 60  # Convert to minutes
-            if time_spent >= 1:  # Only update if at least 1 minute has passed
-                # Get category of the last window
-                category = self.app_categorizer.get_category(self.last_window['process_name'])
-                if category:
-                    # Update points based on time spent
-                    self.point_system.update_points(category, int(time_spent))
-                    # Update display
-                    self.update_display()
-        
-        # Check if the new window is an entertainment app
-        category = self.app_categorizer.get_category(process_name)
-        if category == "entertainment":
-            # Calculate cost for 1 minute of entertainment
-            cost = self.point_system.points_config["entertainment_points_per_minute"]
-            current_points = self.point_system.get_points()
-            
-            if current_points < cost:
-                # Not enough points, block the app
-                self.app_controller.block_app(process_name)
-                messagebox.showwarning(
-                    "Insufficient Points",
-                    f"You need {cost} points to use {process_name}.\n"
-                    f"Current points: {current_points}\n"
-                    "Earn more points by using productive apps!"
-                )
-                return
-        
-        # Update last window info
-        self.last_window = window_info
-        self.last_window_time = current_time
         
         # Update current activity display
+        process_name = self.activity_tracker.current_app
+        category = self.activity_tracker.current_category
         if process_name:
             if category:
                 self.current_activity_label.config(
@@ -632,38 +414,44 @@ class GetBack2Work:
 
     def check_points_for_entertainment(self):
         """Check if user has enough points for entertainment apps."""
-        current_points = self.point_system.get_points()
-        cost_per_minute = self.point_system.points_config["entertainment_points_per_minute"]
-        
-        # Get all running entertainment apps
-        running_apps = self.app_controller.get_running_apps()
-        for app_name, app_info in running_apps.items():
-            category = self.app_categorizer.get_category(app_name)
-            if category == "entertainment" and app_info['is_blocked'] == False:
-                if current_points < cost_per_minute:
-                    # Not enough points, block the app
-                    self.app_controller.block_app(app_name)
-                    messagebox.showwarning(
-                        "Insufficient Points",
-                        f"You need {cost_per_minute} points to use {app_name}.\n"
-                        f"Current points: {current_points}\n"
-                        "Earn more points by using productive apps!"
-                    )
+        self.activity_tracker.check_entertainment()
 
-    def update_display(self):
-        """Update the display with current points and streak."""
-        # Update points display
+    def check_points(self) -> bool:
+        """Run the periodic entertainment check. Returns True if the balance moved since the last one."""
         points = self.point_system.get_points()
-        self.points_label.config(text=f"{points:,}")
-        
-        # Update streak display
-        streak = self.point_system.get_streak()
-        hours = streak // 60
-        minutes = streak % 60
-        self.streak_label.config(text=f"{hours:02d}:{minutes:02d}")
+        self.check_points_for_entertainment()
+        self.report_terminations()
+        changed = self._checked_points is not None and points != self._checked_points
+        self._checked_points = points
+        return changed
+
+    def _warn_blocked(self, app_name: str, cost: int, current_points: int):
+        """Tell the user an app was blocked for lack of points."""
+        messagebox.showwarning(
+            "Insufficient Points",
+            f"You need {cost} points to use {app_name}.\n"
+            f"Current points: {current_points}\n"
+            "Earn more points by using productive apps!"
+        )
+
+    def report_terminations(self):
+        """Report blocked apps the termination worker could not stop."""
+        for result in self.app_controller.drain_termination_results():
+            if result.failed:
+                print(f"Could not terminate {result.app_name}: pids {result.failed}")
+
+    def update_display(self):
+        """Schedule a redraw of points and streak."""
+        self.render.mark_dirty("points", "streak", "time_bank")
+
+    def _start_deferred(self):
+        """Start subsystems the first frame does not depend on."""
+        profiler.finish("first_frame")
+        if profiler.enabled:
+            print(profiler.format_report())
         
-        # Update streak progress bar
-        self.streak_progress['value'] = minutes
+        # Start watching config files
+        self.config_watcher.start()
 
     def run(self):
         """Start the application."""
@@ -673,19 +461,31 @@ class GetBack2Work:
         # Start app controller
         self.app_controller.start_monitoring()
         
-        # Start points checking
-        def check_points():
-            self.check_points_for_entertainment()
-            self.root.after(1000, check_points)  # Check every second
+        # Start watching for the user going idle
+        self.idle_monitor.start()
+        
+        # Start watching for UI stalls
+        self.stall_watchdog.start()
         
-        self.root.after(1000, check_points)
+        # Start non-critical work once the first frame is up
+        self.root.after_idle(self._start_deferred)
         
-        # Start stats updates
-        self.root.after(1000, self.update_stats)
+        # Start points checking
+        self.points_poller.start()
         
         # Start the main loop
         self.root.mainloop()
 
 if __name__ == "__main__":
-    app = GetBack2Work()
+    # "--connect" opens a window onto a running daemon instead of tracking in-process
+    if "--connect" in sys.argv[1:]:
+        from gui.remote_window import RemoteWindow
+        from utils.ipc import IpcClient
+        app = RemoteWindow(IpcClient())
+    else:
+        # "--metrics" serves loop timings and counters on localhost while the app runs
+        if "--metrics" in sys.argv[1:]:
+            metrics.enabled = True
+            print(f"Metrics at http://127.0.0.1:{metrics.serve(METRICS_PORT)}/metrics")
+        app = GetBack2Work()
     app.run() 
\ No newline at end of file
@@ -1,40 +1,68 @@
 import os
 import json
 from datetime import datetime, timedelta
+from typing import Callable
+
+from utils.ledger import EventLedger
+from utils.metrics import metrics
 
 class PointSystem:
-    def __init__(self):
-        self.data_dir = "data"
+    def __init__(self, data_dir: str = "data", clock: Callable[[], datetime] = datetime.now):
+        self.data_dir = data_dir
+        self.clock = clock
         self.user_data_file = os.path.join(self.data_dir, "user_data.json")
         self.config_file = os.path.join(self.data_dir, "config.json")
+        self.ledger_file = os.path.join(self.data_dir, "points_ledger.jsonl")
+        self.ledger = EventLedger(self.ledger_file, self.user_data_file)
+        self.activity_db_file = os.path.join(self.data_dir, "activity.db")
+        self._activity_store = None
         
         # Initialize point values
         self.points_config = {
             "productive_points_per_minute": 1,
             "entertainment_points_per_minute": 1
         }
-        
-        # Load user data and config
-        self.load_data()
-        self.load_config()
+        self.idle_config = {
+            "threshold_seconds": 300  # Stop tracking after this long without input
+        }
         
         # Initialize tracking
         self.current_points = 0
         self.current_streak = 0
         self.last_activity_time = None
         self.last_category = None
+        self._carried_seconds = {}  # Category -> focused seconds not yet worth a whole minute
+        self._extra_data = {}
+        self._listeners = []
+        
+        # Load user data and config
+        self.load_data()
+        self.load_config()
 
     def load_data(self):
-        """Load user data from file."""
+        """Load the last snapshot and replay any ledger events written after it."""
         try:
-            if os.path.exists(self.user_data_file):
-                with open(self.user_data_file, 'r') as f:
-                    data = json.load(f)
-                    self.current_points = data.get('points', 0)
-                    self.current_streak = data.get('streak', 0)
-            else:
-                self.current_points = 0
-                self.current_streak = 0
+            data = self.ledger.load_snapshot()
+            self.current_points = data.get('points', data.get('current_points', 0))
+            self.current_streak = data.get('streak', 0)
+            
+            # Move legacy per-day stats into the activity store
+            if 'daily_stats' in data:
+                self.activity_store.import_daily_stats(data['daily_stats'])
+            
+            # Carry fields this class does not manage through checkpoints
+            self._extra_data = {
+                key: value for key, value in data.items()
+                if key not in ('points', 'current_points', 'streak', 'last_updated', 'ledger_seq', 'daily_stats')
+            }
+            
+            replayed = 0
+            for event in self.ledger.replay(data.get('ledger_seq', 0)):
+                self._apply_event(event)
+                replayed += 1
+            
+            # Fold recovered events into a fresh snapshot
+            if replayed or not data or 'daily_stats' in data:
                 self.save_data()
         except Exception as e:
             print(f"Error loading user data: {e}")
@@ -48,54 +76,131 @@ class PointSystem:
                 with open(self.config_file, 'r') as f:
                     config = json.load(f)
                     self.points_config.update(config.get('points', {}))
+                    self.idle_config.update(config.get('idle', {}))
             else:
                 self.save_config()
         except Exception as e:
             print(f"Error loading config: {e}")
 
+    def reload_config(self) -> bool:
+        """Re-read the points and idle configuration and swap them in as new dicts."""
+        try:
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+        except Exception as e:
+            print(f"Error reloading config, keeping current values: {e}")
+            return False
+        points_config = dict(self.points_config)
+        points_config.update(config.get('points', {}))
+        self.points_config = points_config
+        idle_config = dict(self.idle_config)
+        idle_config.update(config.get('idle', {}))
+        self.idle_config = idle_config
+        return True
+
     def save_data(self):
-        """Save user data to file."""
+        """Checkpoint user data to file and compact the ledger."""
         try:
-            os.makedirs(self.data_dir, exist_ok=True)
-            with open(self.user_data_file, 'w') as f:
-                json.dump({
+            with metrics.timer("point_system.save"):
+                self.ledger.compact({
+                    **self._extra_data,
                     'points': self.current_points,
                     'streak': self.current_streak,
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=4)
+                    'last_updated': self.clock().isoformat()
+                })
         except Exception as e:
             print(f"Error saving user data: {e}")
 
+    @property
+    def activity_store(self):
+        """Get the activity store, opening it on first use."""
+        if self._activity_store is None:
+            from utils.activity_store import ActivityStore
+            self._activity_store = ActivityStore(self.activity_db_file)
+        return self._activity_store
+
+    def close(self):
+        """Checkpoint and close the ledger and activity store."""
+        self.save_data()
+        self.ledger.close()
+        if self._activity_store is not None:
+            self._activity_store.close()
+
     def save_config(self):
-        """Save points configuration to file."""
+        """Save points configuration to file, replacing the old file atomically so the config watcher never reads half of it."""
         try:
             os.makedirs(self.data_dir, exist_ok=True)
-            with open(self.config_file, 'w') as f:
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump({
-                    'points': self.points_config
+                    'points': self.points_config,
+                    'idle': self.idle_config
                 }, f, indent=4)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"Error saving config: {e}")
 
-    def update_points(self, category: str, minutes: int):
-        """Update points based on time spent in a category."""
+    def record_session(self, app_name: str, category: str, start_time: datetime, end_time: datetime) -> int:
+        """Award points for a finished activity session and store it. Returns the points delta.
+
+        Points are awarded per whole minute. The seconds left over are carried
+        to the next session in the same category, so many short sessions add
+        up to what one long session would have earned.
+        """
+        seconds = self._carried_seconds.get(category, 0.0) + max(0.0, (end_time - start_time).total_seconds())
+        minutes = int(seconds // 60)
+        self._carried_seconds[category] = seconds - minutes * 60
+        delta = self.update_points(category, minutes) if minutes else 0
+        try:
+            self.activity_store.record_session(app_name, category, start_time, end_time, delta)
+        except Exception as e:
+            print(f"Error recording activity session: {e}")
+        return delta
+
+    def update_points(self, category: str, minutes: int) -> int:
+        """Update points based on time spent in a category. Returns the points delta."""
+        points = self.current_points
         if category == "productive":
-            points = minutes * self.points_config["productive_points_per_minute"]
-            self.current_points += points
+            points += minutes * self.points_config["productive_points_per_minute"]
         elif category == "entertainment":
-            points = minutes * self.points_config["entertainment_points_per_minute"]
-            self.current_points -= points
+            points -= minutes * self.points_config["entertainment_points_per_minute"]
         
         # Ensure points don't go below 0
-        self.current_points = max(0, self.current_points)
+        points = max(0, points)
+        
+        event = {
+            'category': category,
+            'minutes': minutes,
+            'delta': points - self.current_points,
+            'timestamp': self.clock().isoformat()
+        }
+        self._apply_event(event)
+        
+        try:
+            self.ledger.append(event)
+            metrics.inc("point_system.ledger_appends")
+            if self.ledger.should_compact():
+                self.save_data()
+        except Exception as e:
+            print(f"Error saving user data: {e}")
+        return event['delta']
+
+    def _apply_event(self, event: dict):
+        """Apply one ledger event to the in-memory balance and streak."""
+        self.current_points = max(0, self.current_points + event['delta'])
         
         # Update streak
-        if category == "productive":
-            self.current_streak += minutes
+        if event['category'] == "productive":
+            self.current_streak += event['minutes']
         else:
             self.current_streak = 0
         
-        self.save_data()
+        for listener in self._listeners:
+            listener()
+
+    def add_listener(self, listener):
+        """Call listener after every change to points or streak."""
+        self._listeners.append(listener)
 
     def get_points(self) -> int:
         """Get current points."""
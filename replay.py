@@ -0,0 +1,178 @@
+"""Replay a recorded activity trace through categorization and accounting.
+
+Traces are recorded by the daemon (python daemon.py --record-trace FILE).
+Replays run on a virtual clock against a throwaway copy of the point data,
+so weeks of activity take seconds and never touch the real balance:
+
+    python replay.py trace.gb2t
+    python replay.py trace.gb2t --speed 1000
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from point_system import PointSystem
+from utils.app_categorizer import AppCategorizer
+from activity_tracker import ActivityTracker
+from utils.virtual_clock import VirtualClock
+from utils.trace import read_trace, trace_start, PROCESS_STARTED, PROCESS_EXITED, POINTS, IDLE, ACTIVE
+from utils.window_snapshot import FOCUS_CHANGED
+
+
+class ReplayController:
+    """Stands in for AppController: follows the recorded process table and records blocks."""
+
+    def __init__(self):
+        self.processes: Dict[int, str] = {}
+        self.blocked_apps = set()
+        self.blocks = 0
+
+    def apply(self, event):
+        """Update the process table from a process event."""
+        if event.kind == PROCESS_STARTED:
+            self.processes[event.pid] = event.name.lower()
+        else:
+            self.processes.pop(event.pid, None)
+
+    def block_app(self, app_name: str) -> bool:
+        app_name = app_name.lower()
+        if app_name in self.blocked_apps:
+            return False
+        self.blocked_apps.add(app_name)
+        self.blocks += 1
+        return True
+
+    def is_app_blocked(self, app_name: str) -> bool:
+        return app_name.lower() in self.blocked_apps
+
+    def get_running_apps(self) -> dict:
+        running_apps = {}
+        for pid, name in self.processes.items():
+            running_apps.setdefault(name, {'pid': pid, 'is_blocked': name in self.blocked_apps})
+        return running_apps
+
+
+class ReplayResult(NamedTuple):
+    """Outcome of one replay."""
+    events: int
+    virtual_seconds: float
+    wall_seconds: float
+    points: int
+    recorded_points: Optional[int]
+    mismatches: int
+    blocked_apps: List[str]
+
+    @property
+    def speedup(self) -> float:
+        return self.virtual_seconds / self.wall_seconds if self.wall_seconds else float('inf')
+
+
+class TraceReplayer:
+    """Drives ActivityTracker and PointSystem from a trace on a virtual clock.
+
+    Foreground changes are fed to the tracker exactly as the daemon feeds
+    live ones; other window events only describe the desktop and are skipped. The affordability check runs after process starts and after
+    spending, the only points where it can block anything, rather than
+    once per virtual second. Idle periods suspend accounting from the
+    moment the user left, as they did live. Balances recorded in the trace
+    are compared with the replayed balance as they go by.
+    """
+
+    def __init__(self, trace_file: str, config_file: str = os.path.join("data", "config.json"),
+                 app_categorizer: Optional[AppCategorizer] = None):
+        self.trace_file = trace_file
+        self.config_file = config_file
+        self.app_categorizer = app_categorizer or AppCategorizer()
+
+    def run(self, speed: Optional[float] = None) -> ReplayResult:
+        """Replay the whole trace, as fast as possible or paced at speed times real time."""
+        start = trace_start(self.trace_file)
+        clock = VirtualClock(start)
+        controller = ReplayController()
+        events = 0
+        recorded_points = None
+        mismatches = 0
+        seeded = False
+
+        with tempfile.TemporaryDirectory() as workdir:
+            if os.path.exists(self.config_file):
+                shutil.copy(self.config_file, os.path.join(workdir, "config.json"))
+            point_system = PointSystem(data_dir=workdir, clock=clock.now)
+            tracker = ActivityTracker(
+                point_system, self.app_categorizer, controller, clock=clock.now, monotonic=clock.monotonic
+            )
+
+            started = time.perf_counter()
+            for event in read_trace(self.trace_file):
+                if speed:
+                    delay = (event.timestamp - start) / speed - (time.perf_counter() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+                clock.set(event.timestamp)
+                events += 1
+
+                if event.kind == POINTS:
+                    # The first balance is the starting point; later ones are checkpoints
+                    if not seeded:
+                        point_system.current_points = event.value
+                        seeded = True
+                    elif point_system.get_points() != event.value:
+                        mismatches += 1
+                    recorded_points = event.value
+                elif event.kind in (IDLE, ACTIVE):
+                    at = datetime.fromtimestamp(event.timestamp - event.value / 1000)
+                    if event.kind == IDLE:
+                        tracker.suspend(at)
+                    else:
+                        tracker.resume(at)
+                elif event.kind in (PROCESS_STARTED, PROCESS_EXITED):
+                    controller.apply(event)
+                    if event.kind == PROCESS_STARTED:
+                        tracker.check_entertainment()
+                elif event.kind == FOCUS_CHANGED:
+                    seeded = True
+                    points = point_system.get_points()
+                    # Charge up to when the change was seen, as the daemon did, even if
+                    # a record handled before it came later
+                    tracker.handle_window_change({
+                        'process_name': event.name,
+                        'window_title': event.title,
+                        'executable_path': event.exe
+                    } if event.hwnd else None, clock.monotonic() - (clock.time() - event.timestamp))
+                    if point_system.get_points() < points:
+                        tracker.check_entertainment()
+            wall_seconds = time.perf_counter() - started
+
+            points = point_system.get_points()
+            point_system.close()
+
+        return ReplayResult(
+            events, clock.time() - start, wall_seconds, points, recorded_points, mismatches,
+            sorted(controller.blocked_apps)
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a GetB@ck2Work activity trace")
+    parser.add_argument("trace", help="Trace file recorded by the daemon")
+    parser.add_argument("--speed", type=float, help="Pace the replay at this multiple of real time")
+    parser.add_argument("--config", default=os.path.join("data", "config.json"), help="Point rates to replay with")
+    options = parser.parse_args(argv)
+
+    result = TraceReplayer(options.trace, options.config).run(options.speed)
+    print(f"Replayed {result.events} events covering {result.virtual_seconds / 3600:.1f} h "
+          f"in {result.wall_seconds:.2f} s ({result.speedup:,.0f}x)")
+    print(f"Points: {result.points} replayed, {result.recorded_points} recorded, "
+          f"{result.mismatches} mismatched checkpoints")
+    if result.blocked_apps:
+        print(f"Blocked: {', '.join(result.blocked_apps)}")
+    return 1 if result.mismatches or (result.recorded_points is not None and result.points != result.recorded_points) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+import pytest
+
+from app_controller import AppController
+
+
+def test_protected_apps_cannot_be_blocked():
+    controller = AppController(point_system=None)
+    with pytest.raises(ValueError, match="protected"):
+        controller.block_app("Explorer.exe")
+    assert controller.blocked_apps == set()
@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+import pytest
+
+from activity_tracker import ActivityTracker
+from point_system import PointSystem
+from utils.app_categorizer import AppCategorizer
+from utils.virtual_clock import VirtualClock
+
+START = 1_767_600_000.0
+
+
+class Controller:
+    """Records blocks instead of terminating anything."""
+
+    def __init__(self):
+        self.blocked_apps = set()
+
+    def block_app(self, app_name: str) -> bool:
+        self.blocked_apps.add(app_name)
+        return True
+
+    def is_app_blocked(self, app_name: str) -> bool:
+        return app_name in self.blocked_apps
+
+    def get_running_apps(self) -> dict:
+        return {}
+
+
+class Setup:
+    def __init__(self, data_dir: str):
+        self.clock = VirtualClock(START)
+        self.points = PointSystem(data_dir=data_dir, clock=self.clock.now)
+        self.points.current_points = 100
+        self.sessions = []
+        record_session = self.points.record_session
+
+        def spy(app_name, category, start_time, end_time):
+            self.sessions.append((app_name, category, (end_time - start_time).total_seconds()))
+            return record_session(app_name, category, start_time, end_time)
+
+        self.points.record_session = spy
+        categorizer = AppCategorizer()
+        categorizer.update_categories(["code.exe"], ["steam.exe"])
+        self.controller = Controller()
+        self.tracker = ActivityTracker(
+            self.points, categorizer, self.controller, clock=self.clock.now, monotonic=self.clock.monotonic
+        )
+
+    def focus(self, process_name, title="window"):
+        return self.tracker.handle_window_change(
+            {'process_name': process_name, 'window_title': title} if process_name else None
+        )
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    setup = Setup(str(tmp_path))
+    yield setup
+    setup.points.close()
+
+
+def test_dwell_is_charged_for_its_exact_seconds(setup):
+    setup.focus("code.exe")
+    setup.clock.advance(75.5)
+    setup.focus(None)
+    assert setup.sessions == [("code.exe", "productive", 75.5)]
+    assert setup.points.get_points() == 101
+    assert setup.points._carried_seconds["productive"] == pytest.approx(15.5)
+
+
+@pytest.mark.parametrize("process_name, title", [
+    ("explorer.exe", "Downloads"),        # protected
+    ("python", "GetB@ck2Work - Stats"),   # our own window
+])
+def test_untracked_window_ends_the_previous_dwell(setup, process_name, title):
+    setup.focus("code.exe")
+    setup.clock.advance(30)
+    assert not setup.focus(process_name, title)
+    setup.clock.advance(100)
+    setup.focus("code.exe")
+    assert setup.sessions == [("code.exe", "productive", 30)]
+
+
+def test_blocked_window_ends_the_previous_dwell(setup):
+    setup.points.current_points = 0
+    setup.focus("code.exe")
+    setup.clock.advance(30)
+    assert not setup.focus("steam.exe")
+    assert setup.controller.blocked_apps == {"steam.exe"}
+    setup.clock.advance(100)
+    setup.focus(None)
+    assert setup.sessions == [("code.exe", "productive", 30)]
+
+
+def test_suspend_cuts_at_the_last_input_and_resume_restarts(setup):
+    setup.focus("code.exe")
+    setup.clock.advance(100)
+    # The user last touched the keyboard 60 seconds ago
+    setup.tracker.suspend(setup.clock.now() - timedelta(seconds=60))
+    assert setup.sessions == [("code.exe", "productive", 40)]
+
+    setup.clock.advance(200)
+    setup.tracker.resume(setup.clock.now())
+    setup.clock.advance(20)
+    setup.focus(None)
+    assert setup.sessions == [("code.exe", "productive", 40), ("code.exe", "productive", 20)]
+
+
+def test_changes_while_suspended_are_not_charged(setup):
+    setup.focus("code.exe")
+    setup.tracker.suspend(setup.clock.now())
+    setup.clock.advance(300)
+    setup.focus("code.exe", "other file")
+    setup.clock.advance(300)
+    setup.focus(None)
+    assert setup.sessions == []
+
+
+def test_short_sessions_carry_up_to_whole_minutes(setup):
+    earned = []
+    for _ in range(4):
+        setup.focus("code.exe")
+        setup.clock.advance(45)
+        setup.focus(None)
+        earned.append(setup.points.get_points() - 100)
+    # 45, 90, 135 and 180 seconds focused in total
+    assert earned == [0, 1, 2, 3]
+    assert setup.points._carried_seconds["productive"] == pytest.approx(0)
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+
+from utils.adaptive_scheduler import AdaptiveScheduler
+from utils.idle_source import FakeIdleSource, IdleMonitor
+
+START = datetime(2026, 1, 5, 9, 0)
+
+
+class Clock:
+    """One instant read as seconds by the idle source and as a datetime by the monitor."""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def advance(self, seconds: float):
+        self.seconds += seconds
+
+    def monotonic(self) -> float:
+        return self.seconds
+
+    def now(self) -> datetime:
+        return START + timedelta(seconds=self.seconds)
+
+
+def monitor(threshold=300.0):
+    clock = Clock()
+    source = FakeIdleSource(clock.monotonic)
+    events = []
+    idle_monitor = IdleMonitor(
+        source, threshold,
+        on_idle=lambda since: events.append(("idle", since)),
+        on_active=lambda at: events.append(("active", at)),
+        clock=clock.now
+    )
+    return clock, source, idle_monitor, events
+
+
+def test_crossing_the_threshold_reports_the_last_input():
+    clock, source, idle_monitor, events = monitor()
+    clock.advance(10)
+    source.touch()
+    clock.advance(299)
+    idle_monitor.check()
+    assert events == []
+    clock.advance(5)
+    idle_monitor.check()
+    assert events == [("idle", START + timedelta(seconds=10))]
+    assert idle_monitor.idle
+
+
+def test_locking_is_idle_at_once():
+    clock, source, idle_monitor, events = monitor()
+    clock.advance(20)
+    source.lock()
+    idle_monitor.check()
+    assert events == [("idle", START + timedelta(seconds=20))]
+
+
+def test_input_reports_active():
+    clock, source, idle_monitor, events = monitor()
+    clock.advance(400)
+    idle_monitor.check()
+    clock.advance(30)
+    source.touch()
+    clock.advance(0.5)
+    delay = idle_monitor.check()
+    assert events[-1] == ("active", START + timedelta(seconds=430))
+    assert not idle_monitor.idle
+    assert delay > idle_monitor.idle_poll
+
+
+def test_check_waits_for_the_threshold_while_present():
+    clock, source, idle_monitor, _ = monitor(threshold=3.0)
+    assert idle_monitor.check() == 3.0
+    clock.advance(2.5)
+    assert idle_monitor.check() == 0.5
+
+
+def test_suspended_loops_skip_work_and_resume_fast():
+    scheduler = AdaptiveScheduler(cpu_clock=lambda: 0.0)
+    loop = scheduler.loop("scan", 1.0, 8.0)
+    events_loop = scheduler.loop("events", 0.1, 1.0, suspendable=False)
+    runs = []
+    for _ in range(3):
+        loop.run(lambda: runs.append("scan"))
+    assert loop.interval == 8.0
+
+    scheduler.suspend()
+    assert loop.run(lambda: runs.append("scan")) == 8.0
+    events_loop.run(lambda: runs.append("events"))
+    assert runs == ["scan"] * 3 + ["events"]
+
+    scheduler.resume()
+    assert loop.delay == loop.interval == 1.0
+    assert loop.wait(0)  # resume() woke the loop's thread
+    loop.run(lambda: runs.append("scan"))
+    assert runs[-1] == "scan"
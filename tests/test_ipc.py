@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from utils.ipc import IpcServer, IpcClient, IpcError
+
+
+def serve(tmp_path):
+    server = IpcServer(("127.0.0.1", 0), {'echo': lambda text: text}, token_path=str(tmp_path / "ipc.token"))
+    server.start()
+    return server, server.listener.getsockname()
+
+
+def call(server, client, command, **args):
+    # The server runs on the test's thread, so pump it while the client waits
+    result = {}
+
+    def run():
+        try:
+            result['value'] = client.call(command, **args)
+        except IpcError as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    while thread.is_alive():
+        server.poll(0.05)
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def test_tcp_client_authenticates_with_the_token_file(tmp_path):
+    server, address = serve(tmp_path)
+    client = IpcClient(address, token_path=str(tmp_path / "ipc.token"))
+    try:
+        assert call(server, client, "echo", text="hi") == "hi"
+    finally:
+        client.close()
+        server.close()
+    assert not (tmp_path / "ipc.token").exists()
+
+
+def test_tcp_client_without_the_token_is_refused(tmp_path):
+    server, address = serve(tmp_path)
+    (tmp_path / "stolen.token").write_text("0" * 64)
+    client = IpcClient(address, token_path=str(tmp_path / "stolen.token"))
+    try:
+        with pytest.raises(IpcError, match="Not authenticated"):
+            call(server, client, "echo", text="hi")
+    finally:
+        client.close()
+        server.close()
+
+
+def test_token_file_is_private(tmp_path):
+    server, _ = serve(tmp_path)
+    try:
+        assert (tmp_path / "ipc.token").stat().st_mode & 0o077 == 0
+    finally:
+        server.close()
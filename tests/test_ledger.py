@@ -0,0 +1,49 @@
+import json
+
+from point_system import PointSystem
+from utils.ledger import EventLedger
+
+
+def make_ledger(tmp_path):
+    return EventLedger(str(tmp_path / "ledger.jsonl"), str(tmp_path / "snapshot.json"))
+
+
+def test_replay_returns_events_after_the_snapshot(tmp_path):
+    ledger = make_ledger(tmp_path)
+    for minutes in range(3):
+        ledger.append({'minutes': minutes})
+    ledger.close()
+    events = list(make_ledger(tmp_path).replay(after_seq=1))
+    assert [event['seq'] for event in events] == [2, 3]
+
+
+def test_torn_tail_is_cut_before_the_next_append(tmp_path):
+    ledger = make_ledger(tmp_path)
+    ledger.append({'delta': 5})
+    ledger.close()
+    with open(ledger.ledger_file, 'a') as f:
+        f.write('{"delta":7,"se')  # Crash mid-append
+
+    reopened = make_ledger(tmp_path)
+    assert [event['delta'] for event in reopened.replay(0)] == [5]
+    reopened.append({'delta': 7})
+    reopened.close()
+
+    with open(ledger.ledger_file) as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line)['delta'] for line in lines] == [5, 7]
+
+
+def test_balance_survives_a_crash_with_a_torn_tail(tmp_path):
+    points = PointSystem(data_dir=str(tmp_path))
+    points.update_points("productive", 5)
+    points.close()  # Checkpoint, so nothing is left to replay
+    with open(points.ledger_file, 'a') as f:
+        f.write('{"category":"prod')  # Crash mid-append
+
+    restarted = PointSystem(data_dir=str(tmp_path))
+    assert restarted.get_points() == 5
+    restarted.update_points("productive", 7)
+    restarted.ledger.close()  # Crash again before any checkpoint
+
+    assert PointSystem(data_dir=str(tmp_path)).get_points() == 12
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from utils.app_categorizer import AppCategorizer
+from utils.rule_engine import Rule, RuleEngine, KEYWORD, GLOB, REGEX, PROCESS
+
+
+def classify(rules, title, process="app.exe"):
+    return RuleEngine(rules).classify(title, process)
+
+
+def test_keyword_glob_and_regex_rules():
+    rules = [
+        Rule("entertainment", KEYWORD, "youtube"),
+        Rule("productive", GLOB, "code*.exe", PROCESS),
+        Rule("productive", REGEX, r"pull request #\d+"),
+    ]
+    assert classify(rules, "Cats - YouTube") == "entertainment"
+    assert classify(rules, "main.py", "Code.exe") == "productive"
+    assert classify(rules, "Pull Request #42 - GitHub") == "productive"
+    assert classify(rules, "Untitled") is None
+
+
+def test_global_inline_flags_do_not_break_other_rules():
+    rules = [Rule("entertainment", REGEX, "(?i)youtube"), Rule("productive", REGEX, "jira")]
+    assert classify(rules, "YouTube") == "entertainment"
+    assert classify(rules, "JIRA board") == "productive"
+
+
+def test_rules_may_reuse_group_names():
+    rules = [Rule("productive", REGEX, "(?P<x>alpha)"), Rule("entertainment", REGEX, "(?P<x>beta)")]
+    assert classify(rules, "beta release") == "entertainment"
+    assert classify(rules, "alpha release") == "productive"
+
+
+def test_backreferences_keep_their_group_numbers():
+    rules = [Rule("productive", REGEX, "jira"), Rule("entertainment", REGEX, r"(b)\1")]
+    assert classify(rules, "bb") == "entertainment"
+    assert classify(rules, "b") is None
+
+
+def test_globs_and_plain_regexes_share_the_prefilter():
+    engine = RuleEngine([
+        Rule("entertainment", GLOB, "steam*.exe", PROCESS),
+        Rule("productive", GLOB, "code?.exe", PROCESS),
+        Rule("productive", REGEX, r"(?s:jira.board)", PROCESS),
+        Rule("entertainment", REGEX, r"(?i)game", PROCESS),
+    ])
+    patterns = engine._patterns[PROCESS]
+    assert [index for index, _ in patterns.patterns] == [0, 1, 2]
+    assert [index for index, _ in patterns.standalone] == [3]
+    assert engine.classify("", "SteamWebHelper.exe") == "entertainment"
+    assert engine.classify("", "code2.exe") == "productive"
+
+
+def test_bad_regex_names_the_rule():
+    with pytest.raises(ValueError, match="unterminated"):
+        RuleEngine([Rule("productive", REGEX, "(unterminated")])
+
+
+def test_title_rules_categorize_unlisted_apps(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    categorizer = AppCategorizer()
+    categorizer.update_categories(["code.exe"], [])
+    assert categorizer.categorize_app("Cats - YouTube", "firefox.exe", default=None) == "entertainment"
+    assert categorizer.categorize_app("main.py", "code.exe", default=None) == "productive"
+    assert categorizer.categorize_app("Inbox", "mail.exe", default=None) is None
+    assert categorizer.categorize_app("Inbox", "mail.exe") == "productive"
+
+
+def test_bad_rule_in_file_is_skipped_without_losing_categories(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    with open(tmp_path / "data" / "app_categories.json", "w") as f:
+        json.dump({
+            'productive': ["code.exe"],
+            'entertainment': ["steam.exe"],
+            'rules': [
+                {'category': "entertainment", 'kind': REGEX, 'pattern': "(broken"},
+                {'category': "entertainment", 'kind': REGEX, 'pattern': "(?i)youtube"},
+            ]
+        }, f)
+    categorizer = AppCategorizer()
+    assert categorizer.productive_apps == {"code.exe"}
+    assert categorizer.entertainment_apps == {"steam.exe"}
+    assert [rule.pattern for rule in categorizer.rules] == ["(?i)youtube"]
+
+
+def test_tracker_window_changes_are_memoized(tmp_path, monkeypatch):
+    from activity_tracker import ActivityTracker
+    from point_system import PointSystem
+    from benchmarks.fakes import FakeAppController
+    from utils.virtual_clock import VirtualClock
+
+    monkeypatch.chdir(tmp_path)
+    categorizer = AppCategorizer()
+    # The clock stands still, so no dwell is long enough to be recorded and categorized again
+    clock = VirtualClock(1_700_000_000.0)
+    points = PointSystem(data_dir=str(tmp_path), clock=clock.now)
+    points.current_points = 100
+    tracker = ActivityTracker(points, categorizer, FakeAppController(), clock=clock.now, monotonic=clock.monotonic)
+    for _ in range(3):
+        tracker.handle_window_change({'process_name': "mail.exe", 'window_title': "Inbox"})
+    assert tracker.current_category is None
+    assert (categorizer.memo_misses, categorizer.memo_hits) == (1, 2)
+
+    # A rule change starts a new generation, so the window is categorized again
+    categorizer.add_entertainment_app("mail.exe")
+    tracker.handle_window_change({'process_name': "mail.exe", 'window_title': "Inbox"})
+    assert tracker.current_category == "entertainment"
+    assert categorizer.memo_misses == 2
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import psutil
+
+from utils.termination import TerminationWorker
+
+
+def start_sleeper():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    return process, psutil.Process(process.pid).create_time()
+
+
+def test_terminates_a_matching_process():
+    process, create_time = start_sleeper()
+    result = TerminationWorker(terminate_timeout=5).terminate_batch("python", [(process.pid, create_time)])
+    assert result.terminated == [process.pid]
+    assert process.wait(timeout=5) is not None
+
+
+def test_leaves_a_reused_pid_alone():
+    process, create_time = start_sleeper()
+    try:
+        # A different create time means the pid now belongs to another process
+        result = TerminationWorker(terminate_timeout=5).terminate_batch("python", [(process.pid, create_time - 60)])
+        assert result.terminated == result.killed == result.failed == []
+        assert process.poll() is None
+    finally:
+        process.kill()
+        process.wait()
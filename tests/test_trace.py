@@ -0,0 +1,36 @@
+from utils.trace import TraceWriter, read_trace, trace_start, POINTS, PROCESS_STARTED
+from utils.window_snapshot import WindowInfo, FOCUS_CHANGED
+
+START = 1_700_000_000.0
+
+
+def test_records_round_trip(tmp_path):
+    path = str(tmp_path / "trace.bin")
+    writer = TraceWriter(path, START)
+    writer.record_points(10, START)
+    writer.record_process(PROCESS_STARTED, 42, "game.exe", START + 1.5)
+    writer.record_focus(WindowInfo(7, "Inbox", 42, "C:\\Apps\\mail.exe", "mail.exe"), START + 2)
+    writer.record_focus(None, START + 3)
+    writer.close()
+
+    events = list(read_trace(path))
+    assert trace_start(path) == START
+    assert [(event.kind, event.timestamp - START) for event in events] == [
+        (POINTS, 0), (PROCESS_STARTED, 1.5), (FOCUS_CHANGED, 2), (FOCUS_CHANGED, 3)
+    ]
+    assert events[0].value == 10
+    assert (events[1].pid, events[1].name) == (42, "game.exe")
+    assert (events[2].hwnd, events[2].title, events[2].name) == (7, "Inbox", "mail.exe")
+    assert events[3].hwnd == 0
+
+
+def test_back_dated_record_keeps_its_time(tmp_path):
+    # A focus change seen before a balance update but handled after it
+    path = str(tmp_path / "trace.bin")
+    writer = TraceWriter(path, START)
+    writer.record_points(10, START + 10)
+    writer.record_focus(None, START + 9.9)
+    writer.record_points(11, START + 10.2)
+    writer.close()
+
+    assert [round(event.timestamp - START, 3) for event in read_trace(path)] == [10, 9.9, 10.2]
@@ -0,0 +1,92 @@
+from utils.window_snapshot import (
+    WindowInfo, WindowSnapshotDiffer, OPENED, CLOSED, RETITLED, FOCUS_CHANGED
+)
+
+
+def window(hwnd, title, pid=100, name="app.exe"):
+    return WindowInfo(hwnd, title, pid, f"C:\\Apps\\{name}", name)
+
+
+def snapshot(*windows):
+    return {info.hwnd: info for info in windows}
+
+
+def kinds(deltas):
+    return sorted((delta.kind, delta.window.hwnd) for delta in deltas)
+
+
+def test_first_diff_reports_every_window_as_opened():
+    differ = WindowSnapshotDiffer()
+    deltas = differ.diff(snapshot(window(1, "a"), window(2, "b")))
+    assert kinds(deltas) == [(OPENED, 1), (OPENED, 2)]
+
+
+def test_unchanged_snapshot_yields_no_deltas():
+    differ = WindowSnapshotDiffer()
+    windows = snapshot(window(1, "a"), window(2, "b"))
+    differ.diff(windows, foreground=1)
+    assert differ.diff(dict(windows), foreground=1) == []
+
+
+def test_closed_window():
+    differ = WindowSnapshotDiffer()
+    differ.diff(snapshot(window(1, "a"), window(2, "b")))
+    deltas = differ.diff(snapshot(window(1, "a")))
+    assert kinds(deltas) == [(CLOSED, 2)]
+    assert deltas[0].window.title == "b"
+
+
+def test_retitled_window_carries_previous_title():
+    differ = WindowSnapshotDiffer()
+    differ.diff(snapshot(window(1, "Inbox")))
+    deltas = differ.diff(snapshot(window(1, "Inbox (1)")))
+    assert kinds(deltas) == [(RETITLED, 1)]
+    assert deltas[0].window.title == "Inbox (1)"
+    assert deltas[0].previous.title == "Inbox"
+
+
+def test_focus_changed_names_both_windows():
+    differ = WindowSnapshotDiffer()
+    windows = snapshot(window(1, "a"), window(2, "b"))
+    differ.diff(windows, foreground=1)
+    deltas = differ.diff(windows, foreground=2)
+    assert kinds(deltas) == [(FOCUS_CHANGED, 2)]
+    assert deltas[0].previous.hwnd == 1
+
+
+def test_focus_on_untracked_window_is_ignored():
+    differ = WindowSnapshotDiffer()
+    windows = snapshot(window(1, "a"))
+    differ.diff(windows, foreground=1)
+    assert differ.diff(windows, foreground=99) == []
+
+
+def test_focus_moving_to_a_new_window_reports_open_and_focus():
+    differ = WindowSnapshotDiffer()
+    differ.diff(snapshot(window(1, "a")), foreground=1)
+    deltas = differ.diff(snapshot(window(1, "a"), window(2, "b")), foreground=2)
+    assert kinds(deltas) == [(FOCUS_CHANGED, 2), (OPENED, 2)]
+
+
+def test_pid_reuse_on_same_hwnd_is_close_then_open():
+    differ = WindowSnapshotDiffer()
+    differ.diff(snapshot(window(1, "a", pid=100, name="old.exe")))
+    deltas = differ.diff(snapshot(window(1, "a", pid=200, name="new.exe")))
+    assert [(delta.kind, delta.window.name) for delta in deltas] == [(CLOSED, "old.exe"), (OPENED, "new.exe")]
+
+
+def test_windows_of_one_process_are_tracked_separately():
+    differ = WindowSnapshotDiffer()
+    differ.diff(snapshot(window(1, "Doc 1", pid=7), window(2, "Doc 2", pid=7)))
+    deltas = differ.diff(snapshot(window(1, "Doc 1", pid=7), window(2, "Doc 2 - edited", pid=7), window(3, "Doc 3", pid=7)))
+    assert kinds(deltas) == [(OPENED, 3), (RETITLED, 2)]
+    deltas = differ.diff(snapshot(window(2, "Doc 2 - edited", pid=7), window(3, "Doc 3", pid=7)))
+    assert kinds(deltas) == [(CLOSED, 1)]
+
+
+def test_reset_reports_everything_again():
+    differ = WindowSnapshotDiffer()
+    windows = snapshot(window(1, "a"))
+    differ.diff(windows, foreground=1)
+    differ.reset()
+    assert kinds(differ.diff(windows)) == [(OPENED, 1)]
@@ -0,0 +1,192 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    app TEXT NOT NULL,
+    category TEXT NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    minutes REAL NOT NULL,
+    points_delta INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start);
+
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT PRIMARY KEY,
+    productive_minutes REAL NOT NULL DEFAULT 0,
+    entertainment_minutes REAL NOT NULL DEFAULT 0,
+    points_earned INTEGER NOT NULL DEFAULT 0,
+    points_spent INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS hourly_rollup (
+    day TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    minutes REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, hour, category)
+);
+
+CREATE TABLE IF NOT EXISTS app_rollup (
+    day TEXT NOT NULL,
+    app TEXT NOT NULL,
+    category TEXT NOT NULL,
+    minutes REAL NOT NULL DEFAULT 0,
+    points_delta INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, app)
+);
+"""
+
+
+def _hour_segments(start: datetime, end: datetime):
+    """Split [start, end) at hour boundaries, yielding (segment start, minutes)."""
+    current = start
+    while current < end:
+        next_hour = current.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        segment_end = min(next_hour, end)
+        yield current, (segment_end - current).total_seconds() / 60
+        current = segment_end
+
+
+class ActivityStore:
+    """SQLite store of activity sessions with incrementally maintained rollups.
+
+    Every recorded session updates the per-day, per-hour and per-app rollup
+    tables in the same transaction, so stats queries read a few indexed rows
+    per day instead of scanning raw history.
+    """
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def record_session(self, app: str, category: str, start: datetime, end: datetime, points_delta: int = 0):
+        """Store one session and fold it into the rollups.
+
+        Minutes are split across the hours (and days) the session covers.
+        Points are credited to the day and app of the last minute of the session.
+        """
+        if end <= start:
+            return
+        minutes = (end - start).total_seconds() / 60
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sessions (app, category, start, end, minutes, points_delta) VALUES (?, ?, ?, ?, ?, ?)",
+                (app, category, start.timestamp(), end.timestamp(), minutes, points_delta)
+            )
+
+            for segment_start, segment_minutes in _hour_segments(start, end):
+                day = segment_start.date().isoformat()
+                self._conn.execute(
+                    "INSERT INTO hourly_rollup (day, hour, category, minutes) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (day, hour, category) DO UPDATE SET minutes = minutes + excluded.minutes",
+                    (day, segment_start.hour, category, segment_minutes)
+                )
+                self._conn.execute(
+                    "INSERT INTO daily_rollup (day, productive_minutes, entertainment_minutes) VALUES (?, ?, ?) "
+                    "ON CONFLICT (day) DO UPDATE SET "
+                    "productive_minutes = productive_minutes + excluded.productive_minutes, "
+                    "entertainment_minutes = entertainment_minutes + excluded.entertainment_minutes",
+                    (day,
+                     segment_minutes if category == "productive" else 0,
+                     segment_minutes if category == "entertainment" else 0)
+                )
+                self._conn.execute(
+                    "INSERT INTO app_rollup (day, app, category, minutes) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (day, app) DO UPDATE SET minutes = minutes + excluded.minutes, "
+                    "category = excluded.category",
+                    (day, app, category, segment_minutes)
+                )
+            end_day = day
+
+            self._conn.execute(
+                "UPDATE daily_rollup SET points_earned = points_earned + ?, points_spent = points_spent + ? "
+                "WHERE day = ?",
+                (max(points_delta, 0), max(-points_delta, 0), end_day)
+            )
+            self._conn.execute(
+                "UPDATE app_rollup SET points_delta = points_delta + ? WHERE day = ? AND app = ?",
+                (points_delta, end_day, app)
+            )
+
+    def import_daily_stats(self, daily_stats: Dict[str, Dict[str, Any]]):
+        """Seed daily rollups from the legacy user_data.json daily_stats map. Existing days are left alone."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO daily_rollup "
+                "(day, productive_minutes, entertainment_minutes, points_earned, points_spent) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (day,
+                     stats.get('productive_minutes', 0),
+                     stats.get('entertainment_minutes', 0),
+                     stats.get('points_earned', 0),
+                     stats.get('points_spent', 0))
+                    for day, stats in daily_stats.items()
+                ]
+            )
+
+    def daily_stats(self, start_day: str, end_day: str) -> List[Dict[str, Any]]:
+        """Get per-day totals for an inclusive range of ISO dates."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM daily_rollup WHERE day BETWEEN ? AND ? ORDER BY day",
+                (start_day, end_day)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def totals(self, start_day: str, end_day: str) -> Dict[str, float]:
+        """Get summed totals for an inclusive range of ISO dates."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(productive_minutes), 0) AS productive_minutes, "
+                "COALESCE(SUM(entertainment_minutes), 0) AS entertainment_minutes, "
+                "COALESCE(SUM(points_earned), 0) AS points_earned, "
+                "COALESCE(SUM(points_spent), 0) AS points_spent "
+                "FROM daily_rollup WHERE day BETWEEN ? AND ?",
+                (start_day, end_day)
+            ).fetchone()
+        return dict(row)
+
+    def hourly_profile(self, start_day: str, end_day: str) -> Dict[int, Dict[str, float]]:
+        """Get minutes per hour of day and category over a date range."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT hour, category, SUM(minutes) AS minutes FROM hourly_rollup "
+                "WHERE day BETWEEN ? AND ? GROUP BY hour, category",
+                (start_day, end_day)
+            ).fetchall()
+        profile: Dict[int, Dict[str, float]] = {}
+        for row in rows:
+            profile.setdefault(row['hour'], {})[row['category']] = row['minutes']
+        return profile
+
+    def top_apps(self, start_day: str, end_day: str, limit: int = 10, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the apps with the most minutes over a date range."""
+        query = ("SELECT app, category, SUM(minutes) AS minutes, SUM(points_delta) AS points_delta "
+                 "FROM app_rollup WHERE day BETWEEN ? AND ?")
+        params: List[Any] = [start_day, end_day]
+        if category:
+            query += " AND category = ?"
+            params.append(category)
+        query += " GROUP BY app ORDER BY minutes DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
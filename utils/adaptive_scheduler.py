@@ -0,0 +1,191 @@
+import time
+import threading
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from utils.metrics import metrics
+
+# A loop over budget waits at most this many times its backed-off interval
+MAX_STRETCH = 4.0
+
+
+class PollingLoop:
+    """Interval state for one polling loop.
+
+    Each pass reports whether it saw a change. While nothing changes the
+    interval doubles, up to max_interval; a change or a wake() drops it back
+    to min_interval. The delay actually used is the interval stretched by
+    the scheduler when the loops together are over their CPU budget.
+    While the scheduler is suspended, suspendable loops skip their work.
+    """
+
+    def __init__(self, scheduler: "AdaptiveScheduler", name: str,
+                 min_interval: float, max_interval: float, backoff: float = 2.0,
+                 suspendable: bool = True):
+        self.scheduler = scheduler
+        self.name = name
+        self.backoff = backoff
+        self.suspendable = suspendable
+        self.set_range(min_interval, max_interval)
+        self.runs = 0
+        self.changes = 0
+        self._wake = threading.Event()
+
+    def set_range(self, min_interval: float, max_interval: float):
+        """Change the interval bounds and restart at the fast end."""
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = min_interval
+        self.delay = min_interval
+
+    @property
+    def delay_ms(self) -> int:
+        return int(self.delay * 1000)
+
+    @property
+    def suspended(self) -> bool:
+        return self.suspendable and self.scheduler.suspended
+
+    def run(self, work: Callable[[], bool]) -> float:
+        """Run one pass of work, which returns True if it saw a change, and get the delay before the next."""
+        if self.suspended:
+            self.delay = self.max_interval
+            return self.delay
+        changed = False
+        started = self.scheduler.cpu_clock()
+        try:
+            changed = bool(work())
+        finally:
+            self.scheduler.record(self.scheduler.cpu_clock() - started)
+            self.runs += 1
+            if changed:
+                self.changes += 1
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+            self.delay = self.interval * self.scheduler.stretch()
+        return self.delay
+
+    def wake(self):
+        """Snap back to the fast interval and cut a thread's current wait short."""
+        self.interval = self.min_interval
+        self.delay = self.min_interval
+        self._wake.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep for the current delay on a loop thread, or until woken while suspended. Returns True if woken early."""
+        if timeout is None:
+            timeout = None if self.suspended else self.delay
+        woken = self._wake.wait(timeout)
+        if woken:
+            self._wake.clear()
+        return woken
+
+    def park(self):
+        """Sleep on a loop thread until woken, for a loop that has nothing to do."""
+        self._wake.wait()
+        self._wake.clear()
+
+    def stats(self) -> dict:
+        return {
+            'interval': round(self.interval, 3),
+            'delay': round(self.delay, 3),
+            'runs': self.runs,
+            'changes': self.changes
+        }
+
+
+class AdaptiveScheduler:
+    """Paces every polling loop in the process against one CPU budget.
+
+    The loops report the CPU time each pass used. When the total over the
+    last window seconds is above cpu_budget (a fraction of one core), every
+    loop's delay is stretched in proportion, so a machine with a huge
+    process table polls less often instead of using more power. suspend()
+    parks the loops while the user is away and resume() restarts them on
+    their fast intervals.
+    """
+
+    def __init__(self, cpu_budget: float = 0.01, window: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 cpu_clock: Callable[[], float] = time.thread_time):
+        self.cpu_budget = cpu_budget
+        self.window = window
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.loops: Dict[str, PollingLoop] = {}
+        self._samples = deque()  # (timestamp, cpu seconds)
+        self._busy = 0.0
+        self._lock = threading.Lock()
+        self._suspended = threading.Event()
+        metrics.register_collector("scheduler", self.stats)
+
+    def loop(self, name: str, min_interval: float, max_interval: float, backoff: float = 2.0,
+             suspendable: bool = True) -> PollingLoop:
+        """Create a polling loop, replacing any earlier loop with the same name."""
+        loop = PollingLoop(self, name, min_interval, max_interval, backoff, suspendable)
+        self.loops[name] = loop
+        return loop
+
+    def wake(self, *names: str):
+        """Snap the named loops back to fast polling."""
+        for name in names:
+            loop = self.loops.get(name)
+            if loop:
+                loop.wake()
+
+    def wake_all(self):
+        """Snap every loop back to fast polling."""
+        for loop in list(self.loops.values()):
+            loop.wake()
+
+    @property
+    def suspended(self) -> bool:
+        return self._suspended.is_set()
+
+    def suspend(self):
+        """Park the suspendable loops until resume()."""
+        self._suspended.set()
+
+    def resume(self):
+        """Restart the loops on their fast intervals."""
+        if self._suspended.is_set():
+            self._suspended.clear()
+            self.wake_all()
+
+    def record(self, busy: float):
+        """Count CPU seconds spent by one pass of a loop."""
+        now = self.clock()
+        with self._lock:
+            self._samples.append((now, busy))
+            self._busy += busy
+            self._expire(now)
+
+    def _expire(self, now: float):
+        while self._samples and now - self._samples[0][0] > self.window:
+            self._busy -= self._samples.popleft()[1]
+
+    def cpu_usage(self) -> float:
+        """Get the share of one core the loops used over the last window."""
+        with self._lock:
+            self._expire(self.clock())
+            return max(0.0, self._busy) / self.window
+
+    def stretch(self) -> float:
+        """Get the factor delays are multiplied by to stay within the CPU budget."""
+        usage = self.cpu_usage()
+        if usage <= self.cpu_budget:
+            return 1.0
+        return min(usage / self.cpu_budget, MAX_STRETCH)
+
+    def stats(self) -> dict:
+        return {
+            'cpu_usage': round(self.cpu_usage(), 5),
+            'cpu_budget': self.cpu_budget,
+            'suspended': self.suspended,
+            'loops': {name: loop.stats() for name, loop in list(self.loops.items())}
+        }
+
+
+# Shared by every monitor loop so they answer to one budget
+scheduler = AdaptiveScheduler()
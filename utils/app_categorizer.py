@@ -1,6 +1,30 @@
 import os
 import json
-from typing import Dict, List, Set, Tuple, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Set, Tuple, Optional
+
+from utils.rule_engine import Rule, RuleEngine, KEYWORD, compile_rule
+from utils.metrics import metrics
+
+# Title keywords used when the categories file defines no rules of its own
+DEFAULT_TITLE_RULES = [
+    Rule("entertainment", KEYWORD, keyword)
+    for keyword in (
+        "game", "youtube", "netflix", "spotify", "music", "movie",
+        "facebook", "instagram", "twitter", "tiktok", "reddit"
+    )
+]
+
+# Marks a categorize_app key missing from the memo
+_UNSEEN = object()
+
+class CategorySet(NamedTuple):
+    """Everything categorization reads, swapped in as one object."""
+    productive_apps: Set[str]
+    entertainment_apps: Set[str]
+    rules: List[Rule]
+    rule_engine: RuleEngine
 
 class AppCategorizer:
     def __init__(self):
@@ -8,20 +32,81 @@ class AppCategorizer:
         self.categories_file = os.path.join(self.data_dir, "app_categories.json")
         
         # Initialize categories
-        self.productive_apps = set()
-        self.entertainment_apps = set()
+        self.category_set = CategorySet(set(), set(), list(DEFAULT_TITLE_RULES), RuleEngine(DEFAULT_TITLE_RULES))
+        
+        # Memo of categorize_app results, invalidated whenever the rules change
+        self.rule_generation = 0
+        self.memo_size = 4096
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self._memo = OrderedDict()
+        self._memo_generation = 0
+        self._memo_lock = threading.Lock()
+        
+        metrics.register_collector("app_categorizer.memo", self.memo_stats)
         
         # Load existing categories
         self.load_categories()
 
+    # Category state lives in one CategorySet so a reload can replace it in a single assignment
+    @property
+    def productive_apps(self) -> Set[str]:
+        return self.category_set.productive_apps
+
+    @productive_apps.setter
+    def productive_apps(self, apps: Set[str]):
+        self.category_set = self.category_set._replace(productive_apps=apps)
+
+    @property
+    def entertainment_apps(self) -> Set[str]:
+        return self.category_set.entertainment_apps
+
+    @entertainment_apps.setter
+    def entertainment_apps(self, apps: Set[str]):
+        self.category_set = self.category_set._replace(entertainment_apps=apps)
+
+    @property
+    def rules(self) -> List[Rule]:
+        return self.category_set.rules
+
+    @property
+    def rule_engine(self) -> RuleEngine:
+        return self.category_set.rule_engine
+
+    def _read_categories(self) -> Optional[CategorySet]:
+        """Parse the categories file and compile its rules, or return None if there is no file."""
+        if not os.path.exists(self.categories_file):
+            return None
+        with open(self.categories_file, 'r') as f:
+            data = json.load(f)
+        rules = self._parse_rules(data['rules']) if 'rules' in data else list(DEFAULT_TITLE_RULES)
+        return CategorySet(
+            {app.lower() for app in data.get('productive', [])},
+            {app.lower() for app in data.get('entertainment', [])},
+            rules,
+            RuleEngine(rules)
+        )
+
+    @staticmethod
+    def _parse_rules(entries: List[dict]) -> List[Rule]:
+        """Build rules from their JSON form, skipping any that are malformed or do not compile."""
+        rules = []
+        for entry in entries:
+            try:
+                rule = Rule.from_dict(entry)
+                compile_rule(rule)
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Skipping invalid categorization rule {entry!r}: {e}")
+                continue
+            rules.append(rule)
+        return rules
+
     def load_categories(self):
         """Load app categories from file."""
         try:
-            if os.path.exists(self.categories_file):
-                with open(self.categories_file, 'r') as f:
-                    data = json.load(f)
-                    self.productive_apps = set(data.get('productive', []))
-                    self.entertainment_apps = set(data.get('entertainment', []))
+            category_set = self._read_categories()
+            if category_set is not None:
+                self.category_set = category_set
             else:
                 # Create default categories if file doesn't exist
                 self.productive_apps = {
@@ -38,16 +123,38 @@ class AppCategorizer:
             # Initialize with empty sets if loading fails
             self.productive_apps = set()
             self.entertainment_apps = set()
+        self._rules_changed()
+
+    def reload_categories(self) -> bool:
+        """Re-read the categories file and swap the new rules in atomically.
+
+        Parsing and compiling happen before the swap, so a classification
+        running concurrently sees either the old rules or the new ones. A
+        file that fails to parse leaves the current rules in place.
+        """
+        try:
+            category_set = self._read_categories()
+        except Exception as e:
+            print(f"Error reloading categories, keeping current rules: {e}")
+            return False
+        if category_set is None:
+            return False
+        self.category_set = category_set
+        self._rules_changed()
+        return True
 
     def save_categories(self):
-        """Save app categories to file."""
+        """Save app categories to file, replacing the old file atomically so the config watcher never reads half of it."""
         try:
             os.makedirs(self.data_dir, exist_ok=True)
-            with open(self.categories_file, 'w') as f:
+            tmp_file = self.categories_file + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump({
                     'productive': list(self.productive_apps),
-                    'entertainment': list(self.entertainment_apps)
+                    'entertainment': list(self.entertainment_apps),
+                    'rules': [rule.to_dict() for rule in self.rules]
                 }, f, indent=4)
+            os.replace(tmp_file, self.categories_file)
         except Exception as e:
             print(f"Error saving categories: {e}")
 
@@ -56,10 +163,24 @@ class AppCategorizer:
         # Convert to lowercase for case-insensitive comparison
         self.productive_apps = {app.lower() for app in productive_apps}
         self.entertainment_apps = {app.lower() for app in entertainment_apps}
+        self._rules_changed()
         
         # Save the updated categories
         self.save_categories()
 
+    def set_rules(self, rules: List[Rule], save: bool = True):
+        """Compile and install a new set of keyword, glob and regex rules. Raises ValueError for a bad pattern."""
+        # Compile before swapping so a bad rule leaves the old set in place
+        rule_engine = RuleEngine(rules)
+        self.category_set = self.category_set._replace(rules=list(rules), rule_engine=rule_engine)
+        self._rules_changed()
+        if save:
+            self.save_categories()
+
+    def get_rules(self) -> List[Rule]:
+        """Get the current rules."""
+        return list(self.rules)
+
     def get_category(self, app_name: str) -> Optional[str]:
         """Get the category of an app."""
         app_name = app_name.lower()
@@ -85,43 +206,84 @@ class AppCategorizer:
         """Check if an app is entertainment."""
         return app_name.lower() in self.entertainment_apps
 
-    def categorize_app(self, window_title: str, process_name: str) -> str:
-        """Categorize an app as productive or entertainment."""
-        process_name = process_name.lower()
+    def _rules_changed(self):
+        """Start a new rule generation so memoized results are discarded."""
+        self.rule_generation += 1
+
+    def categorize_app(self, window_title: str, process_name: str,
+                       default: Optional[str] = "productive") -> Optional[str]:
+        """Categorize a window as productive or entertainment, using the memo when possible.
+
+        Windows no app list or rule matches get default.
+        """
+        key = (process_name.lower(), window_title.strip().lower())
+        with self._memo_lock:
+            if self._memo_generation != self.rule_generation:
+                self._memo.clear()
+                self._memo_generation = self.rule_generation
+            # Untracked windows are memoized as None, so a miss needs its own marker
+            category = self._memo.get(key, _UNSEEN)
+            if category is not _UNSEEN:
+                self._memo.move_to_end(key)
+                self.memo_hits += 1
+                return category if category is not None else default
+            self.memo_misses += 1
+            generation = self._memo_generation
         
-        # Check if the process is in our known categories
-        if process_name in self.productive_apps:
-            return "productive"
-        if process_name in self.entertainment_apps:
-            return "entertainment"
+        category = self._categorize(key[1], key[0])
         
-        # Default categorization based on window title
-        entertainment_keywords = {
-            "game", "youtube", "netflix", "spotify", "music", "movie",
-            "facebook", "instagram", "twitter", "tiktok", "reddit"
-        }
+        with self._memo_lock:
+            # Drop results computed against rules that changed meanwhile
+            if generation == self.rule_generation == self._memo_generation:
+                self._memo[key] = category
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return category if category is not None else default
+
+    def memo_stats(self) -> Dict[str, int]:
+        """Get memo counters for tuning memo_size."""
+        with self._memo_lock:
+            return {
+                'size': len(self._memo),
+                'max_size': self.memo_size,
+                'hits': self.memo_hits,
+                'misses': self.memo_misses,
+                'generation': self.rule_generation
+            }
+
+    def _categorize(self, window_title: str, process_name: str) -> Optional[str]:
+        """Categorize an app without consulting the memo. Returns None if nothing matches."""
+        # Read the category state once so a concurrent reload cannot mix old and new rules
+        category_set = self.category_set
         
-        window_title = window_title.lower()
-        if any(keyword in window_title for keyword in entertainment_keywords):
+        # Check if the process is in our known categories
+        if process_name in category_set.productive_apps:
+            return "productive"
+        if process_name in category_set.entertainment_apps:
             return "entertainment"
         
-        return "productive"
+        # Score the title and process name against the compiled rules
+        return category_set.rule_engine.classify(window_title, process_name)
 
     def add_productive_app(self, app_name: str):
         """Add an app to the productive category."""
         self.productive_apps.add(app_name.lower())
+        self._rules_changed()
 
     def remove_productive_app(self, app_name: str):
         """Remove an app from the productive category."""
         self.productive_apps.discard(app_name.lower())
+        self._rules_changed()
 
     def add_entertainment_app(self, app_name: str):
         """Add an app to the entertainment category."""
         self.entertainment_apps.add(app_name.lower())
+        self._rules_changed()
 
     def remove_entertainment_app(self, app_name: str):
         """Remove an app from the entertainment category."""
         self.entertainment_apps.discard(app_name.lower())
+        self._rules_changed()
 
     def add_app(self, app_name: str, category: str, is_process: bool = True):
         """Add an app to a category."""
@@ -0,0 +1,63 @@
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class Dwell(NamedTuple):
+    """One uninterrupted stretch of focus on a window."""
+    window: Any
+    start: datetime
+    seconds: float
+
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(seconds=self.seconds)
+
+
+class DwellTracker:
+    """Measures how long each foreground window keeps focus.
+
+    Durations come from a monotonic clock, so a wall clock change while a
+    window has focus cannot stretch or shrink what is charged for it. The
+    wall clock only dates the start of each dwell. Instants passed in as
+    'at' are readings of the monotonic clock.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic,
+                 wall_clock: Callable[[], datetime] = datetime.now):
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.window = None
+        self._started: Optional[float] = None
+        self._started_wall: Optional[datetime] = None
+
+    def start(self, window: Any, at: Optional[float] = None) -> Optional[Dwell]:
+        """Give focus to a window. Returns the dwell this ends, if any."""
+        at = self.clock() if at is None else at
+        ended = self.stop(at)
+        self.window = window
+        self._started = at
+        self._started_wall = self.wall_time(at)
+        return ended
+
+    def stop(self, at: Optional[float] = None) -> Optional[Dwell]:
+        """End the current dwell without starting another. Returns it, if there was one."""
+        if self._started is None:
+            return None
+        at = self.clock() if at is None else at
+        ended = Dwell(self.window, self._started_wall, max(0.0, at - self._started))
+        self.window = None
+        self._started = self._started_wall = None
+        return ended
+
+    def elapsed(self) -> float:
+        """Get the seconds the current window has had focus so far."""
+        return self.clock() - self._started if self._started is not None else 0.0
+
+    def wall_time(self, at: float) -> datetime:
+        """Convert a monotonic reading to wall-clock time."""
+        return self.wall_clock() - timedelta(seconds=self.clock() - at)
+
+    def monotonic_time(self, when: datetime) -> float:
+        """Convert a wall-clock time to a monotonic reading."""
+        return self.clock() - (self.wall_clock() - when).total_seconds()
@@ -0,0 +1,109 @@
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional
+
+from utils.adaptive_scheduler import PollingLoop
+
+
+class Event(NamedTuple):
+    """A typed event posted by a producer thread."""
+    kind: str
+    payload: Any = None
+    key: Optional[Hashable] = None
+
+
+class EventBus:
+    """Bounded, coalescing event queue drained on the Tk thread.
+
+    Producers on any thread post events. An event posted with a key replaces
+    a pending event of the same kind and key and moves to the back of the
+    queue, so a storm of updates for one window becomes a single event. When
+    the queue is full, the oldest pending event is dropped. The Tk thread
+    dispatches at most max_per_frame events per after() callback, which
+    keeps UI latency bounded however fast events arrive. Frames are paced
+    by a polling loop, so a quiet bus backs off and a suspended one parks
+    until the scheduler resumes; events posted meanwhile are kept in order.
+    """
+
+    def __init__(self, max_pending: int = 1000, max_per_frame: int = 50):
+        self.max_pending = max_pending
+        self.max_per_frame = max_per_frame
+        self._pending: "OrderedDict[Hashable, Event]" = OrderedDict()
+        self._handlers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._root = None
+        self._loop: Optional[PollingLoop] = None
+        self.posted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.dispatched = 0
+
+    def subscribe(self, kind: str, handler: Callable[[Any], None]):
+        """Call handler with the payload of every event of this kind. Handlers run on the Tk thread."""
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def post(self, kind: str, payload: Any = None, key: Optional[Hashable] = None) -> bool:
+        """Queue an event from any thread. Returns False if it replaced a pending event."""
+        slot = (kind, key) if key is not None else next(self._sequence)
+        with self._lock:
+            self.posted += 1
+            replaced = slot in self._pending
+            if replaced:
+                self.coalesced += 1
+                self._pending.move_to_end(slot)
+            elif len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            self._pending[slot] = Event(kind, payload, key)
+        return not replaced
+
+    def pending(self) -> int:
+        """Get the number of events waiting to be dispatched."""
+        with self._lock:
+            return len(self._pending)
+
+    def drain(self, max_events: Optional[int] = None) -> int:
+        """Dispatch up to max_events pending events on the calling thread."""
+        limit = self.max_per_frame if max_events is None else max_events
+        with self._lock:
+            batch = []
+            while self._pending and len(batch) < limit:
+                batch.append(self._pending.popitem(last=False)[1])
+
+        for event in batch:
+            for handler in self._handlers.get(event.kind, ()):
+                try:
+                    handler(event.payload)
+                except Exception as e:
+                    print(f"Error handling {event.kind} event: {e}")
+        self.dispatched += len(batch)
+        return len(batch)
+
+    def attach(self, root, loop: PollingLoop):
+        """Start draining on a Tk root's event loop, paced by loop."""
+        self._root = root
+        self._loop = loop
+        root.after(loop.delay_ms, self._frame)
+
+    def _frame(self):
+        loop = self._loop
+        try:
+            loop.run(lambda: self.drain() > 0)
+        except Exception as e:
+            print(f"Error draining events: {e}")
+        # Come back immediately while a backlog remains, otherwise at the loop's delay
+        backlog = self.pending() and not loop.suspended
+        self._root.after(1 if backlog else loop.delay_ms, self._frame)
+
+    def stats(self) -> Dict[str, int]:
+        """Get bus counters."""
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'posted': self.posted,
+                'coalesced': self.coalesced,
+                'dropped': self.dropped,
+                'dispatched': self.dispatched
+            }
@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+from typing import Callable, Dict, List, Optional, Tuple
+
+# linux/inotify.h
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding that watches directories for finished writes and renames."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+
+    def add_directory(self, directory: str):
+        wd = self._add_watch(self.fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def read(self, timeout: float) -> List[str]:
+        """Wait up to timeout seconds and return the paths that changed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        paths = []
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            wd, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            name = data[offset + _INOTIFY_EVENT.size:offset + _INOTIFY_EVENT.size + length].rstrip(b"\0")
+            offset += _INOTIFY_EVENT.size + length
+            if wd in self._dirs and name:
+                paths.append(os.path.join(self._dirs[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileWatcher:
+    """Calls a handler on a background thread whenever a watched file changes.
+
+    Uses inotify on Linux and falls back to polling mtimes elsewhere. The
+    directory is watched rather than the file, so files replaced by rename
+    are picked up too. Bursts of events are coalesced for settle_time seconds
+    so a handler sees each file once it has finished being written.
+    """
+
+    def __init__(self, poll_interval: float = 1.0, settle_time: float = 0.2):
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.running = False
+        self.watch_thread = None
+        self._handlers: Dict[str, Callable[[], None]] = {}
+        self._signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._inotify = None
+
+    def watch(self, path: str, handler: Callable[[], None]):
+        """Call handler whenever path changes. Register files before start()."""
+        path = os.path.abspath(path)
+        self._handlers[path] = handler
+        self._signatures[path] = _file_signature(path)
+
+    def start(self):
+        """Start watching."""
+        if self.running:
+            return
+        if sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+                for directory in {os.path.dirname(path) for path in self._handlers}:
+                    self._inotify.add_directory(directory)
+            except (OSError, AttributeError) as e:
+                print(f"inotify unavailable, polling for file changes: {e}")
+                if self._inotify:
+                    self._inotify.close()
+                self._inotify = None
+        self.running = True
+        self.watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self.watch_thread.start()
+
+    def stop(self):
+        """Stop watching."""
+        self.running = False
+        if self.watch_thread:
+            self.watch_thread.join(timeout=2.0)
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+
+    def _watch_loop(self):
+        while self.running:
+            try:
+                changed = self._wait_for_changes()
+                if not changed:
+                    continue
+                # Let the writer finish before reading
+                time.sleep(self.settle_time)
+                if self._inotify:
+                    changed.update(path for path in self._inotify.read(0) if path in self._handlers)
+                for path in changed:
+                    self._signatures[path] = _file_signature(path)
+                    self._dispatch(path)
+            except Exception as e:
+                print(f"Error in file watcher: {e}")
+                time.sleep(self.poll_interval)
+
+    def _wait_for_changes(self) -> set:
+        if self._inotify:
+            return {path for path in self._inotify.read(self.poll_interval) if path in self._handlers}
+        time.sleep(self.poll_interval)
+        return {path for path in self._handlers if _file_signature(path) != self._signatures[path]}
+
+    def _dispatch(self, path: str):
+        try:
+            self._handlers[path]()
+        except Exception as e:
+            print(f"Error reloading {path}: {e}")
@@ -0,0 +1,163 @@
+import sys
+import time
+import ctypes
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+DESKTOP_SWITCHDESKTOP = 0x0100
+
+
+class IdleSource:
+    """Where the idle monitor learns how long the user has been away. Never idle by default."""
+
+    def idle_seconds(self) -> float:
+        """Get the seconds since the last keyboard or mouse input."""
+        return 0.0
+
+    def is_locked(self) -> bool:
+        """Check if the session is locked."""
+        return False
+
+
+class _LastInputInfo(ctypes.Structure):
+    _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+
+class Win32IdleSource(IdleSource):
+    """Reads input idle time with GetLastInputInfo and lock state with OpenInputDesktop.
+
+    Both are single calls that never walk windows or processes, so polling
+    them a few times a second costs nothing noticeable.
+    """
+
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        self.kernel32 = ctypes.windll.kernel32
+        self.user32.OpenInputDesktop.restype = ctypes.c_void_p
+        self.user32.CloseDesktop.argtypes = [ctypes.c_void_p]
+        self._info = _LastInputInfo()
+        self._info.cbSize = ctypes.sizeof(_LastInputInfo)
+
+    def idle_seconds(self) -> float:
+        if not self.user32.GetLastInputInfo(ctypes.byref(self._info)):
+            return 0.0
+        # Tick counts wrap every 49.7 days
+        return ((self.kernel32.GetTickCount() - self._info.dwTime) & 0xFFFFFFFF) / 1000
+
+    def is_locked(self) -> bool:
+        # The secure desktop shown while locked cannot be opened by user processes
+        desktop = self.user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+        if not desktop:
+            return True
+        self.user32.CloseDesktop(desktop)
+        return False
+
+
+class FakeIdleSource(IdleSource):
+    """Idle source driven by hand, for benchmarks and replays."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.last_input = clock()
+        self.locked = False
+
+    def touch(self):
+        """Register keyboard or mouse input now."""
+        self.last_input = self.clock()
+
+    def lock(self):
+        self.locked = True
+
+    def unlock(self):
+        self.locked = False
+        self.touch()
+
+    def idle_seconds(self) -> float:
+        return max(0.0, self.clock() - self.last_input)
+
+    def is_locked(self) -> bool:
+        return self.locked
+
+
+def default_idle_source() -> IdleSource:
+    """Get the idle source for this platform."""
+    if sys.platform == "win32":
+        try:
+            return Win32IdleSource()
+        except Exception as e:
+            print(f"Error opening idle detection, assuming the user is present: {e}")
+    return IdleSource()
+
+
+class IdleMonitor:
+    """Reports when the user goes idle or locks the session, and when they return.
+
+    on_idle receives the time the user was last present: their last input,
+    or the moment the lock was seen. on_active receives the time input
+    resumed. While the user is present the source is checked just often
+    enough to notice the threshold passing, and at least every lock_poll
+    seconds; while idle it is checked every idle_poll seconds, so
+    returning to the keyboard resumes tracking at once.
+    """
+
+    def __init__(self, source: IdleSource, threshold: float = 300.0,
+                 on_idle: Optional[Callable[[datetime], None]] = None,
+                 on_active: Optional[Callable[[datetime], None]] = None,
+                 idle_poll: float = 0.25, lock_poll: float = 5.0,
+                 clock: Callable[[], datetime] = datetime.now):
+        self.source = source
+        self.threshold = threshold
+        self.on_idle = on_idle
+        self.on_active = on_active
+        self.idle_poll = idle_poll
+        self.lock_poll = lock_poll
+        self.clock = clock
+        self.idle = False
+        self.running = False
+        self.monitor_thread = None
+        self._stop = threading.Event()
+
+    def check(self) -> float:
+        """Poll the source once, reporting any change. Returns the seconds until the next poll."""
+        locked = self.source.is_locked()
+        idle_for = 0.0 if locked else self.source.idle_seconds()
+        away = locked or idle_for >= self.threshold
+
+        if away and not self.idle:
+            self.idle = True
+            if self.on_idle:
+                self.on_idle(self.clock() - timedelta(seconds=idle_for))
+        elif not away and self.idle:
+            self.idle = False
+            if self.on_active:
+                self.on_active(self.clock() - timedelta(seconds=idle_for))
+
+        if self.idle:
+            return self.idle_poll
+        return max(self.idle_poll, min(self.threshold - idle_for, self.lock_poll))
+
+    def start(self):
+        """Start the monitoring thread."""
+        if self.running:
+            return
+        self.running = True
+        self._stop.clear()
+        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self.monitor_thread.start()
+
+    def stop(self):
+        """Stop the monitoring thread."""
+        self.running = False
+        self._stop.set()
+        if self.monitor_thread:
+            self.monitor_thread.join(timeout=1.0)
+
+    def _monitor_loop(self):
+        while self.running:
+            try:
+                delay = self.check()
+            except Exception as e:
+                print(f"Error checking idle state: {e}")
+                delay = self.lock_poll
+            self._stop.wait(delay)
@@ -0,0 +1,159 @@
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+INDEX_VERSION = 1
+
+
+def default_roots() -> List[Tuple[str, str]]:
+    """Get the (directory, extension) pairs that hold installed apps on Windows."""
+    return [
+        (os.environ.get('ProgramFiles', 'C:\\Program Files'), '.exe'),
+        (os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), '.exe'),
+        (os.path.join(os.environ.get('APPDATA', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'), '.lnk'),
+        (os.path.join(os.environ.get('ProgramData', ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs'), '.lnk')
+    ]
+
+
+class InstalledAppIndex:
+    """On-disk index of installed apps that refreshes incrementally.
+
+    Each directory is stored with its mtime, its matching app names and its
+    subdirectories. A refresh still stats every directory, but only lists the
+    ones whose mtime changed. Roots are scanned in parallel on a background
+    thread, and apps() can be read while a refresh is running.
+    """
+
+    def __init__(self, index_file: str, roots: Optional[Sequence[Tuple[str, str]]] = None, max_workers: int = 4):
+        self.index_file = index_file
+        self.roots = list(roots) if roots is not None else default_roots()
+        self.max_workers = max_workers
+        self._dirs: Dict[str, dict] = {}
+        self._apps: Dict[str, Set[str]] = {}  # root -> app names found so far
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self.version = 0  # Bumped whenever apps() may have changed
+        self.dirs_listed = 0
+        self.dirs_reused = 0
+        self.load()
+
+    def load(self):
+        """Load the index from disk."""
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    self._dirs = data.get('dirs', {})
+                    self._apps = {root: self._collect_apps(root) for root, _ in self.roots}
+        except Exception as e:
+            print(f"Error loading installed app index: {e}")
+            self._dirs = {}
+
+    def save(self):
+        """Save the index to disk, replacing the old file atomically."""
+        try:
+            os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+            tmp_file = self.index_file + '.tmp'
+            with self._lock:
+                data = {'version': INDEX_VERSION, 'dirs': self._dirs}
+                with open(tmp_file, 'w') as f:
+                    json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print(f"Error saving installed app index: {e}")
+
+    def apps(self) -> Set[str]:
+        """Get every app name known so far."""
+        with self._lock:
+            return set().union(*self._apps.values()) if self._apps else set()
+
+    @property
+    def is_refreshing(self) -> bool:
+        """Check if a background refresh is running."""
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+
+    def start_refresh(self) -> bool:
+        """Refresh the index on a background thread. Returns False if one is already running."""
+        if self.is_refreshing:
+            return False
+        self._refresh_thread = threading.Thread(target=self.refresh, daemon=True)
+        self._refresh_thread.start()
+        return True
+
+    def refresh(self):
+        """Refresh every root in parallel and save the index. Blocks until done."""
+        roots = [(root, ext) for root, ext in self.roots if os.path.isdir(root)]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(roots) or 1))) as pool:
+            results = list(pool.map(lambda item: self._scan_root(*item), roots))
+
+        # Counted per root so the pool threads never share a counter
+        self.dirs_listed = sum(listed for _, listed, _ in results)
+        self.dirs_reused = sum(reused for _, _, reused in results)
+        with self._lock:
+            self._dirs = {}
+            for dirs, _, _ in results:
+                self._dirs.update(dirs)
+            self._apps = {root: self._collect_apps(root) for root, _ in self.roots}
+            self.version += 1
+        self.save()
+
+    def _scan_root(self, root: str, extension: str) -> Tuple[Dict[str, dict], int, int]:
+        """Walk one root, listing only directories whose mtime changed. Returns the entries and the listed and reused counts."""
+        with self._lock:
+            previous = dict(self._dirs)
+        scanned = {}
+        listed = reused = 0
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+
+            entry = previous.get(path)
+            if entry is None or entry['mtime'] != mtime:
+                entry = self._list_directory(path, mtime, extension)
+                listed += 1
+            else:
+                reused += 1
+            scanned[path] = entry
+            stack.extend(os.path.join(path, name) for name in entry['subdirs'])
+
+            # Publish progress so readers see results before the walk ends
+            if entry['apps']:
+                with self._lock:
+                    self._apps.setdefault(root, set()).update(entry['apps'])
+                    self.version += 1
+        return scanned, listed, reused
+
+    @staticmethod
+    def _list_directory(path: str, mtime: float, extension: str) -> dict:
+        """List one directory with os.scandir."""
+        apps = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for item in entries:
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            subdirs.append(item.name)
+                        elif item.name.lower().endswith(extension):
+                            apps.append(os.path.splitext(item.name)[0].lower())
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return {'mtime': mtime, 'apps': apps, 'subdirs': subdirs}
+
+    def _collect_apps(self, root: str) -> Set[str]:
+        """Gather the app names of every indexed directory under a root."""
+        prefix = root.rstrip('\\/') + os.sep
+        apps = set()
+        for path, entry in self._dirs.items():
+            if path == root or path.startswith(prefix):
+                apps.update(entry['apps'])
+        return apps
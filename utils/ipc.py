@@ -0,0 +1,292 @@
+import os
+import hmac
+import json
+import socket
+import struct
+import secrets
+import itertools
+import selectors
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# Frames are a 4-byte big-endian length followed by compact JSON.
+# Requests are [id, command, args] and replies are [id, ok, result or error].
+# Over TCP, which any local user can reach, a connection must first send an
+# "auth" request carrying the token the daemon wrote to its token file.
+_HEADER = struct.Struct(">I")
+MAX_FRAME = 1 << 20
+TCP_FALLBACK_PORT = 47617
+
+Address = Union[str, Tuple[str, int]]
+
+
+class IpcError(Exception):
+    """Raised when a daemon command fails or the daemon cannot be reached."""
+
+
+def default_address() -> Address:
+    """Get the daemon socket path, or a localhost TCP address where Unix sockets are unavailable."""
+    if not hasattr(socket, "AF_UNIX"):
+        return ("127.0.0.1", TCP_FALLBACK_PORT)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.abspath("data")
+    return os.path.join(runtime_dir, "getback2work.sock")
+
+
+def token_file() -> str:
+    """Get the path of the TCP auth token, in a directory only the current user can read."""
+    # The profile's local app data is private to its user on Windows
+    user_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    return os.path.join(user_dir, "GetB@ck2Work", "ipc.token")
+
+
+def _write_token(path: str, token: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+
+
+def _read_token(path: str) -> str:
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError as e:
+        raise IpcError(f"Cannot read the daemon's auth token: {e}")
+
+
+def encode_frame(message: Any) -> bytes:
+    """Serialize a message into one length-prefixed frame."""
+    body = json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+def _open_socket(address: Address) -> socket.socket:
+    family = socket.AF_INET if isinstance(address, tuple) else socket.AF_UNIX
+    return socket.socket(family, socket.SOCK_STREAM)
+
+
+class _Connection:
+    """Per-client read and write buffers."""
+
+    def __init__(self, sock: socket.socket, authenticated: bool):
+        self.sock = sock
+        self.authenticated = authenticated
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+
+    def frames(self):
+        """Yield every complete frame in the read buffer."""
+        while len(self.inbox) >= _HEADER.size:
+            (length,) = _HEADER.unpack_from(self.inbox)
+            if length > MAX_FRAME:
+                raise IpcError(f"Frame of {length} bytes exceeds limit")
+            end = _HEADER.size + length
+            if len(self.inbox) < end:
+                return
+            body = bytes(self.inbox[_HEADER.size:end])
+            del self.inbox[:end]
+            yield json.loads(body)
+
+
+class IpcServer:
+    """Non-blocking request/reply server for the tracking daemon.
+
+    poll() waits for socket activity, runs the handler for each complete
+    request, and queues the replies. It is meant to be called from the
+    daemon's main loop, so handlers run on the same thread as the rest of
+    the daemon's state changes and need no locking. A Unix socket is only
+    reachable by its owner; on TCP every connection has to authenticate
+    with a token that start() writes to token_path.
+    """
+
+    def __init__(self, address: Address, handlers: Dict[str, Callable[..., Any]],
+                 token_path: Optional[str] = None):
+        self.address = address
+        self.handlers = handlers
+        self.token_path = token_path or token_file()
+        self.token: Optional[str] = None
+        self.selector = selectors.DefaultSelector()
+        self.listener = None
+        self.requests = 0
+
+    def start(self):
+        """Bind the listening socket."""
+        if not isinstance(self.address, tuple):
+            os.makedirs(os.path.dirname(self.address) or ".", exist_ok=True)
+            if os.path.exists(self.address):
+                self._remove_stale_socket()
+        self.listener = _open_socket(self.address)
+        self.listener.bind(self.address)
+        if not isinstance(self.address, tuple):
+            os.chmod(self.address, 0o600)
+        else:
+            self.token = secrets.token_hex(32)
+            _write_token(self.token_path, self.token)
+        self.listener.listen(8)
+        self.listener.setblocking(False)
+        self.selector.register(self.listener, selectors.EVENT_READ, None)
+
+    def _remove_stale_socket(self):
+        # Refuse to start over a live daemon, but clean up after a crashed one
+        probe = _open_socket(self.address)
+        try:
+            probe.connect(self.address)
+        except OSError:
+            os.unlink(self.address)
+        else:
+            raise IpcError(f"Daemon already listening on {self.address}")
+        finally:
+            probe.close()
+
+    def poll(self, timeout: float):
+        """Handle pending connections and requests, waiting up to timeout seconds."""
+        for key, events in self.selector.select(timeout):
+            if key.data is None:
+                self._accept()
+                continue
+            connection = key.data
+            try:
+                if events & selectors.EVENT_READ:
+                    self._read(connection)
+                if events & selectors.EVENT_WRITE:
+                    self._write(connection)
+            except (OSError, ValueError, IpcError) as e:
+                print(f"Error on IPC connection: {e}")
+                self._close(connection)
+
+    def _accept(self):
+        try:
+            sock, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        self.selector.register(sock, selectors.EVENT_READ, _Connection(sock, self.token is None))
+
+    def _read(self, connection: _Connection):
+        data = connection.sock.recv(65536)
+        if not data:
+            self._close(connection)
+            return
+        connection.inbox.extend(data)
+        for request in connection.frames():
+            connection.outbox.extend(encode_frame(self._dispatch(connection, request)))
+        if connection.outbox:
+            self._write(connection)
+
+    def _dispatch(self, connection: _Connection, request) -> list:
+        self.requests += 1
+        try:
+            request_id, command, args = request
+        except (TypeError, ValueError):
+            return [None, 0, "Malformed request"]
+        if not connection.authenticated:
+            token = args.get('token') if command == "auth" and isinstance(args, dict) else None
+            if isinstance(token, str) and hmac.compare_digest(token, self.token):
+                connection.authenticated = True
+                return [request_id, 1, None]
+            return [request_id, 0, "Not authenticated"]
+        handler = self.handlers.get(command)
+        if handler is None:
+            return [request_id, 0, f"Unknown command: {command}"]
+        try:
+            return [request_id, 1, handler(**(args or {}))]
+        except Exception as e:
+            return [request_id, 0, str(e)]
+
+    def _write(self, connection: _Connection):
+        sent = connection.sock.send(connection.outbox)
+        del connection.outbox[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if connection.outbox else 0)
+        self.selector.modify(connection.sock, events, connection)
+
+    def _close(self, connection: _Connection):
+        try:
+            self.selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        connection.sock.close()
+
+    def close(self):
+        """Close every connection and remove the socket file."""
+        for key in list(self.selector.get_map().values()):
+            if key.data is not None:
+                self._close(key.data)
+        if self.listener:
+            self.selector.unregister(self.listener)
+            self.listener.close()
+            self.listener = None
+            if not isinstance(self.address, tuple) and os.path.exists(self.address):
+                os.unlink(self.address)
+            if self.token is not None and os.path.exists(self.token_path):
+                os.unlink(self.token_path)
+        self.selector.close()
+
+
+class IpcClient:
+    """Blocking client for the tracking daemon."""
+
+    def __init__(self, address: Optional[Address] = None, timeout: float = 2.0,
+                 token_path: Optional[str] = None):
+        self.address = address or default_address()
+        self.timeout = timeout
+        self.token_path = token_path or token_file()
+        self._sock = None
+        self._ids = itertools.count(1)
+
+    def connect(self):
+        """Connect to the daemon."""
+        if self._sock is not None:
+            return
+        sock = _open_socket(self.address)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+        except OSError as e:
+            sock.close()
+            raise IpcError(f"Cannot reach daemon at {self.address}: {e}")
+        self._sock = sock
+        if isinstance(self.address, tuple):
+            try:
+                self.call("auth", token=_read_token(self.token_path))
+            except IpcError:
+                self.close()
+                raise
+
+    def call(self, command: str, **args) -> Any:
+        """Send a command and wait for its result."""
+        self.connect()
+        request_id = next(self._ids)
+        try:
+            self._sock.sendall(encode_frame([request_id, command, args]))
+            reply_id, ok, result = json.loads(self._recv_frame())
+        except (OSError, ValueError) as e:
+            self.close()
+            raise IpcError(f"Lost connection to daemon: {e}")
+        if reply_id != request_id:
+            self.close()
+            raise IpcError("Reply does not match request")
+        if not ok:
+            raise IpcError(result)
+        return result
+
+    def _recv_frame(self) -> bytes:
+        (length,) = _HEADER.unpack(self._recv_exact(_HEADER.size))
+        if length > MAX_FRAME:
+            raise ValueError(f"Frame of {length} bytes exceeds limit")
+        return self._recv_exact(length)
+
+    def _recv_exact(self, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("Daemon closed the connection")
+            data.extend(chunk)
+        return bytes(data)
+
+    def close(self):
+        """Close the connection."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
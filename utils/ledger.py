@@ -0,0 +1,123 @@
+import os
+import json
+import time
+from typing import Any, Callable, Dict, Iterator
+
+
+class EventLedger:
+    """Append-only JSON-lines event log with snapshot compaction.
+
+    Events are appended through a buffered file handle, so the cost of a
+    write does not depend on how much history exists. The buffer is flushed
+    every flush_every events or flush_interval seconds. compact() atomically
+    replaces the snapshot file, which records the sequence number it covers,
+    and then truncates the log. After a crash, the owner loads the snapshot
+    and replays the events that come after it.
+    """
+
+    def __init__(self,
+                 ledger_file: str,
+                 snapshot_file: str,
+                 flush_every: int = 1,
+                 flush_interval: float = 5.0,
+                 compact_every: int = 500,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ledger_file = ledger_file
+        self.snapshot_file = snapshot_file
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.compact_every = compact_every
+        self.clock = clock
+        self.seq = 0
+        self._handle = None
+        self._unflushed = 0
+        self._last_flush = clock()
+        self._since_compact = 0
+
+    def load_snapshot(self) -> Dict[str, Any]:
+        """Load the last snapshot, or an empty dict if there is none."""
+        try:
+            if os.path.exists(self.snapshot_file):
+                with open(self.snapshot_file, 'r') as f:
+                    snapshot = json.load(f)
+                self.seq = max(self.seq, snapshot.get('ledger_seq', 0))
+                return snapshot
+        except Exception as e:
+            print(f"Error loading snapshot: {e}")
+        return {}
+
+    def replay(self, after_seq: int) -> Iterator[Dict[str, Any]]:
+        """Yield logged events newer than a snapshot, cutting off a torn final line."""
+        if not os.path.exists(self.ledger_file):
+            return
+        with open(self.ledger_file, 'rb+') as f:
+            data = f.read()
+            # A crash mid-append leaves a partial last line; drop it before anything
+            # is appended, or the next event would be written onto the fragment
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                f.truncate(end)
+                data = data[:end]
+                print(f"Discarded a torn event at the end of {self.ledger_file}")
+        for line in data.decode('utf-8', errors='replace').splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            self._since_compact += 1
+            seq = event.get('seq', 0)
+            if seq > after_seq:
+                self.seq = max(self.seq, seq)
+                yield event
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """Append one event and return its sequence number."""
+        self.seq += 1
+        record = dict(event, seq=self.seq)
+        if self._handle is None:
+            os.makedirs(os.path.dirname(self.ledger_file) or '.', exist_ok=True)
+            self._handle = open(self.ledger_file, 'a')
+        self._handle.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._unflushed += 1
+        self._since_compact += 1
+
+        now = self.clock()
+        if self._unflushed >= self.flush_every or now - self._last_flush >= self.flush_interval:
+            self.flush()
+        return self.seq
+
+    def flush(self):
+        """Push buffered events to the OS."""
+        if self._handle and self._unflushed:
+            self._handle.flush()
+        self._unflushed = 0
+        self._last_flush = self.clock()
+
+    def should_compact(self) -> bool:
+        """Check if enough events have accumulated to be worth a snapshot."""
+        return self._since_compact >= self.compact_every
+
+    def compact(self, snapshot: Dict[str, Any]):
+        """Write a snapshot covering every event so far, then truncate the log."""
+        self.flush()
+        os.makedirs(os.path.dirname(self.snapshot_file) or '.', exist_ok=True)
+        tmp_file = self.snapshot_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(dict(snapshot, ledger_seq=self.seq), f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.snapshot_file)
+
+        # Events up to self.seq are now in the snapshot
+        if self._handle:
+            self._handle.close()
+            self._handle = None
+        open(self.ledger_file, 'w').close()
+        self._since_compact = 0
+
+    def close(self):
+        """Flush and close the log file."""
+        self.flush()
+        if self._handle:
+            self._handle.close()
+            self._handle = None
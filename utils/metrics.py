@@ -0,0 +1,182 @@
+import json
+import time
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Sequence
+
+# Upper bounds in milliseconds; a final bucket catches everything slower
+DEFAULT_BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.bounds = tuple(buckets_ms)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def to_dict(self) -> dict:
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["inf"]
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+
+class _Timer:
+    """Times a with-block into a histogram, counting an overrun past the loop's budget."""
+
+    __slots__ = ("metrics", "name", "budget", "started")
+
+    def __init__(self, metrics: "Metrics", name: str, budget: Optional[float]):
+        self.metrics = metrics
+        self.name = name
+        self.budget = budget
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        self.metrics.observe(self.name, elapsed)
+        if self.budget is not None and elapsed > self.budget:
+            self.metrics.inc(f"{self.name}.overruns")
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """Process-wide timers, histograms and counters.
+
+    Disabled by default. While disabled, timer() returns a shared no-op
+    context manager and inc() and observe() return after one attribute
+    check, so instrumented loops pay next to nothing. Components that
+    already keep their own counters, such as caches, register a collector
+    instead and are only read when a snapshot is taken.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.time()
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._collectors: Dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def timer(self, name: str, budget: Optional[float] = None):
+        """Time a block in seconds. A block taking longer than budget counts as an overrun."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, budget)
+
+    def observe(self, name: str, seconds: float):
+        """Record a duration in a histogram."""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds * 1000)
+
+    def inc(self, name: str, amount: int = 1):
+        """Add to a counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def register_collector(self, name: str, collect: Callable[[], dict]):
+        """Include the dict returned by collect in every snapshot."""
+        self._collectors[name] = collect
+
+    def snapshot(self) -> dict:
+        """Get every metric as plain JSON data."""
+        with self._lock:
+            histograms = {name: histogram.to_dict() for name, histogram in self._histograms.items()}
+            counters = dict(self._counters)
+        collected = {}
+        for name, collect in list(self._collectors.items()):
+            try:
+                collected[name] = collect()
+            except Exception as e:
+                collected[name] = {'error': str(e)}
+        return {
+            'enabled': self.enabled,
+            'uptime_s': round(time.time() - self.started, 1),
+            'timers': histograms,
+            'counters': counters,
+            'components': collected
+        }
+
+    def dump(self, path: str):
+        """Write a snapshot to a JSON file."""
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.snapshot(), f, indent=2)
+        except Exception as e:
+            print(f"Error writing metrics: {e}")
+
+    def serve(self, port: int = 0) -> int:
+        """Serve snapshots as JSON on localhost from a background thread. Returns the port."""
+        # Imported here: http.server pulls in email and html parsing that most runs never need
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(metrics.snapshot()).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def close(self):
+        """Stop the metrics endpoint."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Shared by every component; enabled by the entry points on request
+metrics = Metrics()
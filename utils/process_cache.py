@@ -0,0 +1,105 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+
+class ProcessAccessDenied(Exception):
+    """Raised by a resolver when a process cannot be inspected."""
+
+
+class _CacheEntry:
+    __slots__ = ('create_time', 'info', 'expires')
+
+    def __init__(self, create_time, info: Optional[Tuple[str, str]], expires: float):
+        self.create_time = create_time
+        self.info = info
+        self.expires = expires
+
+
+class ProcessInfoCache:
+    """PID -> (executable path, process name) cache.
+
+    Entries are validated against the process create time so a PID that the
+    OS has handed to a new process is never answered from a stale entry.
+    Processes that refuse inspection are remembered in a negative cache so
+    they are not re-opened on every poll.
+    """
+
+    def __init__(self,
+                 resolver: Callable[[int], str],
+                 create_time_getter: Callable[[int], Optional[float]],
+                 ttl: float = 30.0,
+                 negative_ttl: float = 60.0,
+                 max_size: int = 512,
+                 clock: Callable[[], float] = time.monotonic):
+        self.resolver = resolver
+        self.create_time_getter = create_time_getter
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self.clock = clock
+        self._entries: "OrderedDict[int, _CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.denied = 0
+
+    def lookup(self, pid: int) -> Optional[Tuple[str, str]]:
+        """Return (executable path, process name) for a pid, or None."""
+        now = self.clock()
+        create_time = self.create_time_getter(pid)
+
+        entry = self._entries.get(pid)
+        if entry is not None:
+            if entry.create_time == create_time and now < entry.expires:
+                self._entries.move_to_end(pid)
+                self.hits += 1
+                return entry.info
+            # Expired or the pid now belongs to a different process
+            del self._entries[pid]
+
+        self.misses += 1
+        try:
+            executable = self.resolver(pid)
+        except ProcessAccessDenied:
+            self.denied += 1
+            self._store(pid, _CacheEntry(create_time, None, now + self.negative_ttl))
+            return None
+        except Exception:
+            # Process exited between enumeration and lookup; nothing to cache
+            return None
+
+        info = (executable, os.path.basename(executable))
+        self._store(pid, _CacheEntry(create_time, info, now + self.ttl))
+        return info
+
+    def _store(self, pid: int, entry: _CacheEntry):
+        self._entries[pid] = entry
+        self._entries.move_to_end(pid)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, pid: Optional[int] = None):
+        """Drop one pid, or the whole cache when no pid is given."""
+        if pid is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(pid, None)
+
+    def prune(self):
+        """Remove all expired entries."""
+        now = self.clock()
+        for pid in [pid for pid, entry in self._entries.items() if entry.expires <= now]:
+            del self._entries[pid]
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters."""
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'denied': self.denied
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,145 @@
+import time
+import threading
+import psutil
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+class ProcessRecord(NamedTuple):
+    """One row of the process table."""
+    pid: int
+    name: str  # lowercased
+    ppid: Optional[int]
+    create_time: Optional[float]
+
+
+class ProcessSnapshot:
+    """An indexed, read-only view of the process table at one point in time."""
+
+    def __init__(self, records: Iterable[ProcessRecord], taken_at: float = 0.0):
+        self.taken_at = taken_at
+        self.by_pid: Dict[int, ProcessRecord] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.children: Dict[int, List[int]] = {}
+        for record in records:
+            self.by_pid[record.pid] = record
+            self.by_name.setdefault(record.name, []).append(record.pid)
+            if record.ppid is not None and record.ppid != record.pid:
+                self.children.setdefault(record.ppid, []).append(record.pid)
+
+    @classmethod
+    def capture(cls, taken_at: float = 0.0) -> "ProcessSnapshot":
+        """Walk the live process table once."""
+        return cls(iter_process_records(), taken_at)
+
+    def pids_for(self, app_name: str) -> List[int]:
+        """Get all pids running under a process name."""
+        return self.by_name.get(app_name.lower(), [])
+
+    def is_running(self, app_name: str) -> bool:
+        """Check if any process with this name is running."""
+        return app_name.lower() in self.by_name
+
+    def get(self, pid: int) -> Optional[ProcessRecord]:
+        """Get the record for a pid."""
+        return self.by_pid.get(pid)
+
+    def descendants(self, pid: int) -> List[int]:
+        """Get every live descendant of a pid, parents before children."""
+        found = []
+        seen = {pid}
+        stack = [pid]
+        while stack:
+            parent = self.by_pid.get(stack.pop())
+            for child_pid in self.children.get(parent.pid, []) if parent else []:
+                if child_pid in seen or not self._is_child_of(self.by_pid[child_pid], parent):
+                    continue
+                seen.add(child_pid)
+                found.append(child_pid)
+                stack.append(child_pid)
+        return found
+
+    def tree_pids(self, app_name: str) -> List[int]:
+        """Get every pid of an app together with all of its descendants."""
+        pids = []
+        seen = set()
+        for root_pid in self.pids_for(app_name):
+            for pid in [root_pid] + self.descendants(root_pid):
+                if pid not in seen:
+                    seen.add(pid)
+                    pids.append(pid)
+        return pids
+
+    @staticmethod
+    def _is_child_of(child: ProcessRecord, parent: ProcessRecord) -> bool:
+        """Reject stale parent pids that the OS has since reused for a newer process."""
+        if child.create_time is None or parent.create_time is None:
+            return True
+        return child.create_time >= parent.create_time
+
+    def names(self) -> List[str]:
+        """Get the distinct process names in the snapshot."""
+        return list(self.by_name)
+
+    def __len__(self) -> int:
+        return len(self.by_pid)
+
+
+def iter_process_records() -> Iterable[ProcessRecord]:
+    """Yield a ProcessRecord for every process psutil can see."""
+    for proc in psutil.process_iter(['pid', 'name', 'ppid', 'create_time']):
+        info = proc.info
+        if not info.get('name'):
+            continue
+        yield ProcessRecord(info['pid'], info['name'].lower(), info.get('ppid'), info.get('create_time'))
+
+
+class ProcessSnapshotProvider:
+    """Hands out one shared ProcessSnapshot per tick.
+
+    Every query made within max_age seconds of the last capture is answered
+    from the same snapshot, so several callers on different threads cost a
+    single walk of the process table. Readers that must never walk the
+    table themselves, such as the Tk thread, use latest() and rely on a
+    background thread calling refresh().
+    """
+
+    def __init__(self,
+                 source: Callable[[], Iterable[ProcessRecord]] = iter_process_records,
+                 max_age: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.source = source
+        self.max_age = max_age
+        self.clock = clock
+        self._snapshot: Optional[ProcessSnapshot] = None
+        self._lock = threading.Lock()
+        self.captures = 0
+
+    def get(self) -> ProcessSnapshot:
+        """Get the current snapshot, capturing a new one if it is stale."""
+        with self._lock:
+            now = self.clock()
+            if self._snapshot is None or now - self._snapshot.taken_at >= self.max_age:
+                self._capture(now)
+            return self._snapshot
+
+    def latest(self) -> ProcessSnapshot:
+        """Get the last snapshot however old it is, capturing only if there is none yet."""
+        with self._lock:
+            if self._snapshot is None:
+                self._capture(self.clock())
+            return self._snapshot
+
+    def refresh(self) -> ProcessSnapshot:
+        """Capture a new snapshot unconditionally."""
+        with self._lock:
+            self._capture(self.clock())
+            return self._snapshot
+
+    def invalidate(self):
+        """Force the next get() to capture a new snapshot."""
+        with self._lock:
+            self._snapshot = None
+
+    def _capture(self, now: float):
+        self._snapshot = ProcessSnapshot(self.source(), now)
+        self.captures += 1
@@ -0,0 +1,204 @@
+import re
+import fnmatch
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Rule kinds
+KEYWORD = "keyword"
+GLOB = "glob"
+REGEX = "regex"
+
+# Rule targets
+TITLE = "title"
+PROCESS = "process"
+
+
+class Rule(NamedTuple):
+    """A user-defined categorization rule."""
+    category: str
+    kind: str
+    pattern: str
+    target: str = TITLE
+    weight: float = 1.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Rule":
+        """Build a rule from its JSON form."""
+        kind = data.get('kind', KEYWORD)
+        target = data.get('target', TITLE)
+        if kind not in (KEYWORD, GLOB, REGEX):
+            raise ValueError(f"Invalid rule kind: {kind}")
+        if target not in (TITLE, PROCESS):
+            raise ValueError(f"Invalid rule target: {target}")
+        return cls(data['category'], kind, data['pattern'], target, float(data.get('weight', 1.0)))
+
+    def to_dict(self) -> dict:
+        """Get the JSON form of the rule."""
+        return {
+            'category': self.category,
+            'kind': self.kind,
+            'pattern': self.pattern,
+            'target': self.target,
+            'weight': self.weight
+        }
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton that finds every keyword occurrence in one pass."""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+    def add(self, keyword: str, value: int):
+        """Add a keyword that reports value when found."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._out[state] = self._out[state] + (value,)
+
+    def build(self):
+        """Compute failure links. Call once after all keywords are added."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fallback = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fallback if fallback != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def matches(self, text: str) -> Iterator[int]:
+        """Yield the value of every keyword occurrence in text."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                yield from out[state]
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+
+# Flags a pattern compiles with when it sets none of its own
+_DEFAULT_FLAGS = re.compile("", re.IGNORECASE).flags
+
+# Global inline flags such as (?i), which can repeat a default flag without changing .flags.
+# Scoped groups such as the (?s:...) fnmatch wraps globs in are valid anywhere and stay combinable.
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _is_combinable(pattern: "re.Pattern") -> bool:
+    """Check if a pattern means the same inside an alternation with others.
+
+    Groups clash on names and shift the numbers backreferences refer to,
+    and global inline flags such as (?i) are only allowed at the very start
+    of a regex, so patterns using either are matched on their own.
+    """
+    return (pattern.groups == 0 and pattern.flags == _DEFAULT_FLAGS
+            and not _GLOBAL_FLAGS.search(pattern.pattern))
+
+
+class _PatternSet:
+    """Glob and regex rules, mostly behind one combined prefilter regex.
+
+    The combined pattern answers the common "nothing matches" case in a
+    single search. Only when it hits are its individual patterns checked,
+    so every matching rule gets scored. Patterns that cannot share an
+    alternation are always checked individually.
+    """
+
+    def __init__(self, patterns: List[Tuple[int, "re.Pattern"]]):
+        self.patterns = [(index, pattern) for index, pattern in patterns if _is_combinable(pattern)]
+        self.standalone = [(index, pattern) for index, pattern in patterns if not _is_combinable(pattern)]
+        self.combined = re.compile(
+            "|".join(f"(?:{pattern.pattern})" for _, pattern in self.patterns), re.IGNORECASE
+        ) if self.patterns else None
+
+    def matches(self, text: str) -> Iterator[int]:
+        for index, pattern in self.standalone:
+            if pattern.search(text):
+                yield index
+        if self.combined is None or self.combined.search(text) is None:
+            return
+        for index, pattern in self.patterns:
+            if pattern.search(text):
+                yield index
+
+
+def compile_rule(rule: Rule) -> Optional["re.Pattern"]:
+    """Compile a glob or regex rule, or get None for a keyword rule. Raises ValueError for a bad pattern."""
+    if rule.kind == KEYWORD:
+        return None
+    if rule.kind == GLOB:
+        # Globs match the whole text, like fnmatch
+        return re.compile("\\A" + fnmatch.translate(rule.pattern.lower()), re.IGNORECASE)
+    try:
+        return re.compile(rule.pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regex {rule.pattern!r} in {rule.category} rule: {e}")
+
+
+class RuleEngine:
+    """Compiled set of keyword, glob and regex rules.
+
+    Rules are compiled once: keywords go into one Aho-Corasick automaton per
+    target, and globs and regexes into one prefiltered pattern set per
+    target. score() then makes a single pass over the title and the process
+    name and sums the weights of every matching rule by category. A pattern
+    that does not compile raises ValueError naming the rule.
+    """
+
+    def __init__(self, rules: Iterable[Rule] = ()):
+        self.rules: List[Rule] = list(rules)
+        self._keywords = {TITLE: KeywordAutomaton(), PROCESS: KeywordAutomaton()}
+        patterns: Dict[str, List[Tuple[int, "re.Pattern"]]] = {TITLE: [], PROCESS: []}
+
+        for index, rule in enumerate(self.rules):
+            if rule.kind == KEYWORD:
+                self._keywords[rule.target].add(rule.pattern.lower(), index)
+            else:
+                patterns[rule.target].append((index, compile_rule(rule)))
+
+        for automaton in self._keywords.values():
+            automaton.build()
+        self._patterns = {target: _PatternSet(items) for target, items in patterns.items()}
+
+    def score(self, window_title: str, process_name: str) -> Dict[str, float]:
+        """Get the summed rule weight per category for a window."""
+        scores: Dict[str, float] = {}
+        rules = self.rules
+        for target, text in ((TITLE, window_title.lower()), (PROCESS, process_name.lower())):
+            if not text:
+                continue
+            # Each rule counts once, however often its keyword occurs
+            matched = set(self._keywords[target].matches(text))
+            matched.update(self._patterns[target].matches(text))
+            for index in matched:
+                rule = rules[index]
+                scores[rule.category] = scores.get(rule.category, 0.0) + rule.weight
+        return scores
+
+    def classify(self, window_title: str, process_name: str) -> Optional[str]:
+        """Get the highest-scoring category, or None if no rule matched."""
+        scores = self.score(window_title, process_name)
+        if not scores:
+            return None
+        return max(scores.items(), key=lambda item: item[1])[0]
+
+    def __len__(self) -> int:
+        return len(self.rules)
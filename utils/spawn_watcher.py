@@ -0,0 +1,201 @@
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import psutil
+from typing import Callable, Iterable, Optional, Set
+
+from utils.adaptive_scheduler import PollingLoop, scheduler
+
+# Linux proc connector constants (linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+NLMSG_DONE = 3
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+PROC_EVENT_EXEC = 0x00000002
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_CN_MSG = struct.Struct("=IIIIHH")
+_PROC_EVENT_HEADER = struct.Struct("=IIQ")
+_EXEC_EVENT = struct.Struct("=II")
+
+
+class _ProcConnector:
+    """Receives exec events from the Linux netlink proc connector (needs CAP_NET_ADMIN)."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+        try:
+            self.sock.bind((os.getpid(), CN_IDX_PROC))
+            self._send_control(PROC_CN_MCAST_LISTEN)
+            self.sock.settimeout(0.5)
+        except OSError:
+            self.sock.close()
+            raise
+
+    def _send_control(self, op: int):
+        payload = struct.pack("=I", op)
+        cn_msg = _CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0) + payload
+        header = _NLMSGHDR.pack(_NLMSGHDR.size + len(cn_msg), NLMSG_DONE, 0, 0, os.getpid())
+        self.sock.send(header + cn_msg)
+
+    def poll(self) -> Iterable[int]:
+        """Block briefly and return the pids that just exec'd a new program."""
+        try:
+            data = self.sock.recv(4096)
+        except socket.timeout:
+            return []
+        pids = []
+        offset = 0
+        while offset + _NLMSGHDR.size <= len(data):
+            length = _NLMSGHDR.unpack_from(data, offset)[0]
+            if length < _NLMSGHDR.size:
+                break
+            event_offset = offset + _NLMSGHDR.size + _CN_MSG.size
+            if event_offset + _PROC_EVENT_HEADER.size + _EXEC_EVENT.size <= offset + length:
+                what = _PROC_EVENT_HEADER.unpack_from(data, event_offset)[0]
+                if what == PROC_EVENT_EXEC:
+                    pid, tgid = _EXEC_EVENT.unpack_from(data, event_offset + _PROC_EVENT_HEADER.size)
+                    if pid == tgid:  # Ignore threads
+                        pids.append(tgid)
+            offset += (length + 3) & ~3
+        return pids
+
+    def close(self):
+        try:
+            self._send_control(PROC_CN_MCAST_IGNORE)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def _list_pids() -> Set[int]:
+    """Get the current pid set as cheaply as the platform allows."""
+    if sys.platform.startswith("linux"):
+        return {int(entry) for entry in os.listdir("/proc") if entry.isdigit()}
+    return set(psutil.pids())
+
+
+class _PidSetDiff:
+    """Finds new processes by diffing successive pid sets.
+
+    Only lists pids while active() is true and the scheduler is not
+    suspended; otherwise it parks until the loop is woken and starts over
+    from a fresh pid set, so processes started meanwhile are left to the
+    full scan.
+    """
+
+    def __init__(self, loop: PollingLoop, active: Callable[[], bool],
+                 list_pids: Callable[[], Set[int]] = _list_pids):
+        self.loop = loop
+        self.active = active
+        self.list_pids = list_pids
+        self.known: Optional[Set[int]] = None
+
+    def poll(self) -> Iterable[int]:
+        if self.loop.suspended or not self.active():
+            self.known = None
+            self.loop.park()
+            return []
+        new_pids = set()
+
+        def diff() -> bool:
+            nonlocal new_pids
+            current = self.list_pids()
+            if self.known is not None:
+                new_pids = current - self.known
+            self.known = current
+            return bool(new_pids)
+
+        self.loop.run(diff)
+        self.loop.wait()
+        return new_pids
+
+    def close(self):
+        self.loop.wake()
+
+
+class SpawnWatcher:
+    """Reports newly started processes as soon as the OS makes them visible.
+
+    Uses the netlink proc connector on Linux when the process is allowed to
+    subscribe to it, and otherwise falls back to diffing the pid set every
+    poll_interval seconds. The fallback only polls while active() is true
+    and the scheduler is not suspended; call wake() when active() may have
+    become true.
+    """
+
+    def __init__(self, on_spawn: Callable[[int], None], poll_interval: float = 0.05,
+                 active: Callable[[], bool] = lambda: True):
+        self.on_spawn = on_spawn
+        self.poll_interval = poll_interval
+        self.active = active
+        self.poll_loop = scheduler.loop("spawn_watcher", poll_interval, poll_interval)
+        self.running = False
+        self.watch_thread = None
+        self.backend = None
+
+    def start(self) -> bool:
+        """Start watching. Returns False if no backend could be started."""
+        if self.running:
+            return True
+        try:
+            self.backend = self._open_backend()
+        except Exception as e:
+            print(f"Error starting spawn watcher: {e}")
+            return False
+        self.running = True
+        self.watch_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self.watch_thread.start()
+        return True
+
+    def stop(self):
+        """Stop watching."""
+        self.running = False
+        self.poll_loop.wake()
+        if self.watch_thread:
+            self.watch_thread.join(timeout=1.0)
+        if self.backend:
+            self.backend.close()
+            self.backend = None
+
+    @property
+    def backend_name(self) -> Optional[str]:
+        """Get the name of the active backend."""
+        if isinstance(self.backend, _ProcConnector):
+            return "proc_connector"
+        if isinstance(self.backend, _PidSetDiff):
+            return "pid_diff"
+        return None
+
+    @property
+    def watching(self) -> bool:
+        """Check if launches are being reported right now, suspension aside."""
+        if not self.running:
+            return False
+        return not isinstance(self.backend, _PidSetDiff) or self.active()
+
+    def wake(self):
+        """Resume polling after active() may have become true."""
+        self.poll_loop.wake()
+
+    def _open_backend(self):
+        if sys.platform.startswith("linux"):
+            try:
+                return _ProcConnector()
+            except (OSError, AttributeError):
+                pass  # Not permitted or not supported; fall back to polling
+        return _PidSetDiff(self.poll_loop, self.active)
+
+    def _watch_loop(self):
+        while self.running:
+            try:
+                for pid in self.backend.poll():
+                    self.on_spawn(pid)
+            except Exception as e:
+                print(f"Error in spawn watcher: {e}")
+                time.sleep(self.poll_interval)
@@ -0,0 +1,148 @@
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Cold start target, from launch to the first drawn frame
+STARTUP_BUDGET_MS = 1000
+
+
+class _TimedLoader:
+    """Wraps a module loader and reports how long the module took to load."""
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        # Extension modules do their work here rather than in exec_module
+        started = self._profiler.clock()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._profiler._record_create(self._name, self._profiler.clock() - started)
+
+    def exec_module(self, module):
+        self._profiler._import_started(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._import_finished(self._name)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _ImportTimer:
+    """Meta path finder that wraps the loader of every module imported after it is installed."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            spec = find_spec(fullname, path, target) if find_spec else None
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self.profiler, fullname)
+        return spec
+
+
+class StartupProfiler:
+    """Times startup phases and module imports against a cold start budget.
+
+    mark() closes the current phase, so phases tile the whole startup with
+    no gaps. When installed, an import hook records each module's total
+    and self time, excluding the modules it imports in turn. A disabled
+    profiler does nothing but return from each call, so the hooks can stay
+    in the startup path permanently.
+    """
+
+    def __init__(self, enabled: bool = False, budget_ms: float = STARTUP_BUDGET_MS,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self.started = clock()
+        self._last_mark = self.started
+        self.phases: List[tuple] = []
+        self.imports: Dict[str, List[float]] = {}  # name -> [total, self]
+        self._stack: List[list] = []  # [name, started, child time]
+        self._pending_create: Dict[str, float] = {}
+        self._timer = None
+        self.total_ms: Optional[float] = None
+
+    def install(self):
+        """Start timing imports."""
+        if self.enabled and self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall(self):
+        """Stop timing imports."""
+        if self._timer is not None:
+            sys.meta_path.remove(self._timer)
+            self._timer = None
+
+    def mark(self, phase: str):
+        """End the named phase now."""
+        if not self.enabled:
+            return
+        now = self.clock()
+        self.phases.append((phase, (now - self._last_mark) * 1000))
+        self._last_mark = now
+
+    def finish(self, phase: str = "first_frame"):
+        """End the last phase and stop timing imports."""
+        if not self.enabled:
+            return
+        self.mark(phase)
+        self.total_ms = (self._last_mark - self.started) * 1000
+        self.uninstall()
+
+    def _record_create(self, name: str, elapsed: float):
+        self._pending_create[name] = elapsed
+
+    def _import_started(self, name: str):
+        self._stack.append([name, self.clock(), 0.0])
+
+    def _import_finished(self, name: str):
+        _, started, child_time = self._stack.pop()
+        total = self.clock() - started + self._pending_create.pop(name, 0.0)
+        self.imports[name] = [total * 1000, (total - child_time) * 1000]
+        if self._stack:
+            self._stack[-1][2] += total
+
+    def report(self, top: int = 15) -> dict:
+        """Get phase timings, the slowest imports by self time, and the budget verdict."""
+        total_ms = self.total_ms if self.total_ms is not None else (self.clock() - self.started) * 1000
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        return {
+            'total_ms': round(total_ms, 1),
+            'budget_ms': self.budget_ms,
+            'over_budget': total_ms > self.budget_ms,
+            'phases': [{'phase': name, 'ms': round(ms, 1)} for name, ms in self.phases],
+            'imports': [
+                {'module': name, 'total_ms': round(times[0], 1), 'self_ms': round(times[1], 1)}
+                for name, times in slowest
+            ]
+        }
+
+    def format_report(self, top: int = 15) -> str:
+        """Get the report as a printable table."""
+        report = self.report(top)
+        verdict = "OVER BUDGET" if report['over_budget'] else "within budget"
+        lines = [f"Startup: {report['total_ms']:.1f} ms of {report['budget_ms']} ms budget ({verdict})", "Phases:"]
+        lines += [f"  {phase['phase']:<24} {phase['ms']:>8.1f} ms" for phase in report['phases']]
+        lines.append("Slowest imports (self / total):")
+        lines += [
+            f"  {item['module']:<32} {item['self_ms']:>8.1f} / {item['total_ms']:.1f} ms"
+            for item in report['imports']
+        ]
+        return "\n".join(lines)
@@ -0,0 +1,149 @@
+import threading
+import psutil
+from queue import Queue, Empty
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from utils.metrics import metrics
+
+# A process to terminate: its pid and the create time that identifies it, if known
+Target = Tuple[int, Optional[float]]
+
+
+class TerminationResult(NamedTuple):
+    """Outcome of terminating one batch of pids."""
+    app_name: str
+    terminated: List[int]  # exited after terminate()
+    killed: List[int]      # needed kill()
+    failed: List[int]      # access denied or still alive after kill()
+
+
+class TerminationWorker:
+    """Terminates processes on a background thread.
+
+    Callers submit batches of (pid, create_time) targets and return
+    immediately. The worker sends terminate to the whole batch, waits for it
+    with psutil.wait_procs up to a deadline, escalates survivors to kill, and
+    puts a TerminationResult on the results queue. A pid whose create time
+    no longer matches has been reused by an unrelated process and is left
+    alone.
+    """
+
+    def __init__(self, terminate_timeout: float = 3.0, kill_timeout: float = 1.0):
+        self.terminate_timeout = terminate_timeout
+        self.kill_timeout = kill_timeout
+        self.requests = Queue()
+        self.results = Queue()
+        self.running = False
+        self.worker_thread = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker thread."""
+        if self.running:
+            return
+        self.running = True
+        self.worker_thread = threading.Thread(target=self._run, daemon=True)
+        self.worker_thread.start()
+
+    def stop(self):
+        """Stop the worker thread."""
+        if not self.running:
+            return
+        self.running = False
+        self.requests.put(None)
+        if self.worker_thread:
+            self.worker_thread.join(timeout=1.0)
+
+    def submit(self, app_name: str, targets: Iterable[Target]) -> bool:
+        """Queue processes for termination. Returns False if they are all already pending."""
+        with self._lock:
+            batch = [(pid, create_time) for pid, create_time in targets if pid not in self._pending]
+            self._pending.update(pid for pid, _ in batch)
+        if not batch:
+            return False
+        self.start()
+        self.requests.put((app_name, batch))
+        return True
+
+    def is_pending(self, pid: int) -> bool:
+        """Check if a pid is waiting to be terminated."""
+        with self._lock:
+            return pid in self._pending
+
+    def drain_results(self) -> List[TerminationResult]:
+        """Get all results reported since the last call."""
+        results = []
+        while True:
+            try:
+                results.append(self.results.get_nowait())
+            except Empty:
+                return results
+
+    def _run(self):
+        """Worker loop."""
+        while self.running:
+            request = self.requests.get()
+            if request is None:
+                break
+            app_name, targets = request
+            try:
+                self.results.put(self.terminate_batch(app_name, targets))
+            except Exception as e:
+                print(f"Error terminating {app_name}: {e}")
+            finally:
+                with self._lock:
+                    self._pending.difference_update(pid for pid, _ in targets)
+
+    def terminate_batch(self, app_name: str, targets: List[Target]) -> TerminationResult:
+        """Terminate a batch of processes, escalating to kill. Blocks until done."""
+        with metrics.timer("termination.batch"):
+            result = self._terminate_batch(app_name, targets)
+        metrics.inc("termination.terminated", len(result.terminated))
+        metrics.inc("termination.killed", len(result.killed))
+        metrics.inc("termination.failed", len(result.failed))
+        return result
+
+    def _terminate_batch(self, app_name: str, targets: List[Target]) -> TerminationResult:
+        processes = []
+        failed = []
+        for pid, create_time in targets:
+            try:
+                process = psutil.Process(pid)
+                # psutil guards terminate() and kill() against reuse from here on
+                if create_time is not None and process.create_time() != create_time:
+                    metrics.inc("termination.reused")
+                    continue
+                process.terminate()
+                processes.append(process)
+            except psutil.NoSuchProcess:
+                continue
+            except psutil.AccessDenied:
+                failed.append(pid)
+
+        _, alive = psutil.wait_procs(processes, timeout=self.terminate_timeout)
+        survivors = {process.pid for process in alive}
+        terminated = [process.pid for process in processes if process.pid not in survivors]
+
+        killed = []
+        for process in alive:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                terminated.append(process.pid)
+                continue
+            except psutil.AccessDenied:
+                failed.append(process.pid)
+                continue
+            killed.append(process.pid)
+
+        if killed:
+            _, still_alive = psutil.wait_procs(
+                [process for process in alive if process.pid in killed],
+                timeout=self.kill_timeout
+            )
+            for process in still_alive:
+                killed.remove(process.pid)
+                failed.append(process.pid)
+
+        return TerminationResult(app_name, terminated, killed, failed)
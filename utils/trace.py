@@ -0,0 +1,202 @@
+import struct
+import threading
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional
+
+from utils.window_snapshot import WindowDelta, WindowInfo, OPENED, CLOSED, RETITLED, FOCUS_CHANGED
+
+# Event kinds beyond the window delta kinds
+PROCESS_STARTED = "process_started"
+PROCESS_EXITED = "process_exited"
+POINTS = "points"
+IDLE = "idle"
+ACTIVE = "active"
+
+TRACE_MAGIC = b"GB2T"
+TRACE_VERSION = 2  # Version 1 stored time deltas unsigned, clamping back-dated records
+_HEADER = struct.Struct(">4sBQ")  # magic, version, start time in ms
+
+# Record tags. Strings are interned: a STRING record defines the next id.
+_STRING = 0
+_WINDOW_TAGS = {OPENED: 1, CLOSED: 2, RETITLED: 3, FOCUS_CHANGED: 4}
+_PROCESS_TAGS = {PROCESS_STARTED: 5, PROCESS_EXITED: 6}
+_POINTS_TAG = 7
+_IDLE_TAGS = {IDLE: 8, ACTIVE: 9}
+_KINDS = {tag: kind for kind, tag in {**_WINDOW_TAGS, **_PROCESS_TAGS, POINTS: _POINTS_TAG, **_IDLE_TAGS}.items()}
+
+
+class TraceEvent(NamedTuple):
+    """One recorded window, process, balance or idle event.
+
+    Idle events happen at timestamp - value / 1000: the idle monitor only
+    notices the user left some time after their last input. Events come in
+    the order they were handled, so a focus change dated when it was seen
+    can be a little earlier than the record before it.
+    """
+    timestamp: float
+    kind: str
+    hwnd: int = 0
+    pid: int = 0
+    name: str = ""
+    title: str = ""
+    exe: str = ""
+    value: int = 0
+
+
+def _uvarint(value: int, out: bytearray):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    """Map a signed int onto an unsigned one, keeping small magnitudes small."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class TraceWriter:
+    """Appends events to a compact binary trace.
+
+    Each record is a one-byte tag, the signed milliseconds since the
+    previous record and varint fields. Names, titles and paths are written once and
+    referenced by id afterwards, so a long recording of a few hundred
+    windows stays small. Safe to call from the monitor threads.
+    """
+
+    def __init__(self, path: str, start_time: float):
+        self.path = path
+        self._file: Optional[BinaryIO] = open(path, 'wb')
+        self._file.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, int(start_time * 1000)))
+        self._last_ms = int(start_time * 1000)
+        self._strings: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.events = 0
+
+    def _ref(self, text: str, out: bytearray) -> int:
+        ref = self._strings.get(text)
+        if ref is None:
+            ref = self._strings[text] = len(self._strings)
+            data = text.encode('utf-8')
+            out.append(_STRING)
+            _uvarint(len(data), out)
+            out.extend(data)
+        return ref
+
+    def _write(self, tag: int, timestamp: float, fields: List, strings: List[str]):
+        out = bytearray()
+        with self._lock:
+            if self._file is None:
+                return
+            refs = [self._ref(text, out) for text in strings]
+            now_ms = int(timestamp * 1000)
+            out.append(tag)
+            _uvarint(_zigzag(now_ms - self._last_ms), out)
+            self._last_ms = now_ms
+            for value in fields + refs:
+                _uvarint(value, out)
+            self._file.write(out)
+            self.events += 1
+
+    def record_window(self, delta: WindowDelta, timestamp: float):
+        """Record a window delta."""
+        window = delta.window
+        self._write(_WINDOW_TAGS[delta.kind], timestamp, [window.hwnd, window.process_id],
+                    [window.name, window.title, window.exe])
+
+    def record_focus(self, window: Optional[WindowInfo], timestamp: float):
+        """Record a foreground change. Nothing tracked having focus is recorded as hwnd 0."""
+        if window is None:
+            self._write(_WINDOW_TAGS[FOCUS_CHANGED], timestamp, [0, 0], ["", "", ""])
+        else:
+            self._write(_WINDOW_TAGS[FOCUS_CHANGED], timestamp, [window.hwnd, window.process_id],
+                        [window.name, window.title, window.exe])
+
+    def record_process(self, kind: str, pid: int, name: str, timestamp: float):
+        """Record a process start or exit."""
+        self._write(_PROCESS_TAGS[kind], timestamp, [pid], [name])
+
+    def record_points(self, points: int, timestamp: float):
+        """Record the live balance, so replays can be checked against it."""
+        self._write(_POINTS_TAG, timestamp, [points], [])
+
+    def record_idle(self, kind: str, at: float, timestamp: float):
+        """Record the user going idle or returning at Unix time at, as noticed at timestamp."""
+        self._write(_IDLE_TAGS[kind], timestamp, [max(0, int((timestamp - at) * 1000))], [])
+
+    def flush(self):
+        """Push buffered records to the OS."""
+        with self._lock:
+            if self._file:
+                self._file.flush()
+
+    def close(self):
+        """Flush and close the trace."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def read_trace(path: str) -> Iterator[TraceEvent]:
+    """Yield the events of a trace. A record cut short by a crash ends the trace."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, start_ms = _HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC or not 1 <= version <= TRACE_VERSION:
+        raise ValueError(f"Not a version {TRACE_VERSION} activity trace: {path}")
+    signed = version >= 2
+
+    strings: List[str] = []
+    pos = _HEADER.size
+    now_ms = start_ms
+    end = len(data)
+
+    def uvarint() -> int:
+        nonlocal pos
+        result = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    while pos < end:
+        try:
+            tag = data[pos]
+            pos += 1
+            if tag == _STRING:
+                length = uvarint()
+                if pos + length > end:
+                    return
+                strings.append(data[pos:pos + length].decode('utf-8'))
+                pos += length
+                continue
+            now_ms += _unzigzag(uvarint()) if signed else uvarint()
+            kind = _KINDS[tag]
+            timestamp = now_ms / 1000
+            if tag == _POINTS_TAG or kind in _IDLE_TAGS:
+                yield TraceEvent(timestamp, kind, value=uvarint())
+            elif kind in _PROCESS_TAGS:
+                pid = uvarint()
+                yield TraceEvent(timestamp, kind, pid=pid, name=strings[uvarint()])
+            else:
+                hwnd, pid = uvarint(), uvarint()
+                name, title, exe = strings[uvarint()], strings[uvarint()], strings[uvarint()]
+                yield TraceEvent(timestamp, kind, hwnd, pid, name, title, exe)
+        except IndexError:
+            return
+        except KeyError:
+            raise ValueError(f"Corrupt trace record at byte {pos} in {path}")
+
+
+def trace_start(path: str) -> float:
+    """Get the Unix time a trace started at."""
+    with open(path, 'rb') as f:
+        _, _, start_ms = _HEADER.unpack(f.read(_HEADER.size))
+    return start_ms / 1000
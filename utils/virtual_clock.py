@@ -0,0 +1,32 @@
+from datetime import datetime
+
+
+class VirtualClock:
+    """Clock that only moves when told to, for replaying recorded activity.
+
+    Its bound methods stand in for the clock callables the tracker accepts:
+    now() for datetime.now, time() for time.time and monotonic() for
+    time.monotonic. All three read the same virtual instant.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._start = start
+
+    def set(self, timestamp: float):
+        """Move to a Unix timestamp. The clock never moves backwards."""
+        if timestamp > self._now:
+            self._now = timestamp
+
+    def advance(self, seconds: float):
+        """Move forward by some seconds."""
+        self._now += max(0.0, seconds)
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now - self._start
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._now)
@@ -0,0 +1,75 @@
+from typing import Dict, List, NamedTuple, Optional
+
+# Delta kinds
+OPENED = "opened"
+CLOSED = "closed"
+RETITLED = "retitled"
+FOCUS_CHANGED = "focus_changed"
+
+
+class WindowInfo(NamedTuple):
+    """A single top-level window as seen by one enumeration pass."""
+    hwnd: int
+    title: str
+    process_id: int
+    exe: str
+    name: str
+
+
+class WindowDelta(NamedTuple):
+    """A change between two consecutive window snapshots."""
+    kind: str
+    window: WindowInfo
+    previous: Optional[WindowInfo] = None
+
+
+class FocusChange(NamedTuple):
+    """The foreground window changed. window is None when nothing tracked has focus."""
+    window: Optional[WindowInfo]
+    at: float  # time.monotonic() when the change was seen
+
+
+class WindowSnapshotDiffer:
+    """Turns successive hwnd-keyed snapshots into typed deltas.
+
+    Windows are tracked by hwnd, so several windows belonging to the same
+    process no longer overwrite each other. Consumers only see what changed
+    between two polls.
+    """
+
+    def __init__(self):
+        self.windows: Dict[int, WindowInfo] = {}
+        self.foreground: Optional[int] = None
+
+    def diff(self, snapshot: Dict[int, WindowInfo], foreground: Optional[int] = None) -> List[WindowDelta]:
+        """Compare a new snapshot against the last one and return the deltas."""
+        deltas = []
+        previous_windows = self.windows
+
+        for hwnd, old in previous_windows.items():
+            new = snapshot.get(hwnd)
+            if new is None or new.process_id != old.process_id:
+                deltas.append(WindowDelta(CLOSED, old))
+
+        for hwnd, new in snapshot.items():
+            old = previous_windows.get(hwnd)
+            if old is None or old.process_id != new.process_id:
+                deltas.append(WindowDelta(OPENED, new))
+            elif old.title != new.title:
+                deltas.append(WindowDelta(RETITLED, new, old))
+
+        if foreground != self.foreground and foreground in snapshot:
+            deltas.append(WindowDelta(
+                FOCUS_CHANGED,
+                snapshot[foreground],
+                snapshot.get(self.foreground) or previous_windows.get(self.foreground)
+            ))
+
+        self.windows = snapshot
+        self.foreground = foreground
+        return deltas
+
+    def reset(self):
+        """Forget the last snapshot so the next diff reports every window as opened."""
+        self.windows = {}
+        self.foreground = None
@@ -1,29 +1,64 @@
 import time
 import threading
 import psutil
-import pygetwindow as gw
 from typing import Tuple, Callable, List, Dict, Optional
 import os
 from queue import Queue
-import win32gui
-import win32process
-import win32api
-import win32con
+try:
+    import win32gui
+    import win32process
+    import win32api
+    import win32con
+except ImportError:  # Not on Windows; benchmarks and replays inject fake modules
+    win32gui = win32process = win32api = win32con = None
 import sys
 from datetime import datetime, timedelta
 
+from utils.process_cache import ProcessInfoCache, ProcessAccessDenied
+from utils.window_snapshot import WindowInfo, WindowDelta, WindowSnapshotDiffer, FocusChange, CLOSED
+from utils.metrics import metrics
+from utils.adaptive_scheduler import scheduler
+
+
+def _process_create_time(pid: int) -> Optional[float]:
+    """Get the create time of a process, or None if it cannot be read."""
+    try:
+        return psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _process_executable(pid: int) -> str:
+    """Get the executable path of a process."""
+    try:
+        return psutil.Process(pid).exe()
+    except psutil.AccessDenied:
+        raise ProcessAccessDenied(pid)
+
+
 class WindowMonitor:
-    def __init__(self, callback: Callable[[str, str, str], None]):
+    def __init__(self, callback: Callable[[WindowDelta], None],
+                 on_focus: Optional[Callable[[FocusChange], None]] = None):
         self.callback = callback
+        self.on_focus = on_focus
         self.running = False
         self.monitor_thread = None
-        self.check_interval = 2  # seconds
+        self.focus_thread = None
+        self.poll_loop = scheduler.loop("window_monitor", min_interval=1.0, max_interval=8.0)
+        # One foreground query per tick, so this can afford to run often
+        self.focus_loop = scheduler.loop("window_monitor.focus", min_interval=0.5, max_interval=2.0)
+        self._focus_hwnd = None
         self.window_queue = Queue()
-        self.process_cache = {}
         self.cache_timeout = timedelta(seconds=30)
+        self.process_cache = ProcessInfoCache(
+            _process_executable,
+            _process_create_time,
+            ttl=self.cache_timeout.total_seconds()
+        )
         self.our_process_name = os.path.basename(sys.executable)
-        self.last_windows = {}
+        self.differ = WindowSnapshotDiffer()
         self._lock = threading.Lock()
+        metrics.register_collector("window_monitor.process_cache", self.process_cache.stats)
 
     def start_monitoring(self):
         """Start the window monitoring thread."""
@@ -31,66 +66,131 @@ class WindowMonitor:
             self.running = True
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
+            if self.on_focus:
+                self._focus_hwnd = None
+                self.focus_thread = threading.Thread(target=self._focus_loop, daemon=True)
+                self.focus_thread.start()
             print("Window monitoring started")
 
     def stop_monitoring(self):
         """Stop the window monitoring thread."""
         self.running = False
+        self.poll_loop.wake()
+        self.focus_loop.wake()
         if self.monitor_thread:
             self.monitor_thread.join()
+        if self.focus_thread:
+            self.focus_thread.join()
             print("Window monitoring stopped")
 
     def _monitor_loop(self):
         """Main monitoring loop."""
         while self.running:
             try:
-                # Get current windows
-                current_windows = self.get_all_windows_info()
-                
-                # Check for changes
-                for process_name, (window_title, hwnd, process_id) in current_windows.items():
-                    if process_name not in self.last_windows or self.last_windows[process_name][0] != window_title:
-                        # Window changed or new window
-                        self.window_queue.put((window_title, process_name, hwnd))
-                        if self.callback:
-                            self.callback(window_title, process_name, hwnd)
-                
-                # Update last known windows
-                self.last_windows = current_windows
-                
-                # Sleep for the check interval
-                time.sleep(self.check_interval)
-                
+                self.poll_loop.run(self.poll)
             except Exception as e:
                 print(f"Error in monitor loop: {e}")
-                time.sleep(self.check_interval)
+            
+            # Back off while the desktop is idle
+            self.poll_loop.wait()
 
-    def get_all_windows_info(self):
-        """Get information about all visible windows that appear in the taskbar."""
-        windows_info = {}
+    def poll(self) -> bool:
+        """Diff the windows against the last poll and hand the changes to consumers. Returns True if anything changed."""
+        with metrics.timer("window_monitor.poll", budget=self.poll_loop.min_interval):
+            snapshot = self.get_window_snapshot()
+            deltas = self.differ.diff(snapshot, win32gui.GetForegroundWindow())
+        metrics.inc("window_monitor.enumerations")
+        metrics.inc("window_monitor.deltas", len(deltas))
+        
+        for delta in deltas:
+            self.window_queue.put(delta)
+            if self.callback:
+                self.callback(delta)
+        
+        # A new or newly focused window may belong to an app that was just launched
+        if any(delta.kind != CLOSED for delta in deltas):
+            scheduler.wake("app_controller")
+        return bool(deltas)
+
+    def _focus_loop(self):
+        """Foreground tracking loop."""
+        while self.running:
+            try:
+                self.focus_loop.run(self.poll_focus)
+            except Exception as e:
+                print(f"Error in focus loop: {e}")
+            self.focus_loop.wait()
+
+    def poll_focus(self) -> bool:
+        """Check which window has focus and report a change. Returns True if focus moved.
+
+        Costs one GetForegroundWindow call while focus stays put, and a
+        single window lookup when it moves, however many windows are open.
+        """
+        hwnd = win32gui.GetForegroundWindow()
+        if hwnd == self._focus_hwnd:
+            return False
+        at = time.monotonic()
+        self._focus_hwnd = hwnd
+        window = self.get_window_info(hwnd) if hwnd else None
+        if self.on_focus:
+            self.on_focus(FocusChange(window, at))
+        scheduler.wake("app_controller")
+        return True
+
+    def get_window_info(self, hwnd: int, resolved: Optional[dict] = None) -> Optional[WindowInfo]:
+        """Describe one visible taskbar window, or get None for windows that are not tracked."""
+        if not win32gui.IsWindowVisible(hwnd):
+            return None
+        # Check if window has a taskbar button
+        style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+        if style & win32con.WS_EX_TOOLWINDOW:  # Exclude tool windows
+            return None
+        window_title = win32gui.GetWindowText(hwnd)
+        if not window_title:  # Only include windows with titles
+            return None
+        try:
+            _, process_id = win32process.GetWindowThreadProcessId(hwnd)
+            if resolved is None:
+                resolved = {}
+            if process_id not in resolved:
+                resolved[process_id] = self.process_cache.lookup(process_id)
+            proc_info = resolved[process_id]
+            if proc_info is None:
+                return None
+            executable_path, exe_name = proc_info
+            
+            # Skip our own process
+            if exe_name.lower() == self.our_process_name.lower():
+                return None
+            return WindowInfo(hwnd, window_title, process_id, executable_path, exe_name)
+        except Exception as e:
+            print(f"Error getting process info: {e}")
+            return None
+
+    def get_window_snapshot(self) -> Dict[int, WindowInfo]:
+        """Get all visible taskbar windows keyed by hwnd."""
+        snapshot = {}
+        resolved = {}  # pid -> (exe, name), so each process is looked up once per pass
         def callback(hwnd, _):
-            if win32gui.IsWindowVisible(hwnd):
-                # Check if window has a taskbar button
-                style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
-                if not (style & win32con.WS_EX_TOOLWINDOW):  # Exclude tool windows
-                    window_title = win32gui.GetWindowText(hwnd)
-                    if window_title:  # Only include windows with titles
-                        try:
-                            _, process_id = win32process.GetWindowThreadProcessId(hwnd)
-                            process_handle = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION | win32con.PROCESS_VM_READ, False, process_id)
-                            process_name = win32process.GetModuleFileNameEx(process_handle, 0)
-                            
-                            # Skip our own process
-                            if os.path.basename(process_name).lower() != self.our_process_name.lower():
-                                windows_info[process_name] = (window_title, hwnd, process_id)
-                        except Exception as e:
-                            print(f"Error getting process info: {e}")
+            window = self.get_window_info(hwnd, resolved)
+            if window is not None:
+                snapshot[hwnd] = window
+            return True
         win32gui.EnumWindows(callback, None)
-        return windows_info
+        return snapshot
+
+    def get_all_windows_info(self):
+        """Get information about all visible windows that appear in the taskbar."""
+        return {
+            info.exe: (info.title, info.hwnd, info.process_id)
+            for info in self.get_window_snapshot().values()
+        }
 
     def get_active_window_info(self) -> Tuple[str, str, str]:
         """Get information about the currently active window."""
         try:
+            import pygetwindow as gw  # Only this fallback path needs it
             active_window = gw.getActiveWindow()
             if not active_window or not active_window.title:
                 return ("", "", "")
@@ -101,15 +201,16 @@ class WindowMonitor:
 
             # Try to get process info from cache
             try:
-                if active_window._hWnd in self.process_cache:
-                    proc_info = self.process_cache[active_window._hWnd]
-                    process_name = proc_info['name'].lower()
-                    executable_path = proc_info['exe']
+                _, process_id = win32process.GetWindowThreadProcessId(active_window._hWnd)
+                proc_info = self.process_cache.lookup(process_id)
+                if proc_info:
+                    executable_path, process_name = proc_info
+                    process_name = process_name.lower()
             except Exception:
                 pass
 
             # Skip our own process
-            if process_name == self.our_process_name:
+            if process_name == self.our_process_name.lower():
                 return ("", "", "")
 
             return (window_title, process_name, executable_path)